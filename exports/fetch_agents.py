@@ -6,29 +6,53 @@ Supports Dutch manifest fields (agents-publicatie.json) as provided in agent-ser
 BELANGRIJK - Overschrijfgedrag:
 - Charters: Volledig overschreven met versie uit agent-services
 - Prompts: Bestaande prompts met dezelfde naam overschreven; extra prompts behouden
-- Runner module folders: Volledig verwijderd en vervangen (niet gemerged!)
+- Runner module folders: Volledig vervangen (niet gemerged!); alleen gewijzigde files
+  worden gekopieerd, verouderde files verwijderd
 
 Dit is by design: fetching installeert de canonieke versie uit agent-services.
 Workspace-specifieke aanpassingen worden overschreven.
 
+Git objecten komen via een gedeelde bare mirror (~/.cache/agent-services.git), zodat
+extra workspaces geen netwerk of schijfruimte voor de historie kosten.
+
+Ongewijzigde publicatie (zelfde digest en bron-commit, geïnstalleerde bestanden intact
+volgens temp/fetch-agents-state.json): direct klaar, zonder te installeren (--force: toch).
+
+--install-mode reflink/link: bestanden als copy-on-write clone of hardlink van de checkout
+in <workspace>/agent-services (zelfde filesystem), met terugval op kopiëren.
+
 Usage:
     python fetch_agents.py kennispublicatie
     python fetch_agents.py --list
+    python fetch_agents.py kennispublicatie --mirror /pad/naar/agent-services.git
+    python fetch_agents.py kennispublicatie --force
+    python fetch_agents.py kennispublicatie --jobs 16
+    python fetch_agents.py kennispublicatie --install-mode link
 """
 
 from __future__ import annotations
 
 import argparse
+import errno
+import functools
+import hashlib
 import json
 import os
 import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: geen reflink via ioctl
+    fcntl = None
 
 
 @dataclass
@@ -38,6 +62,7 @@ class AgentSpec:
     value_streams: List[str] = field(default_factory=list)
     files: List[Path] = field(default_factory=list)
     metadata: Dict[str, str] = field(default_factory=dict)
+    published: Dict[str, Dict] = field(default_factory=dict)  # pad -> {"sha256", "grootte"} uit het manifest
 
     def is_applicable_to(self, value_stream: str) -> bool:
         value_stream = value_stream.lower()
@@ -53,16 +78,89 @@ def run_command(cmd: List[str], cwd: Path | None = None) -> str:
     return result.stdout.strip()
 
 
-def fetch_repo(repo_url: str, temp_dir: Path) -> Path:
+def default_mirror_path() -> Path:
+    """Gedeelde bare mirror voor alle workspaces (override: AGENT_SERVICES_MIRROR)."""
+    env = os.environ.get("AGENT_SERVICES_MIRROR")
+    return Path(env).expanduser() if env else Path.home() / ".cache" / "agent-services.git"
+
+
+def update_mirror(repo_url: str, mirror_path: Path) -> Path:
+    """Maak of ververs de gedeelde bare mirror van agent-services.
+
+    De mirror wordt eerst in een tijdelijke folder gecloned en daarna op zijn plek
+    gezet, zodat gelijktijdige fetches in andere workspaces nooit een halve mirror
+    zien. Faalt het verversen van een bestaande mirror (bijv. offline, of een andere
+    workspace fetcht tegelijk), dan wordt met de bestaande mirror verder gewerkt.
+    """
+    if (mirror_path / "objects").is_dir():
+        try:
+            run_command(["git", "--git-dir", str(mirror_path), "remote", "set-url", "origin", repo_url])
+            run_command(["git", "--git-dir", str(mirror_path), "fetch", "--prune", "origin"])
+            print(f"[INFO] Mirror bijgewerkt: {mirror_path}")
+        except RuntimeError as e:
+            print(f"[WARN] Mirror niet bijgewerkt, gebruik bestaande mirror: {e}")
+        return mirror_path
+
+    print(f"[INFO] Creating shared mirror {mirror_path}...")
+    mirror_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = Path(tempfile.mkdtemp(prefix=f"{mirror_path.name}.", dir=mirror_path.parent))
+    try:
+        run_command(["git", "clone", "--mirror", repo_url, str(tmp_path)])
+        try:
+            os.rename(tmp_path, mirror_path)
+        except OSError:
+            if not (mirror_path / "objects").is_dir():
+                raise
+            # Een andere workspace was ons voor; die mirror is even vers
+    finally:
+        if tmp_path.exists():
+            shutil.rmtree(tmp_path, ignore_errors=True)
+    return mirror_path
+
+
+def _origin_url(clone_path: Path) -> str | None:
+    try:
+        return run_command(["git", "remote", "get-url", "origin"], cwd=clone_path)
+    except RuntimeError:
+        return None
+
+
+def fetch_repo(repo_url: str, temp_dir: Path, mirror_path: Path | None = None) -> Path:
     """Clone or pull agent-services repository.
     
     Als de repository al bestaat in temp_dir/agent-services, wordt een git pull gedaan.
     Anders wordt de repository ge-cloned.
     
+    Met mirror_path komt alles via een gedeelde lokale bare mirror: die wordt één
+    keer per fetch bijgewerkt vanaf repo_url, en de checkout in de workspace is een
+    ondiepe (--depth 1) clone van de mirror via file://, met de mirror als
+    --reference en --dissociate. Een extra workspace kost dan alleen een checkout en
+    de objecten van de laatste commit: geen netwerk en geen kopie van de historie.
+    Door --dissociate heeft de checkout geen alternates naar de mirror, dus een
+    fetch --prune of gc in de mirror kan geen objecten onder de checkout weghalen.
+    Lukt de mirror niet, dan valt fetch_repo terug op een directe clone.
+    
     Dit zorgt ervoor dat altijd de laatste versie wordt opgehaald.
     """
     clone_path = temp_dir / "agent-services"
     
+    source = repo_url
+    clone_args = ["--depth", "1"]
+    if mirror_path is not None:
+        try:
+            mirror = update_mirror(repo_url, mirror_path)
+            # file:// zodat --depth geldt (lokale paden clonen altijd volledig)
+            source = mirror.resolve().as_uri()
+            clone_args = ["--depth", "1", "--reference", str(mirror), "--dissociate"]
+        except RuntimeError as e:
+            print(f"[WARN] Shared mirror niet beschikbaar, direct clonen: {e}")
+    
+    if clone_path.exists() and (clone_path / ".git").exists() and _origin_url(clone_path) != source:
+        # Checkout van een andere bron (bijv. van voor de mirror, of een oude --shared
+        # clone met alternates naar de mirror): opnieuw opbouwen
+        print(f"[INFO] Repository wijst niet naar {source}, re-cloning...")
+        shutil.rmtree(clone_path)
+    
     if clone_path.exists() and (clone_path / ".git").exists():
         # Repository bestaat al - doe een pull
         print(f"[INFO] Repository bestaat al, pulling latest changes...")
@@ -73,11 +171,11 @@ def fetch_repo(repo_url: str, temp_dir: Path) -> Path:
             # Als pull faalt, verwijder de folder en clone opnieuw
             print(f"[WARN] Pull failed, re-cloning: {e}")
             shutil.rmtree(clone_path)
-            run_command(["git", "clone", "--depth", "1", repo_url, str(clone_path)])
+            run_command(["git", "clone", *clone_args, source, str(clone_path)])
     else:
         # Repository bestaat nog niet - clone
         print(f"[INFO] Cloning repository...")
-        run_command(["git", "clone", "--depth", "1", repo_url, str(clone_path)])
+        run_command(["git", "clone", *clone_args, source, str(clone_path)])
     
     return clone_path
 
@@ -121,6 +219,11 @@ def load_manifest(repo_path: Path, manifest_name: str) -> Tuple[List[AgentSpec],
                 value_streams=["*"] if agent_type == "utility" else [value_stream.lower()],
                 files=files,
                 metadata={"aantalPrompts": str(aantal_prompts), "aantalRunners": str(aantal_runners)},
+                published={
+                    str(bestand["pad"]): bestand
+                    for bestand in entry.get("bestanden", [])
+                    if isinstance(bestand, dict) and bestand.get("pad") and bestand.get("sha256")
+                },
             )
         )
 
@@ -128,6 +231,7 @@ def load_manifest(repo_path: Path, manifest_name: str) -> Tuple[List[AgentSpec],
         "version": str(data.get("versie", "unspecified")),
         "published_at": str(data.get("publicatiedatum", "unspecified")),
         "agent_count": str(len(specs)),
+        "digest": str(data.get("digest", "")),
     }
     return specs, meta, locaties
 
@@ -193,9 +297,302 @@ def resolve_files(repo_path: Path, specs: List[AgentSpec]) -> Tuple[List[Path],
     return vs_files, util_files, runner_modules, missing
 
 
-def _copy_file(src: Path, dest: Path) -> str:
+STATE_VERSION = 1
+
+
+def state_path(workspace: Path) -> Path:
+    return workspace / "temp" / "fetch-agents-state.json"
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _file_record(path: Path) -> Dict:
+    stat = path.stat()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": file_sha256(path)}
+
+
+def load_state(workspace: Path) -> Dict:
+    """Staat van de laatst toegepaste fetch ({} als er geen (geldige) staat is)."""
+    try:
+        state = json.loads(state_path(workspace).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) and state.get("version") == STATE_VERSION else {}
+
+
+def save_state(workspace: Path, state: Dict) -> None:
+    """Schrijf de fetch staat atomisch weg; fouten zijn niet fataal (volgende fetch doet dan alles)."""
+    path = state_path(workspace)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(state, indent=2, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"[WARN] Fetch state niet opgeslagen: {e}")
+
+
+def build_state(workspace: Path, fetch_key: Dict[str, str], installed: Dict[Path, str | None]) -> Dict:
+    """Staat na een geslaagde fetch: fetch_key plus grootte, mtime en SHA-256 per geïnstalleerd bestand.
+
+    installed: bestand -> bekende SHA-256 (ongewijzigd volgens het manifest), of None (hashen).
+    """
+    files = {}
+    for path, sha256 in installed.items():
+        try:
+            if sha256 is None:
+                record = _file_record(path)
+            else:
+                stat = path.stat()
+                record = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": sha256}
+        except OSError:
+            continue
+        files[path.relative_to(workspace).as_posix()] = record
+    return {"version": STATE_VERSION, **fetch_key, "files": files}
+
+
+def installed_files_match(workspace: Path, files: Dict[str, Dict]) -> bool:
+    """True als elk eerder geïnstalleerd bestand nog bestaat met dezelfde inhoud.
+
+    Grootte en mtime gelijk: ongewijzigd (zoals de git index); anders beslist de hash.
+    """
+    for rel, record in files.items():
+        path = workspace / rel
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        if stat.st_size != record.get("size"):
+            return False
+        if stat.st_mtime_ns != record.get("mtime_ns") and file_sha256(path) != record.get("sha256"):
+            return False
+    return True
+
+
+def is_current(dest: Path, published: Dict | None, recorded: Dict | None) -> bool:
+    """True als dest al de gepubliceerde inhoud heeft, zonder src te lezen.
+
+    Klopt de vorige fetch state voor dest (grootte, mtime) en is de gepubliceerde hash
+    dezelfde als de toen geïnstalleerde, dan wordt er niets gelezen; anders alleen dest.
+    """
+    if not published:
+        return False
+    try:
+        stat = dest.stat()
+    except OSError:
+        return False
+    if stat.st_size != published.get("grootte"):
+        return False
+    if (
+        recorded
+        and recorded.get("sha256") == published["sha256"]
+        and recorded.get("size") == stat.st_size
+        and recorded.get("mtime_ns") == stat.st_mtime_ns
+    ):
+        return True
+    return file_sha256(dest) == published["sha256"]
+
+
+# Install modes: hoe een bestand uit de checkout in de workspace komt. Reflink (copy-on-write
+# clone) deelt de data tot een van beide wijzigt; een hardlink deelt het bestand zelf, dus
+# een in-place wijziging in de workspace raakt ook de checkout. Zonder ondersteuning
+# (ander filesystem, Windows) valt elke mode terug op kopiëren.
+INSTALL_MODES = {
+    "copy": ("copy",),
+    "reflink": ("reflink", "copy"),
+    "link": ("reflink", "hardlink", "copy"),
+}
+FICLONE = 0x40049409  # Linux ioctl (btrfs, XFS, ...)
+
+
+def _reflink(src: Path, dest: Path) -> None:
+    """Copy-on-write clone van src als dest; OSError als het filesystem dat niet kan."""
+    if fcntl is None or not sys.platform.startswith("linux"):
+        raise OSError(errno.EOPNOTSUPP, "reflink wordt niet ondersteund")
+    with src.open("rb") as src_f, dest.open("wb") as dest_f:
+        fcntl.ioctl(dest_f.fileno(), FICLONE, src_f.fileno())
+    shutil.copystat(src, dest)
+
+
+def install_file(src: Path, dest: Path, mode: str = "copy") -> str:
+    """Installeer src als dest volgens mode; geeft de gebruikte methode terug.
+
+    Het bestand wordt naast dest opgebouwd en met os.replace op zijn plek gezet, zodat
+    dest nooit half geschreven is en een bestaande hardlink naar de checkout niet
+    overschreven wordt.
+    """
+    tmp = dest.with_name(f".{dest.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+    try:
+        for method in INSTALL_MODES[mode]:
+            try:
+                if method == "reflink":
+                    _reflink(src, tmp)
+                elif method == "hardlink":
+                    os.link(src, tmp)
+                else:
+                    shutil.copy2(src, tmp)
+                break
+            except OSError:
+                tmp.unlink(missing_ok=True)
+                if method == "copy":
+                    raise
+        os.replace(tmp, dest)
+        return method
+    finally:
+        # Na os.replace bestaat tmp niet meer, behalve als tmp en dest al hetzelfde bestand waren
+        tmp.unlink(missing_ok=True)
+
+
+# Directory sync (zelfde logica als scripts/runners/tree_sync.py, plus install modes;
+# dit script is standalone)
+SYNC_IGNORE = {"__pycache__"}
+
+
+@dataclass
+class SyncResult:
+    """Aantallen bestanden van één sync."""
+
+    copied: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+    methods: Dict[str, int] = field(default_factory=dict)  # install methode -> gekopieerde bestanden
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.copied or self.deleted)
+
+
+def list_tree(root: Path) -> Dict[str, os.stat_result]:
+    """Alle bestanden onder root (relatief pad -> stat), zonder SYNC_IGNORE mappen."""
+    files: Dict[str, os.stat_result] = {}
+    if not root.is_dir():
+        return files
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [name for name in dirnames if name not in SYNC_IGNORE]
+        for name in filenames:
+            path = Path(dirpath) / name
+            files[path.relative_to(root).as_posix()] = path.stat()
+    return files
+
+
+def same_file(src: Path, dest: Path, src_stat: os.stat_result, dest_stat: os.stat_result) -> bool:
+    """Zelfde inhoud: grootte en mtime gelijk, of bij gelijke grootte dezelfde hash."""
+    if src_stat.st_size != dest_stat.st_size:
+        return False
+    if src_stat.st_mtime_ns == dest_stat.st_mtime_ns:
+        return True
+    return file_sha256(src) == file_sha256(dest)
+
+
+def _swap_dir(staging: Path, dest: Path) -> None:
+    """Zet staging op de plek van dest met twee renames (dest -> .old, staging -> dest).
+
+    Niet atomisch: tussen de twee renames bestaat dest heel even niet. Mislukt de
+    tweede rename, dan wordt het oude dest teruggezet. Het oude dest wordt pas na
+    de swap verwijderd.
+    """
+    if not dest.exists():
+        os.rename(staging, dest)
+        return
+    old = dest.parent / f".{dest.name}.old-{os.getpid()}"
+    if old.exists():
+        shutil.rmtree(old)
+    os.rename(dest, old)
+    try:
+        os.rename(staging, dest)
+    except OSError:
+        os.rename(old, dest)
+        raise
+    if old.is_dir():
+        shutil.rmtree(old, ignore_errors=True)
+    else:
+        old.unlink()
+
+
+def sync_tree(src: Path, dest: Path, mode: str = "copy") -> SyncResult:
+    """Maak dest gelijk aan src; alleen gewijzigde bestanden worden gekopieerd.
+
+    Args:
+        src: Bronmap.
+        dest: Doelmap (wordt aangemaakt als hij niet bestaat).
+        mode: Install mode voor gewijzigde bestanden (zie INSTALL_MODES).
+
+    Returns:
+        SyncResult met gekopieerde, ongewijzigde en verwijderde bestanden.
+
+    Raises:
+        OSError: Als kopiëren of de swap mislukt; dest is dan het oude dest.
+    """
+    src_files = list_tree(src)
+    dest_files = list_tree(dest)
+    result = SyncResult()
+    changed = set()
+    for rel, src_stat in src_files.items():
+        dest_stat = dest_files.get(rel)
+        if dest_stat is not None and same_file(src / rel, dest / rel, src_stat, dest_stat):
+            result.unchanged += 1
+        else:
+            changed.add(rel)
+    result.copied = len(changed)
+    result.deleted = len(dest_files.keys() - src_files.keys())
+    if not result.changed and dest.is_dir():
+        return result
+
+    staging = dest.parent / f".{dest.name}.sync-{os.getpid()}"
+    if staging.exists():
+        shutil.rmtree(staging)
+    try:
+        for dirpath, dirnames, _ in os.walk(src):
+            dirnames[:] = [name for name in dirnames if name not in SYNC_IGNORE]
+            (staging / Path(dirpath).relative_to(src)).mkdir(parents=True, exist_ok=True)
+        for rel in src_files:
+            if rel in changed:
+                method = install_file(src / rel, staging / rel, mode)
+                result.methods[method] = result.methods.get(method, 0) + 1
+                continue
+            try:
+                os.link(dest / rel, staging / rel)
+            except OSError:
+                shutil.copy2(dest / rel, staging / rel)
+        _swap_dir(staging, dest)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    return result
+
+
+DEFAULT_INSTALL_WORKERS = 8  # Installeren is I/O gebonden: parallel verbergt de latency per bestand
+
+
+@dataclass
+class InstallResult:
+    """Uitkomst van één install taak (bestand of runner module); output wordt na afloop geprint."""
+    status: str
+    lines: List[str] = field(default_factory=list)
+    installed: Dict[Path, str | None] = field(default_factory=dict)
+    methods: Dict[str, int] = field(default_factory=dict)  # install methode -> bestanden
+
+
+def _copy_file(
+    src: Path,
+    dest: Path,
+    published: Dict | None = None,
+    recorded: Dict | None = None,
+    mode: str = "copy",
+) -> InstallResult:
     try:
-        if dest.exists():
+        if published is not None:
+            # Delta install: beslissing op metadata uit het manifest, ongewijzigd wordt niet gekopieerd
+            if is_current(dest, published, recorded):
+                return InstallResult("unchanged", [f"  [{'UNCHANGED':9}] {src.name}"], {dest: published["sha256"]})
+            status = "updated" if dest.exists() else "new"
+        elif dest.exists():
             if dest.is_file() and src.read_bytes() == dest.read_bytes():
                 status = "unchanged"
             else:
@@ -203,20 +600,96 @@ def _copy_file(src: Path, dest: Path) -> str:
         else:
             status = "new"
         dest.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(src, dest)
-        print(f"  [{status.upper():9}] {src.name} -> {dest.relative_to(dest.parent.parent.parent)}")
-        return status
+        method = install_file(src, dest, mode)
+        line = f"  [{status.upper():9}] {src.name} -> {dest.relative_to(dest.parent.parent.parent)}"
+        return InstallResult(status, [line], {dest: None}, {method: 1})
     except Exception as e:
-        print(f"  [ERROR] Failed to copy {src}: {e}")
-        return "error"
+        return InstallResult("error", [f"  [ERROR] Failed to copy {src}: {e}"])
+
+
+def _install_module(
+    module_src: Path,
+    module_dst: Path,
+    workspace: Path,
+    module_published: Dict[Path, Dict],
+    recorded: Dict[str, Dict],
+    mode: str = "copy",
+) -> InstallResult:
+    """Synchroniseer een runner module volledig, tenzij alle bestanden al de gepubliceerde inhoud hebben."""
+    module_name = module_src.name
+    if module_published:
+        existing = {p for p in module_dst.rglob("*") if p.is_file() and "__pycache__" not in p.parts}
+        if existing == set(module_published) and all(
+            is_current(dest, record, recorded.get(dest.relative_to(workspace).as_posix()))
+            for dest, record in module_published.items()
+        ):
+            return InstallResult(
+                "modules_unchanged",
+                [f"  [{'UNCHANGED':9}] {module_name}/"],
+                {dest: record["sha256"] for dest, record in module_published.items()},
+            )
 
+    lines: List[str] = []
+    try:
+        # BELANGRIJK: Module wordt VOLLEDIG gelijk aan agent-services (niet mergen!)
+        # Als workspace-folder 2 files heeft en agent-services 1 file,
+        # blijft na fetch alleen het 1 file uit agent-services over.
+        # Alleen gewijzigde files worden gekopieerd; de nieuwe module wordt in een
+        # staging folder opgebouwd en met twee renames gewisseld met de oude (geen mix
+        # van oude en nieuwe files, maar de folder ontbreekt daartussen heel even).
+        result = sync_tree(module_src, module_dst, mode)
+        if not result.changed:
+            lines.append(f"  [{'UNCHANGED':9}] {module_name}/")
+        else:
+            lines.append(
+                f"  [MODULE] {module_name}/ -> {module_dst.relative_to(workspace)} "
+                f"({result.copied} copied, {result.unchanged} unchanged, {result.deleted} removed)"
+            )
 
-def organize(vs_files: List[Path], util_files: List[Path], runner_modules: List[Path], workspace: Path, repo_path: Path) -> Dict[str, int]:
-    """Organize files into workspace. Runner modules are replaced entirely."""
+        # Validate __init__.py exists
+        init_file = module_dst / "__init__.py"
+        if not init_file.exists():
+            lines.append(f"  [WARNING] Runner module {module_name}/ has no __init__.py")
+        installed = {module_dst / rel: None for rel in list_tree(module_dst)}
+        status = "modules_replaced" if result.changed else "modules_unchanged"
+        return InstallResult(status, lines, installed, result.methods)
+    except Exception as e:
+        lines.append(f"  [ERROR] Failed to replace module {module_name}: {e}")
+        return InstallResult("error", lines)
+
+
+def organize(
+    vs_files: List[Path],
+    util_files: List[Path],
+    runner_modules: List[Path],
+    workspace: Path,
+    repo_path: Path,
+    installed: Dict[Path, str | None] | None = None,
+    published: Dict[str, Dict] | None = None,
+    recorded: Dict[str, Dict] | None = None,
+    workers: int = DEFAULT_INSTALL_WORKERS,
+    mode: str = "copy",
+) -> Dict[str, int]:
+    """Organize files into workspace. Runner modules are replaced entirely.
+
+    published (pad -> sha256/grootte uit het manifest) en recorded (vorige fetch state)
+    maken een delta install mogelijk: bestanden en modules die al de gepubliceerde
+    inhoud hebben, worden niet gelezen of gekopieerd. Geïnstalleerde bestanden worden
+    aan installed toegevoegd (voor de fetch state), met hun hash als die bekend is.
+
+    Bestanden en modules worden door maximaal workers threads tegelijk geïnstalleerd;
+    de output wordt na afloop in vaste volgorde geprint (modules, dan bestanden).
+    mode bepaalt of bestanden gekopieerd, gereflinkt of gehardlinkt worden (INSTALL_MODES);
+    stats telt per methode onder via_<methode>.
+    """
+    installed = installed if installed is not None else {}
+    published = published or {}
+    recorded = recorded or {}
     prompts_dir = workspace / ".github" / "prompts"
     charters_dir = workspace / "charters-agents"
     scripts_dir = workspace / "scripts"
-    stats = {"new": 0, "updated": 0, "unchanged": 0, "error": 0, "modules_replaced": 0}
+    stats = {"new": 0, "updated": 0, "unchanged": 0, "error": 0, "modules_replaced": 0, "modules_unchanged": 0}
+    stats.update({f"via_{method}": 0 for method in ("reflink", "hardlink", "copy")})
 
     all_files = vs_files + util_files
     print(f"\n[INFO] Organizing {len(all_files)} files + {len(runner_modules)} runner modules...")
@@ -224,34 +697,22 @@ def organize(vs_files: List[Path], util_files: List[Path], runner_modules: List[
     print(f"       Utility files: {len(util_files)}")
     print(f"       Runner modules: {len(runner_modules)}")
 
-    # Handle runner modules first - FULL REPLACEMENT
+    tasks: List[Callable[[], InstallResult]] = []
+
+    # Runner modules - FULL REPLACEMENT
     for module_src in runner_modules:
-        module_name = module_src.name
-        module_dst = scripts_dir / module_name
-        
-        try:
-            # BELANGRIJK: Verwijder bestaande module VOLLEDIG (niet mergen!)
-            # Als workspace-folder 2 files heeft en agent-services 1 file,
-            # blijven na fetch alleen het 1 file uit agent-services over.
-            if module_dst.exists():
-                print(f"  [REPLACE] Removing existing {module_name}/ before copy")
-                shutil.rmtree(module_dst)
-            
-            # Copy entire module
-            shutil.copytree(module_src, module_dst)
-            print(f"  [MODULE] {module_name}/ -> {module_dst.relative_to(workspace)}")
-            stats["modules_replaced"] += 1
-            
-            # Validate __init__.py exists
-            init_file = module_dst / "__init__.py"
-            if not init_file.exists():
-                print(f"  [WARNING] Runner module {module_name}/ has no __init__.py")
-                
-        except Exception as e:
-            print(f"  [ERROR] Failed to replace module {module_name}: {e}")
-            stats["error"] += 1
-
-    # Handle individual files
+        module_dst = scripts_dir / module_src.name
+        module_rel = module_src.relative_to(repo_path).as_posix() + "/"
+        module_published = {
+            module_dst / pad[len(module_rel):]: record
+            for pad, record in published.items() if pad.startswith(module_rel)
+        }
+        tasks.append(
+            functools.partial(_install_module, module_src, module_dst, workspace, module_published, recorded, mode)
+        )
+
+    # Individual files; één taak per doel (bij dubbele doelen wint de laatste bron, zoals sequentieel)
+    dest_tasks: Dict[Path, int] = {}
     for src in all_files:
         dest = None
         if src.suffix == ".md":
@@ -269,11 +730,33 @@ def organize(vs_files: List[Path], util_files: List[Path], runner_modules: List[
             dest = scripts_dir / src.name
 
         if dest:
-            status = _copy_file(src, dest)
-            if status in stats:
-                stats[status] += 1
+            task = functools.partial(
+                _copy_file,
+                src,
+                dest,
+                published.get(src.relative_to(repo_path).as_posix()),
+                recorded.get(dest.relative_to(workspace).as_posix()),
+                mode,
+            )
+            if dest in dest_tasks:
+                tasks[dest_tasks[dest]] = task
+            else:
+                dest_tasks[dest] = len(tasks)
+                tasks.append(task)
         else:
-            print(f"  [SKIP] {src}")
+            tasks.append(functools.partial(InstallResult, "skipped", [f"  [SKIP] {src}"]))
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        results = list(pool.map(lambda task: task(), tasks))
+
+    for result in results:
+        for line in result.lines:
+            print(line)
+        if result.status in stats:
+            stats[result.status] += 1
+        installed.update(result.installed)
+        for method, count in result.methods.items():
+            stats[f"via_{method}"] += count
     return stats
 
 
@@ -314,6 +797,10 @@ def write_fetch_log(workspace: Path, value_stream: str, meta: Dict[str, str], ap
     log_lines.append(f"| Bijgewerkt | {stats.get('updated', 0)} |\n")
     log_lines.append(f"| Ongewijzigd | {stats.get('unchanged', 0)} |\n")
     log_lines.append(f"| Runner modules vervangen | {stats.get('modules_replaced', 0)} |\n")
+    log_lines.append(f"| Runner modules ongewijzigd | {stats.get('modules_unchanged', 0)} |\n")
+    for method in ("reflink", "hardlink"):
+        if stats.get(f"via_{method}", 0) > 0:
+            log_lines.append(f"| Via {method} | {stats[f'via_{method}']} |\n")
     if stats.get('error', 0) > 0:
         log_lines.append(f"| Fouten | {stats.get('error', 0)} |\n")
     
@@ -363,6 +850,32 @@ def main() -> int:
     parser.add_argument("--source-repo", default="https://github.com/hans-blok/agent-services.git")
     parser.add_argument("--list", action="store_true")
     parser.add_argument("--no-cleanup", action="store_true")
+    parser.add_argument(
+        "--mirror",
+        default=None,
+        help="Gedeelde bare mirror van agent-services (default: $AGENT_SERVICES_MIRROR of ~/.cache/agent-services.git)",
+    )
+    parser.add_argument("--no-mirror", action="store_true", help="Clone direct vanaf --source-repo, zonder gedeelde mirror")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Altijd installeren, ook als digest, bron en geïnstalleerde bestanden ongewijzigd zijn",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_INSTALL_WORKERS,
+        help=f"Aantal bestanden dat tegelijk geïnstalleerd wordt (default: {DEFAULT_INSTALL_WORKERS})",
+    )
+    parser.add_argument(
+        "--install-mode",
+        choices=list(INSTALL_MODES),
+        default="copy",
+        help=(
+            "copy (default), reflink (copy-on-write clone, anders kopie) of link (reflink, anders "
+            "hardlink, anders kopie; hardlinks delen het bestand met <workspace>/agent-services: niet in-place wijzigen)"
+        ),
+    )
     args = parser.parse_args()
 
     value_stream = args.value_stream.strip("'\"") if args.value_stream else None
@@ -373,7 +886,8 @@ def main() -> int:
     agent_services_dir.mkdir(exist_ok=True)
 
     try:
-        repo = fetch_repo(args.source_repo, agent_services_dir.parent)
+        mirror_path = None if args.no_mirror else (Path(args.mirror).expanduser().resolve() if args.mirror else default_mirror_path())
+        repo = fetch_repo(args.source_repo, agent_services_dir.parent, mirror_path)
         specs, meta, _loc = load_manifest(repo, args.manifest)
         streams = derive_streams(specs)
 
@@ -398,6 +912,34 @@ def main() -> int:
             print("[ERROR] No applicable agents")
             return 1
 
+        # Short-circuit: zelfde publicatie (digest) en bron-commit als de vorige fetch, en
+        # alle geïnstalleerde bestanden nog intact -> niets te doen. De digest dekt ook de
+        # hashes per bestand, maar is maar 5 tekens (botsingen mogelijk) en oudere
+        # manifesten hebben geen bestanden-lijst; de commit van de checkout legt de
+        # bron daarom exact vast.
+        try:
+            source_commit = run_command(["git", "rev-parse", "HEAD"], cwd=repo)
+        except RuntimeError:
+            source_commit = ""
+        fetch_key = {
+            "digest": meta["digest"],
+            "value_stream": value_stream.lower(),
+            "manifest": args.manifest,
+            "source_repo": args.source_repo,
+            "source_commit": source_commit,
+        }
+        state = load_state(workspace)
+        if (
+            not args.force
+            and meta["digest"]
+            and source_commit
+            and all(state.get(key) == value for key, value in fetch_key.items())
+            and installed_files_match(workspace, state.get("files", {}))
+        ):
+            print(f"[INFO] Geen wijzigingen sinds vorige fetch (digest {meta['digest']}, {len(state.get('files', {}))} bestanden intact)")
+            print("[SUCCESS] Agents up-to-date")
+            return 0
+
         vs_files, util_files, runner_modules, missing = resolve_files(repo, applicable)
         if missing:
             print("[WARN] Missing files:")
@@ -408,7 +950,22 @@ def main() -> int:
             print("[ERROR] No files resolved")
             return 1
 
-        stats = organize(vs_files, util_files, runner_modules, workspace, repo)
+        published = {pad: record for spec in applicable for pad, record in spec.published.items()}
+        installed: Dict[Path, str | None] = {}
+        stats = organize(
+            vs_files,
+            util_files,
+            runner_modules,
+            workspace,
+            repo,
+            installed,
+            published,
+            state.get("files", {}),
+            workers=args.jobs,
+            mode=args.install_mode,
+        )
+        if stats["error"] == 0:
+            save_state(workspace, build_state(workspace, fetch_key, installed))
         
         # Write detailed log
         log_path = write_fetch_log(workspace, value_stream, meta, applicable, stats, args.source_repo)
@@ -426,7 +983,12 @@ def main() -> int:
             print(f"Agents skipped: {len(skipped)}")
         print(f"Files copied -> new: {stats['new']}, updated: {stats['updated']}, unchanged: {stats['unchanged']}, errors: {stats['error']}")
         if stats.get('modules_replaced', 0) > 0:
-            print(f"Runner modules replaced: {stats['modules_replaced']} (⚠️  old content removed)")
+            print(f"Runner modules replaced: {stats['modules_replaced']} (⚠️  stale files removed)")
+        if stats.get('modules_unchanged', 0) > 0:
+            print(f"Runner modules unchanged: {stats['modules_unchanged']}")
+        if args.install_mode != "copy":
+            methods = ", ".join(f"{m}: {stats[f'via_{m}']}" for m in ("reflink", "hardlink", "copy"))
+            print(f"Install mode {args.install_mode} -> {methods}")
         if self_status != "missing":
             print(f"fetch_agents.py sync: {self_status}")
         print(f"Log: {log_path.relative_to(workspace)}")
@@ -5,7 +5,11 @@ from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
-from pipeline_executor.core import PolicyError, execute_pipeline
+from pipeline_executor.core import ExecutionResult, PolicyError, execute_pipeline
+from pipeline_executor.matrix import MatrixInstance, load_matrix, run_matrix
+from pipeline_executor.resources import DEFAULT_RESOURCE_LIMITS, ResourceLimit, ResourceLimiter, parse_resource_limit
+from pipeline_executor.scheduler import DEFAULT_MAX_WORKERS
+from pipeline_executor.telemetry import Telemetry, telemetry_path
 
 
 @dataclass(frozen=True)
@@ -24,27 +28,32 @@ def _write_execution_log(
     *,
     workspace_root: Path,
     pipeline_naam: str,
-    success: bool,
-    message: str,
-    steps_executed: list[dict],
-    gates_validated: list[dict],
-    failures: list[dict],
-    artifacts: list[Path],
-    total_duration: float,
+    events: list[dict],
 ) -> Path:
+    """Render het markdown execution log uit de telemetry spans van één run."""
     log_dir = workspace_root / "log"
     log_dir.mkdir(parents=True, exist_ok=True)
 
     log_path = log_dir / f"pipeline-executor-{pipeline_naam}-{_timestamp_for_filename()}.md"
 
+    run = next((event["attrs"] for event in events if event["kind"] == "pipeline"), {})
+    steps_executed = sorted(
+        (event["attrs"] for event in events if event["kind"] == "step"),
+        key=lambda step: step.get("number") or 0,
+    )
+    gates_validated = [event["attrs"] for event in events if event["kind"] == "gate"]
+    failures = [event["attrs"] for event in events if event["kind"] == "failure"]
+    resources = [event for event in events if event["kind"] == "resource"]
+    artifacts = run.get("artifacts", [])
+
     lines: list[str] = []
     lines.append(f"# Pipeline Execution Log: {pipeline_naam}\n\n")
-    lines.append(f"**Status**: {'Success' if success else 'Failed'}\n")
-    lines.append(f"**Total Duration**: {total_duration:.2f} seconds\n")
+    lines.append(f"**Status**: {'Success' if run.get('success') else 'Failed'}\n")
+    lines.append(f"**Total Duration**: {run.get('total_duration', 0.0):.2f} seconds\n")
     lines.append(f"**Timestamp**: {datetime.now().isoformat()}\n\n")
 
     lines.append("## Summary\n\n")
-    lines.append(f"{message}\n\n")
+    lines.append(f"{run.get('message', '')}\n\n")
 
     lines.append("## Execution Trace\n\n")
     if steps_executed:
@@ -52,10 +61,18 @@ def _write_execution_log(
             lines.append(f"### Step {step.get('number')}: {step.get('name')}\n")
             lines.append(f"- **Agent**: {step.get('agent')}\n")
             lines.append(f"- **Command**: `{step.get('command')}`\n")
-            lines.append(f"- **Duration**: {step.get('duration', 0):.2f}s\n")
-            lines.append(f"- **Status**: {step.get('status')}\n")
+            lines.append(f"- **Duration**: {step.get('duration') or 0:.2f}s\n")
+            lines.append(f"- **Status**: {step.get('status')}{' (uit step cache)' if step.get('cached') else ''}\n")
+            if step.get('estimated_duration') is not None:
+                lines.append(
+                    f"- **Geschatte duur**: {step['estimated_duration']:.2f}s (timeout {step.get('timeout') or 0:.0f}s)\n"
+                )
             if step.get('exit_code') is not None:
                 lines.append(f"- **Exit Code**: {step.get('exit_code')}\n")
+            if step.get('resource'):
+                lines.append(f"- **Resource**: {step['resource']} (wachttijd {step.get('queue_wait') or 0:.2f}s)\n")
+            if step.get('log'):
+                lines.append(f"- **Output log**: {step['log']}\n")
             lines.append("\n")
     else:
         lines.append("(geen stappen uitgevoerd)\n\n")
@@ -71,6 +88,18 @@ def _write_execution_log(
     else:
         lines.append("(geen gates gevalideerd)\n\n")
 
+    if resources:
+        lines.append("## Resource Queueing\n\n")
+        lines.append("| Resource | Gestart | Gewacht | Rate-limited | Totale wachttijd | Max wachttijd | Max wachtrij |\n")
+        lines.append("|----------|---------|---------|--------------|------------------|---------------|--------------|\n")
+        for event in resources:
+            metrics = event["attrs"]
+            lines.append(
+                f"| {event['name']} | {metrics.get('acquired')} | {metrics.get('queued')} | {metrics.get('throttled')} "
+                f"| {metrics.get('total_wait', 0):.2f}s | {metrics.get('max_wait', 0):.2f}s | {metrics.get('max_queue_depth')} |\n"
+            )
+        lines.append("\n")
+
     if failures:
         lines.append("## Failures\n\n")
         for failure in failures:
@@ -82,11 +111,7 @@ def _write_execution_log(
     lines.append("## Artifacts Produced\n\n")
     if artifacts:
         for artifact in artifacts:
-            try:
-                rel = artifact.relative_to(workspace_root)
-                lines.append(f"- {rel.as_posix()}\n")
-            except ValueError:
-                lines.append(f"- {str(artifact)}\n")
+            lines.append(f"- {artifact}\n")
     else:
         lines.append("- (geen artifacts)\n")
 
@@ -94,6 +119,89 @@ def _write_execution_log(
     return log_path
 
 
+def _write_failure_log(
+    *,
+    workspace_root: Path,
+    telemetry: Telemetry,
+    pipeline_naam: str,
+    message: str,
+    failure: dict,
+) -> Path:
+    """Leg een run die geen ExecutionResult opleverde vast in telemetry en render het log."""
+    telemetry.event("failure", failure["location"], **failure)
+    telemetry.finish(pipeline_naam, success=False, message=message, total_duration=0.0, artifacts=[])
+    return _write_execution_log(workspace_root=workspace_root, pipeline_naam=pipeline_naam, events=telemetry.events)
+
+
+def _write_matrix_log(
+    *,
+    workspace_root: Path,
+    pipeline_naam: str,
+    results: list[tuple[MatrixInstance, ExecutionResult]],
+    total_duration: float,
+) -> Path:
+    log_dir = workspace_root / "log"
+    log_dir.mkdir(parents=True, exist_ok=True)
+
+    log_path = log_dir / f"pipeline-executor-{pipeline_naam}-matrix-{_timestamp_for_filename()}.md"
+    geslaagd = sum(1 for _, result in results if result.success)
+
+    lines: list[str] = []
+    lines.append(f"# Pipeline Matrix Log: {pipeline_naam}\n\n")
+    lines.append(f"**Status**: {'Success' if geslaagd == len(results) else 'Failed'}\n")
+    lines.append(f"**Instanties**: {len(results)} ({geslaagd} geslaagd, {len(results) - geslaagd} gefaald)\n")
+    lines.append(f"**Total Duration**: {total_duration:.2f} seconds\n")
+    lines.append(f"**Timestamp**: {datetime.now().isoformat()}\n\n")
+
+    lines.append("## Summary\n\n")
+    lines.append("| Instantie | Status | Stappen | Failures | Artifacts | Duur |\n")
+    lines.append("|-----------|--------|---------|----------|-----------|------|\n")
+    for instance, result in results:
+        lines.append(
+            f"| {instance.label} | {'Success' if result.success else 'Failed'} | {len(result.steps_executed)} "
+            f"| {len(result.failures)} | {len(result.artifacts)} | {result.total_duration:.2f}s |\n"
+        )
+    lines.append("\n")
+
+    lines.append("## Instanties\n\n")
+    for instance, result in results:
+        lines.append(f"### {instance.label}\n")
+        lines.append(f"- **Parameters**: `{' '.join(instance.extra_params)}`\n")
+        lines.append(f"- **Resultaat**: {result.message}\n")
+        for step in result.steps_executed:
+            lines.append(f"- Stap {step.get('number')}: {step.get('name')} - {step.get('status')} ({step.get('duration', 0):.2f}s)\n")
+        for failure in result.failures:
+            lines.append(f"- **Failure** {failure.get('location')}: {failure.get('error')}\n")
+        for artifact in result.artifacts:
+            try:
+                lines.append(f"- **Artifact**: {artifact.relative_to(workspace_root).as_posix()}\n")
+            except ValueError:
+                lines.append(f"- **Artifact**: {str(artifact)}\n")
+        lines.append("\n")
+
+    log_path.write_text("".join(lines), encoding="utf-8")
+    return log_path
+
+
+def _resource_limit_arg(spec: str) -> tuple[str, ResourceLimit]:
+    try:
+        return parse_resource_limit(spec)
+    except ValueError as err:
+        raise argparse.ArgumentTypeError(str(err))
+
+
+def _format_limits(limits: dict[str, ResourceLimit]) -> str:
+    return ", ".join(
+        f"{name}={limit.concurrency}" + (f":{limit.rate_per_minute:g}" if limit.rate_per_minute else "")
+        for name, limit in sorted(limits.items())
+    )
+
+
+def _resource_limiter(args: argparse.Namespace) -> ResourceLimiter:
+    """Default limieten, aangevuld/overschreven met --resource-limit."""
+    return ResourceLimiter({**DEFAULT_RESOURCE_LIMITS, **dict(args.resource_limit)})
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Pipeline Executor. Voert multi-agent pipelines uit."
@@ -141,6 +249,82 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Herstart pipeline vanaf specifieke stap (voor recovery na failure)",
     )
+
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        default=False,
+        help="Hervat vorige run: sla stappen over die in het journal (temp/pipeline-executor/journals/) geslaagd zijn",
+    )
+
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Maximaal aantal stappen dat tegelijk draait (default: {DEFAULT_MAX_WORKERS})",
+    )
+
+    parser.add_argument(
+        "--matrix",
+        type=str,
+        default=None,
+        help="JSONL met per regel een set extra_params; voert de pipeline per regel uit, gelijktijdig",
+    )
+
+    parser.add_argument(
+        "--matrix-concurrency",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Maximaal aantal matrix instanties tegelijk (default: {DEFAULT_MAX_WORKERS}); "
+        "--max-workers begrenst de stappen over alle instanties samen",
+    )
+
+    parser.add_argument(
+        "--resource-limit",
+        type=_resource_limit_arg,
+        action="append",
+        default=[],
+        metavar="KLASSE=N[:PER_MINUUT]",
+        help="Limiet voor stappen met '**Resource**: <klasse>': N tegelijk, optioneel max starts per minuut "
+        f"(herhaalbaar; default: {_format_limits(DEFAULT_RESOURCE_LIMITS)})",
+    )
+
+    parser.add_argument(
+        "--no-plan-cache",
+        action="store_true",
+        default=False,
+        help="Pipeline altijd opnieuw parsen (negeer gecachet plan in temp/pipeline-executor/plans/)",
+    )
+
+    parser.add_argument(
+        "--step-cache",
+        action="store_true",
+        default=False,
+        help="Sla stappen over waarvan runner, argumenten en inputs ongewijzigd zijn en zet hun outputs "
+        "terug uit temp/pipeline-executor/step-cache/ (opt-in; de samenvatting noemt de teruggezette stappen)",
+    )
+
+    parser.add_argument(
+        "--fixed-timeouts",
+        action="store_true",
+        default=False,
+        help="Timeout per stap volgens 'Geschatte duur' i.p.v. de gemeten duur-historie (temp/pipeline-executor/durations.json)",
+    )
+
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        default=False,
+        help="Roep main() van runners direct aan i.p.v. per stap een nieuwe interpreter (geen timeout)",
+    )
+
+    parser.add_argument(
+        "--worker-pool",
+        action="store_true",
+        default=False,
+        help="Stuur stappen naar de warme worker pool (python -m pipeline_executor.worker_pool start); "
+        "zonder actieve pool: subprocess per stap",
+    )
     
     # Allow additional parameters to pass to agents
     parser.add_argument(
@@ -152,6 +336,50 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def _run_matrix_frontdoor(*, workspace_root: Path, args: argparse.Namespace) -> FrontdoorResult:
+    """Matrix mode: dezelfde pipeline voor elke regel uit --matrix, met één geaggregeerd rapport."""
+    pipeline_naam = Path(args.pipeline_bestand).stem.replace("-pipeline", "")
+    start_time = datetime.now()
+
+    try:
+        instances = load_matrix(workspace_root / args.matrix)
+    except PolicyError as err:
+        return FrontdoorResult(success=False, message=f"Policy violation: {err}", execution_log=None)
+
+    results = run_matrix(
+        instances=instances,
+        max_instances=args.matrix_concurrency,
+        max_workers=args.max_workers,
+        workspace_root=workspace_root,
+        pipeline_bestand=args.pipeline_bestand,
+        workflow_bestand=args.workflow_bestand,
+        dry_run=args.dry_run,
+        stop_on_failure=args.stop_on_failure == "true" if args.stop_on_failure else None,
+        continue_from_step=args.continue_from_step,
+        use_plan_cache=not args.no_plan_cache,
+        in_process=args.in_process,
+        use_worker_pool=args.worker_pool,
+        resume=args.resume,
+        use_step_cache=args.step_cache,
+        adaptive_timeouts=not args.fixed_timeouts,
+        resource_limiter=_resource_limiter(args),
+    )
+
+    execution_log = _write_matrix_log(
+        workspace_root=workspace_root,
+        pipeline_naam=pipeline_naam,
+        results=results,
+        total_duration=(datetime.now() - start_time).total_seconds(),
+    )
+
+    geslaagd = sum(1 for _, result in results if result.success)
+    return FrontdoorResult(
+        success=geslaagd == len(results),
+        message=f"Matrix '{pipeline_naam}': {geslaagd}/{len(results)} instanties geslaagd",
+        execution_log=execution_log,
+    )
+
+
 def run_frontdoor(*, workspace_root: Path) -> FrontdoorResult:
     parser = build_parser()
     args = parser.parse_args()
@@ -162,8 +390,19 @@ def run_frontdoor(*, workspace_root: Path) -> FrontdoorResult:
     stop_on_failure = args.stop_on_failure == "true" if args.stop_on_failure else None
     execution_log_path = args.execution_log
     continue_from_step = args.continue_from_step
+    resume = args.resume
+    max_workers = args.max_workers
+    use_plan_cache = not args.no_plan_cache
+    use_step_cache = args.step_cache
+    adaptive_timeouts = not args.fixed_timeouts
+    in_process = args.in_process
+    use_worker_pool = args.worker_pool
     extra_params = args.extra_params if hasattr(args, 'extra_params') else []
 
+    if args.matrix:
+        return _run_matrix_frontdoor(workspace_root=workspace_root, args=args)
+
+    telemetry = Telemetry(telemetry_path(workspace_root))
     try:
         result = execute_pipeline(
             workspace_root=workspace_root,
@@ -173,23 +412,26 @@ def run_frontdoor(*, workspace_root: Path) -> FrontdoorResult:
             stop_on_failure=stop_on_failure,
             continue_from_step=continue_from_step,
             extra_params=extra_params,
+            max_workers=max_workers,
+            use_plan_cache=use_plan_cache,
+            in_process=in_process,
+            use_worker_pool=use_worker_pool,
+            resume=resume,
+            use_step_cache=use_step_cache,
+            adaptive_timeouts=adaptive_timeouts,
+            telemetry=telemetry,
+            resource_limiter=_resource_limiter(args),
         )
 
         # Extract pipeline naam from path
         pipeline_path = Path(pipeline_bestand)
         pipeline_naam = pipeline_path.stem.replace("-pipeline", "")
 
-        # Write execution log
+        # Write execution log (gerenderd uit de telemetry spans van deze run)
         execution_log = _write_execution_log(
             workspace_root=workspace_root,
             pipeline_naam=pipeline_naam,
-            success=result.success,
-            message=result.message,
-            steps_executed=result.steps_executed,
-            gates_validated=result.gates_validated,
-            failures=result.failures,
-            artifacts=result.artifacts,
-            total_duration=result.total_duration,
+            events=telemetry.events,
         )
 
         return FrontdoorResult(
@@ -206,16 +448,12 @@ def run_frontdoor(*, workspace_root: Path) -> FrontdoorResult:
         except:
             pipeline_naam = "unknown"
 
-        execution_log = _write_execution_log(
+        execution_log = _write_failure_log(
             workspace_root=workspace_root,
+            telemetry=telemetry,
             pipeline_naam=pipeline_naam,
-            success=False,
             message=f"Policy violation: {err}",
-            steps_executed=[],
-            gates_validated=[],
-            failures=[{"location": "Pre-execution", "error": str(err), "action": "Stop"}],
-            artifacts=[],
-            total_duration=0.0,
+            failure={"location": "Pre-execution", "error": str(err), "action": "Stop"},
         )
 
         return FrontdoorResult(
@@ -231,16 +469,12 @@ def run_frontdoor(*, workspace_root: Path) -> FrontdoorResult:
         except:
             pipeline_naam = "unknown"
 
-        execution_log = _write_execution_log(
+        execution_log = _write_failure_log(
             workspace_root=workspace_root,
+            telemetry=telemetry,
             pipeline_naam=pipeline_naam,
-            success=False,
             message=f"Validation error: {err}",
-            steps_executed=[],
-            gates_validated=[],
-            failures=[{"location": "Pre-execution", "error": str(err), "action": "Stop"}],
-            artifacts=[],
-            total_duration=0.0,
+            failure={"location": "Pre-execution", "error": str(err), "action": "Stop"},
         )
 
         return FrontdoorResult(
@@ -256,16 +490,12 @@ def run_frontdoor(*, workspace_root: Path) -> FrontdoorResult:
         except:
             pipeline_naam = "unknown"
 
-        execution_log = _write_execution_log(
+        execution_log = _write_failure_log(
             workspace_root=workspace_root,
+            telemetry=telemetry,
             pipeline_naam=pipeline_naam,
-            success=False,
             message=f"Unexpected error: {err}",
-            steps_executed=[],
-            gates_validated=[],
-            failures=[{"location": "Execution", "error": str(err), "action": "Stop"}],
-            artifacts=[],
-            total_duration=0.0,
+            failure={"location": "Execution", "error": str(err), "action": "Stop"},
         )
 
         return FrontdoorResult(
@@ -273,3 +503,4 @@ def run_frontdoor(*, workspace_root: Path) -> FrontdoorResult:
             message=f"Unexpected error: {err}",
             execution_log=execution_log,
         )
+
@@ -0,0 +1,243 @@
+"""Pipeline Executor In-Process - Runner entry points direct aanroepen, zonder nieuwe interpreter."""
+
+from __future__ import annotations
+
+import ast
+import contextlib
+import importlib.util
+import io
+import os
+import sys
+import threading
+import traceback
+from pathlib import Path
+from types import ModuleType
+from typing import IO
+
+from pipeline_executor.step_output import OUTPUT_TAIL_BYTES, OutputTail, StreamResult
+
+# argv, cwd en stdout/stderr zijn proces-globaal: in-process stappen draaien één tegelijk
+_PROCESS_STATE_LOCK = threading.Lock()
+_MODULE_LOCK = threading.Lock()
+_loaded_runners: dict[Path, ModuleType] = {}
+_loaded_signatures: dict[Path, tuple] = {}  # scripts folder -> code_signature bij het laden
+_entry_checks: dict[Path, tuple[tuple[int, int], bool]] = {}  # runner -> ((mtime, grootte), supported)
+_OWN_PACKAGE = Path(__file__).resolve().parent
+
+
+class _TeeWriter(io.TextIOBase):
+    """Text stream die naar het step log en een ring buffer schrijft."""
+
+    def __init__(self, tail: OutputTail, log_file: IO[bytes]) -> None:
+        self._tail = tail
+        self._log_file = log_file
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        data = text.encode("utf-8", errors="replace")
+        self._tail.append(data)
+        self._log_file.write(data)
+        return len(text)
+
+    def flush(self) -> None:
+        self._log_file.flush()
+
+
+def code_signature(scripts_dir: Path) -> tuple[tuple[str, int, int], ...]:
+    """(pad, mtime, grootte) van de runner scripts en runner packages in scripts_dir.
+
+    Verandert zodra een runner of een package ernaast (moeder/, pipeline_executor/, ...)
+    gewijzigd wordt, bijvoorbeeld door een fetch_agents update.
+    """
+    entries: list[tuple[str, int, int]] = []
+    try:
+        with os.scandir(scripts_dir) as it:
+            top = list(it)
+    except OSError:
+        return ()
+    for entry in top:
+        path = Path(entry.path)
+        if entry.is_file() and entry.name.endswith(".py"):
+            files = [path]
+        elif entry.is_dir() and (path / "__init__.py").is_file():
+            files = [p for p in path.rglob("*.py") if "__pycache__" not in p.parts]
+        else:
+            continue
+        for file_path in files:
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            entries.append((str(file_path), stat.st_mtime_ns, stat.st_size))
+    return tuple(sorted(entries))
+
+
+def _forget_runner_modules(scripts_dir: Path) -> None:
+    """Vergeet geladen runners en runner packages uit scripts_dir, zodat ze opnieuw geïmporteerd worden.
+
+    Het eigen package (pipeline_executor) en __main__ blijven staan: die draaien op dit moment.
+    """
+    _loaded_runners.clear()
+    for name, module in list(sys.modules.items()):
+        if name in ("__main__", "__mp_main__"):
+            continue
+        module_file = getattr(module, "__file__", None)
+        if not module_file:
+            continue
+        module_path = Path(module_file).resolve()
+        if scripts_dir in module_path.parents and _OWN_PACKAGE not in module_path.parents:
+            del sys.modules[name]
+
+
+def load_runner(runner_path: Path) -> ModuleType:
+    """Importeer runner script (scripts/<agent>.py) één keer.
+
+    Gewijzigde runners of runner packages (zie code_signature) worden opnieuw
+    geïmporteerd: een warme runner draait nooit oude code naast nieuwe.
+    """
+    runner_path = runner_path.resolve()
+    scripts_dir = runner_path.parent
+    signature = code_signature(scripts_dir)
+
+    with _MODULE_LOCK:
+        previous = _loaded_signatures.get(scripts_dir)
+        if previous != signature:
+            if previous is not None:
+                _forget_runner_modules(scripts_dir)
+            _loaded_signatures[scripts_dir] = signature
+        cached = _loaded_runners.get(runner_path)
+        if cached is not None:
+            return cached
+
+        # Runner packages (moeder/, agent_smeder/, ...) staan naast het runner script
+        if str(scripts_dir) not in sys.path:
+            sys.path.insert(0, str(scripts_dir))
+
+        module_name = "_runner_" + runner_path.stem.replace("-", "_")
+        spec = importlib.util.spec_from_file_location(module_name, runner_path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Kan runner niet laden: {runner_path}")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _loaded_runners[runner_path] = module
+        return module
+
+
+def _has_main_entry(tree: ast.Module) -> bool:
+    """True als de module een top-level def main() en een __main__ guard heeft."""
+    has_main = any(isinstance(node, ast.FunctionDef) and node.name == "main" for node in tree.body)
+    for node in tree.body:
+        if not (isinstance(node, ast.If) and isinstance(node.test, ast.Compare)):
+            continue
+        operands = [node.test.left, *node.test.comparators]
+        names = {o.id for o in operands if isinstance(o, ast.Name)}
+        constants = {o.value for o in operands if isinstance(o, ast.Constant)}
+        if "__name__" in names and "__main__" in constants:
+            return has_main
+    return False
+
+
+def supports_in_process(runner_path: Path) -> bool:
+    """True als de runner een def main() en een __main__ guard heeft.
+
+    Bepaald met ast, zonder de runner uit te voeren: een runner zonder guard doet
+    zijn werk bij het importeren en hoort in een eigen subprocess.
+    """
+    try:
+        stat = runner_path.stat()
+    except OSError:
+        return False
+    key = (stat.st_mtime_ns, stat.st_size)
+    with _MODULE_LOCK:
+        cached = _entry_checks.get(runner_path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    try:
+        supported = _has_main_entry(ast.parse(runner_path.read_bytes(), filename=str(runner_path)))
+    except (OSError, SyntaxError, ValueError):
+        supported = False
+    with _MODULE_LOCK:
+        _entry_checks[runner_path] = (key, supported)
+    return supported
+
+
+def run_if_supported(
+    runner_path: Path,
+    args: list[str],
+    *,
+    cwd: Path,
+    log_path: Path,
+    tail_bytes: int = OUTPUT_TAIL_BYTES,
+) -> StreamResult | None:
+    """run_in_process als de runner in-process kan draaien, anders None (val terug op subprocess).
+
+    Blokkeert (import van de runner); vanuit async code via asyncio.to_thread.
+    """
+    if not supports_in_process(runner_path):
+        return None
+    return run_in_process(runner_path, args, cwd=cwd, log_path=log_path, tail_bytes=tail_bytes)
+
+
+def run_in_process(
+    runner_path: Path,
+    args: list[str],
+    *,
+    cwd: Path,
+    log_path: Path,
+    tail_bytes: int = OUTPUT_TAIL_BYTES,
+) -> StreamResult | None:
+    """Roep main() van een runner aan met geïsoleerde argv/cwd en gecapturede output.
+
+    Ook het laden van de runner gebeurt binnen die isolatie. Lukt het laden niet
+    (exception of SystemExit bij de import, geen main()), dan is het resultaat None:
+    de aanroeper voert de stap dan als subprocess uit.
+    Exit codes volgen de subprocess-semantiek: de returnwaarde van main(), de code
+    van een SystemExit, of 1 bij een onverwachte exception (traceback naar stderr).
+    Let op: een timeout kan in-process niet worden afgedwongen.
+    """
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    stdout_tail = OutputTail(tail_bytes)
+    stderr_tail = OutputTail(tail_bytes)
+
+    with log_path.open("wb") as log_file, _PROCESS_STATE_LOCK:
+        log_file.write(f"$ (in-process) {runner_path} {' '.join(args)}\n".encode("utf-8"))
+        stdout = _TeeWriter(stdout_tail, log_file)
+        stderr = _TeeWriter(stderr_tail, log_file)
+
+        saved_argv = sys.argv
+        saved_cwd = os.getcwd()
+        sys.argv = [str(runner_path), *args]
+        os.chdir(cwd)
+        try:
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                try:
+                    entry = getattr(load_runner(runner_path), "main", None)
+                except BaseException:
+                    traceback.print_exc()
+                    entry = None
+                if not callable(entry):
+                    return None
+                try:
+                    returncode = entry()
+                except SystemExit as exit_:
+                    code = exit_.code
+                    returncode = code if isinstance(code, int) else (0 if code is None else 1)
+                    if code is not None and not isinstance(code, int):
+                        print(code, file=sys.stderr)
+                except Exception:
+                    traceback.print_exc()
+                    returncode = 1
+        finally:
+            sys.argv = saved_argv
+            os.chdir(saved_cwd)
+            log_file.flush()
+
+    return StreamResult(
+        returncode=returncode if isinstance(returncode, int) else 0,
+        stdout=stdout_tail.text(),
+        stderr=stderr_tail.text(),
+        stdout_bytes=stdout_tail.total_bytes,
+        stderr_bytes=stderr_tail.total_bytes,
+    )
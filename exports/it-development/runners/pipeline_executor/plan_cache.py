@@ -0,0 +1,52 @@
+"""Pipeline Executor Plan Cache - Gecompileerde pipeline plannen, geldig zolang de content hash klopt."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+# Verhoog bij elke wijziging in de plan-structuur of parse-logica, zodat oude plannen vervallen.
+# Een plan bevat alleen wat uit de pipeline tekst volgt; operaties en default timeouts
+# worden na het laden bepaald (core._resolve_plan) en vallen dus niet onder de cache.
+PLAN_FORMAT_VERSION = 5
+
+
+def _plan_cache_dir(workspace_root: Path) -> Path:
+    return workspace_root / "temp" / "pipeline-executor" / "plans"
+
+
+def plan_cache_path(workspace_root: Path, pipeline_path: Path, content: bytes) -> Path:
+    """Bepaal cache-bestand voor een pipeline op basis van naam, content hash en plan-versie."""
+    digest = hashlib.sha256(content)
+    digest.update(f"\0plan-v{PLAN_FORMAT_VERSION}".encode("utf-8"))
+    return _plan_cache_dir(workspace_root) / f"{pipeline_path.stem}-{digest.hexdigest()[:16]}.json"
+
+
+def load_plan(cache_path: Path) -> dict | None:
+    """Lees gecachet plan; None bij cache miss of onleesbaar cache-bestand."""
+    try:
+        return json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def store_plan(cache_path: Path, plan: dict) -> None:
+    """Schrijf plan atomisch weg en ruim verouderde plannen van dezelfde pipeline op.
+
+    Cache-fouten zijn nooit fataal: de pipeline draait dan gewoon op het vers geparste plan.
+    """
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps(plan, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+
+        stem = cache_path.stem.rsplit("-", 1)[0]
+        for stale in cache_path.parent.glob(f"{stem}-*.json"):
+            if stale != cache_path and stale.stem.rsplit("-", 1)[0] == stem:
+                stale.unlink(missing_ok=True)
+    except OSError:
+        pass
@@ -0,0 +1,174 @@
+"""Pipeline Executor Scheduler - DAG van stappen en begrensde parallelle uitvoering (asyncio)."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+from typing import AsyncContextManager, Awaitable, Callable
+
+DEFAULT_MAX_WORKERS = 4
+
+
+def _uses_previous_artifacts(stap: dict) -> bool:
+    """Bepaal of een stap artifacts van eerdere stappen als input gebruikt."""
+    return "smeder" in stap.get("agent", "")
+
+
+def build_step_graph(stappen: list[dict]) -> dict[int, set[int]]:
+    """Bouw dependency graph: stap nummer -> nummers van stappen die eerst klaar moeten zijn.
+
+    Regels:
+    - Een stap met run mode "parallel" hoort bij de groep van de voorgaande stap
+      en deelt diens afhankelijkheden (draait er gelijktijdig mee).
+    - Een sequential stap start pas als de volledige voorgaande groep klaar is.
+    - Artifact chaining: stappen die artifacts van eerdere stappen lezen (agent-smeder
+      leest het boundary artifact van stap 1 en het artifact van de vorige stap)
+      wachten altijd op die stappen, ook als ze als parallel gemarkeerd zijn.
+    """
+    graph: dict[int, set[int]] = {}
+    known = {stap.get("number", 0) for stap in stappen}
+    group: list[int] = []
+    barrier: set[int] = set()
+
+    for stap in stappen:
+        step_num = stap.get("number", 0)
+
+        if stap.get("run_mode") == "parallel" and group:
+            group.append(step_num)
+        else:
+            barrier = set(group)
+            group = [step_num]
+
+        deps = set(barrier)
+        if _uses_previous_artifacts(stap):
+            deps.update(n for n in (1, step_num - 1) if n in known and n < step_num)
+
+        graph[step_num] = deps
+
+    return graph
+
+
+def transitive_dependencies(graph: dict[int, set[int]], step_num: int) -> set[int]:
+    """Alle stappen waar step_num (direct of indirect) op wacht."""
+    seen: set[int] = set()
+    pending = list(graph.get(step_num, ()))
+    while pending:
+        dep = pending.pop()
+        if dep not in seen:
+            seen.add(dep)
+            pending.extend(graph.get(dep, ()))
+    return seen
+
+
+def estimate_makespan(
+    *,
+    stappen: list[dict],
+    graph: dict[int, set[int]],
+    durations: dict[int, float],
+    completed: set[int] | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> float:
+    """Geschatte doorlooptijd: speel run_step_graph na met verwachte duur per stap.
+
+    Stappen starten in dezelfde volgorde als bij echte uitvoering (zodra hun
+    afhankelijkheden klaar zijn en er een worker vrij is).
+    """
+    finished = set(completed or ())
+    pending = [s.get("number", 0) for s in stappen if s.get("number", 0) not in finished]
+    running: list[tuple[float, int]] = []
+    now = 0.0
+
+    while pending or running:
+        for step_num in list(pending):
+            if len(running) >= max_workers:
+                break
+            if graph.get(step_num, set()) <= finished:
+                heapq.heappush(running, (now + durations.get(step_num, 0.0), step_num))
+                pending.remove(step_num)
+        if not running:
+            break  # Onvervulbare afhankelijkheden
+        now, step_num = heapq.heappop(running)
+        finished.add(step_num)
+
+    return now
+
+
+async def run_step_graph(
+    *,
+    stappen: list[dict],
+    graph: dict[int, set[int]],
+    execute_step: Callable[[dict], Awaitable[dict]],
+    on_step_done: Callable[[dict, dict], Awaitable[bool]],
+    completed: set[int] | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    step_limiter: asyncio.Semaphore | None = None,
+    admission: Callable[[dict], AsyncContextManager] | None = None,
+) -> list[dict]:
+    """Voer stappen uit zodra hun afhankelijkheden klaar zijn, met maximaal max_workers tegelijk.
+
+    Elke stap is een asyncio task; on_step_done draait in de event loop (dus zonder
+    locking) en retourneert True om de run te stoppen. Stappen die dan nog lopen
+    worden coöperatief geannuleerd (hun subprocess wordt gestopt) en teruggegeven.
+    Wordt de run zelf geannuleerd (bijv. Ctrl-C), dan worden alle lopende stappen
+    mee geannuleerd voordat de annulering doorgaat. step_limiter is een extra,
+    gedeelde limiet over meerdere runs (matrix mode). admission (bijv. de resource
+    limiter) wordt betreden vóór een worker slot: een stap die op zijn resource klasse
+    wacht, houdt geen worker bezet voor stappen die wel kunnen starten.
+    """
+    done: set[int] = set(completed or ())
+    pending = {stap.get("number", 0): stap for stap in stappen if stap.get("number", 0) not in done}
+    running: dict[asyncio.Task, dict] = {}
+    cancelled: list[dict] = []
+    slots = asyncio.Semaphore(max(1, max_workers))
+
+    async def _run_in_slot(stap: dict) -> dict:
+        async with slots:
+            if step_limiter is None:
+                return await execute_step(stap)
+            async with step_limiter:
+                return await execute_step(stap)
+
+    async def _run(stap: dict) -> dict:
+        if admission is None:
+            return await _run_in_slot(stap)
+        async with admission(stap):
+            return await _run_in_slot(stap)
+
+    async def _cancel_running() -> None:
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+
+    try:
+        while pending or running:
+            ready = sorted(n for n in pending if graph.get(n, set()) <= done)
+            for step_num in ready:
+                stap = pending.pop(step_num)
+                running[asyncio.ensure_future(_run(stap))] = stap
+
+            if not running:
+                # Niets meer uitvoerbaar (onvervulbare afhankelijkheden)
+                break
+
+            finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            halted = False
+            for task in sorted(finished, key=lambda t: running[t].get("number", 0)):
+                stap = running.pop(task)
+                if await on_step_done(stap, task.result()):
+                    halted = True
+                done.add(stap.get("number", 0))
+
+            if halted:
+                await _cancel_running()
+                for task, stap in sorted(running.items(), key=lambda item: item[1].get("number", 0)):
+                    if task.cancelled():
+                        cancelled.append(stap)
+                    else:
+                        await on_step_done(stap, task.result())  # Was al klaar: resultaat niet weggooien
+                running.clear()
+                break
+    finally:
+        if running:
+            await _cancel_running()
+
+    return cancelled
@@ -0,0 +1,130 @@
+"""Pipeline Executor Step Cache - Content-addressed cache van stapresultaten."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+
+# Verhoog bij elke wijziging in de fingerprint-opbouw, zodat oude resultaten vervallen
+STEP_CACHE_VERSION = 1
+_CHUNK_SIZE = 1024 * 1024
+
+
+def file_digest(path: Path) -> str:
+    """SHA-256 van de bestandsinhoud (gestreamd)."""
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class StepResultCache:
+    """Resultaten van stappen, opgeslagen onder een fingerprint van hun inputs.
+
+    De fingerprint bestaat uit de inhoud van het runner script (en zijn runner
+    package), de argumenten van de stap en de inhoud van de input artifacts.
+    Outputs worden content-addressed bewaard in blobs/, zodat een cache hit ze
+    kan terugzetten als ze van disk verdwenen of gewijzigd zijn. Digests worden
+    per run gememoized op (pad, mtime, grootte).
+    """
+
+    def __init__(self, workspace_root: Path) -> None:
+        self.workspace_root = workspace_root
+        self._root = workspace_root / "temp" / "pipeline-executor" / "step-cache"
+        self._digests: dict[Path, tuple[tuple[int, int], str]] = {}
+        self._lock = threading.Lock()
+
+    def _relative(self, path: Path) -> str:
+        try:
+            return path.relative_to(self.workspace_root).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def digest(self, path: Path) -> str:
+        stat = path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._digests.get(path)
+            if entry is not None and entry[0] == signature:
+                return entry[1]
+        value = file_digest(path)
+        with self._lock:
+            self._digests[path] = (signature, value)
+        return value
+
+    def fingerprint(self, *, runner_path: Path, args: list[str], inputs: list[Path]) -> str:
+        """Fingerprint van een stap; wijzigt als runner, argumenten of input artifacts wijzigen."""
+        h = hashlib.sha256(f"step-v{STEP_CACHE_VERSION}".encode("utf-8"))
+
+        runner_files = [runner_path]
+        package_dir = runner_path.parent / runner_path.stem.replace("-", "_")
+        if package_dir.is_dir():
+            runner_files.extend(sorted(package_dir.rglob("*.py")))
+        for path in runner_files:
+            h.update(f"\0runner\0{self._relative(path)}\0{self.digest(path)}".encode("utf-8"))
+
+        for arg in args:
+            h.update(f"\0arg\0{arg}".encode("utf-8"))
+
+        for path in sorted(inputs, key=self._relative):
+            h.update(f"\0input\0{self._relative(path)}\0{self.digest(path)}".encode("utf-8"))
+
+        return h.hexdigest()
+
+    def _result_path(self, fingerprint: str) -> Path:
+        return self._root / "results" / f"{fingerprint}.json"
+
+    def _blob_path(self, digest: str) -> Path:
+        return self._root / "blobs" / digest[:2] / digest
+
+    def lookup(self, fingerprint: str) -> dict | None:
+        """Opgeslagen resultaat voor fingerprint, of None bij cache miss."""
+        try:
+            return json.loads(self._result_path(fingerprint).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def restore(self, record: dict) -> list[Path] | None:
+        """Zet outputs van een opgeslagen resultaat terug; None als dat niet (volledig) kan."""
+        restored: list[Path] = []
+        try:
+            for output in record["outputs"]:
+                path = self.workspace_root / output["path"]
+                if not (path.is_file() and self.digest(path) == output["sha256"]):
+                    blob = self._blob_path(output["sha256"])
+                    if not blob.is_file():
+                        return None
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    shutil.copyfile(blob, path)
+                restored.append(path)
+        except (OSError, KeyError):
+            return None
+        return restored
+
+    def store(self, fingerprint: str, *, artifact: Path | None, outputs: list[Path]) -> None:
+        """Bewaar outputs (als blobs) en het resultaat; cache-fouten zijn nooit fataal."""
+        try:
+            entries = []
+            for path in outputs:
+                digest = self.digest(path)
+                blob = self._blob_path(digest)
+                if not blob.exists():
+                    blob.parent.mkdir(parents=True, exist_ok=True)
+                    tmp_blob = blob.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+                    shutil.copyfile(path, tmp_blob)
+                    os.replace(tmp_blob, blob)
+                entries.append({"path": self._relative(path), "sha256": digest})
+
+            record = {"outputs": entries, "artifact": self._relative(artifact) if artifact else None}
+            result_path = self._result_path(fingerprint)
+            result_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = result_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_text(json.dumps(record, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, result_path)
+        except OSError:
+            pass
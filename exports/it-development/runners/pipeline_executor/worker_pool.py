@@ -0,0 +1,309 @@
+"""Pipeline Executor Worker Pool - Warme worker processen die runner stappen uitvoeren.
+
+Een daemon houdt een aantal worker processen aan die bij het opstarten alle runners
+(en daarmee hun packages: moeder, agent_smeder, workflow_architect, ...) importeren.
+De pipeline executor stuurt stappen via een lokale socket naar de daemon; een vrije
+worker roept main() van de runner aan (zie inprocess), zodat een stap geen
+interpreter start en geen imports meer betaalt. Wijzigt een runner of runner package
+(bijv. na fetch_agents), dan wordt een worker voor de volgende job vervangen door een
+verse, zodat er nooit oude code draait. Workers worden met spawn gestart: de daemon
+is multi-threaded, en fork vanuit threads is niet veilig.
+
+Usage (vanuit scripts/):
+    python -m pipeline_executor.worker_pool start [--workers N]
+    python -m pipeline_executor.worker_pool status
+    python -m pipeline_executor.worker_pool stop
+
+De daemon schrijft adres en authkey naar temp/pipeline-executor/worker-pool.json;
+alleen processen die dat bestand kunnen lezen kunnen jobs insturen.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import queue
+import subprocess
+import sys
+import threading
+from multiprocessing.connection import Client, Connection, Listener
+from pathlib import Path
+
+from pipeline_executor.inprocess import code_signature, load_runner, run_if_supported, supports_in_process
+from pipeline_executor.step_output import StreamResult
+
+DEFAULT_POOL_WORKERS = 4
+_MP_CONTEXT = multiprocessing.get_context("spawn")
+_WORKSPACE_ROOT = Path(__file__).parent.parent.parent
+
+
+def _pool_state_path(workspace_root: Path) -> Path:
+    return workspace_root / "temp" / "pipeline-executor" / "worker-pool.json"
+
+
+def _preload_runners(scripts_dir: Path) -> None:
+    """Importeer de runners in scripts_dir die in-process kunnen draaien (en daarmee hun packages).
+
+    Runners zonder main() en __main__ guard worden niet geladen: die doen hun werk bij
+    het importeren en draaien als subprocess.
+    """
+    for runner_path in sorted(scripts_dir.glob("*.py")):
+        if not supports_in_process(runner_path):
+            continue
+        try:
+            load_runner(runner_path)
+        except BaseException:
+            pass  # Runner wordt bij de eerste job opnieuw geprobeerd
+
+
+def _worker_main(conn: Connection, scripts_dir: str) -> None:
+    """Worker loop: runners voorladen, daarna jobs één voor één uitvoeren."""
+    if scripts_dir not in sys.path:
+        sys.path.insert(0, scripts_dir)
+    _preload_runners(Path(scripts_dir))
+
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            break
+        if job is None:
+            break
+
+        try:
+            result = run_if_supported(
+                Path(job["runner"]),
+                job["args"],
+                cwd=Path(job["cwd"]),
+                log_path=Path(job["log"]),
+            )
+        except BaseException as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+            continue
+        # Geen main() of laden mislukt: de executor valt terug op een subprocess
+        conn.send(("ok", result) if result is not None else ("unsupported", None))
+
+
+class _Worker:
+    """Eén warm worker proces met een eigen pipe; signature is de code die het heeft geladen."""
+
+    def __init__(self, scripts_dir: Path) -> None:
+        self.signature = code_signature(scripts_dir)
+        self.conn, child_conn = _MP_CONTEXT.Pipe()
+        self.process = _MP_CONTEXT.Process(
+            target=_worker_main, args=(child_conn, str(scripts_dir)), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+
+    def stop(self, kill: bool = False) -> None:
+        if kill:
+            self.process.kill()
+        else:
+            try:
+                self.conn.send(None)
+            except OSError:
+                pass
+        self.process.join(timeout=5)
+        self.conn.close()
+
+
+class WorkerPoolServer:
+    """Daemon: accepteert jobs op een lokale socket en verdeelt ze over warme workers.
+
+    Een job die zijn timeout overschrijdt wordt afgebroken door de worker te stoppen;
+    er wordt direct een nieuwe (warme) worker voor in de plaats gestart. Hetzelfde
+    gebeurt voor een job als de runner code sinds de start van de worker gewijzigd is.
+    """
+
+    def __init__(self, workspace_root: Path, workers: int = DEFAULT_POOL_WORKERS) -> None:
+        self.workspace_root = workspace_root
+        self.scripts_dir = workspace_root / "scripts"
+        self._idle: queue.Queue[_Worker] = queue.Queue()
+        self._workers = [_Worker(self.scripts_dir) for _ in range(max(1, workers))]
+        for worker in self._workers:
+            self._idle.put(worker)
+        self._authkey = os.urandom(32)
+        self._listener = Listener(("127.0.0.1", 0), authkey=self._authkey)
+        self._shutdown = threading.Event()
+        self._workers_lock = threading.Lock()
+
+    def _replace(self, worker: _Worker) -> _Worker:
+        worker.stop(kill=True)
+        fresh = _Worker(self.scripts_dir)
+        with self._workers_lock:
+            self._workers[self._workers.index(worker)] = fresh
+        return fresh
+
+    def _run_job(self, job: dict) -> tuple[str, object]:
+        worker = self._idle.get()
+        try:
+            if worker.signature != code_signature(self.scripts_dir):
+                worker = self._replace(worker)  # Runner code gewijzigd: verse worker
+            worker.conn.send(job)
+            timeout = job.get("timeout")
+            if not worker.conn.poll(timeout):
+                worker = self._replace(worker)
+                return ("timeout", None)
+            return worker.conn.recv()
+        except (EOFError, OSError) as e:
+            worker = self._replace(worker)  # Worker gecrasht (bijv. os._exit in runner)
+            return ("error", f"Worker afgebroken: {e}")
+        finally:
+            self._idle.put(worker)
+
+    def _handle(self, conn: Connection) -> None:
+        with conn:
+            try:
+                job = conn.recv()
+            except (EOFError, OSError):
+                return
+            if job == "shutdown":
+                conn.send(("ok", None))
+                self._shutdown.set()
+                return
+            if job == "status":
+                conn.send(("ok", {"pid": os.getpid(), "workers": len(self._workers), "idle": self._idle.qsize()}))
+                return
+            try:
+                conn.send(self._run_job(job))
+            except OSError:
+                pass  # Client is weg; resultaat staat in het step log
+
+    def serve(self) -> None:
+        """Schrijf state file en accepteer jobs tot een shutdown verzoek binnenkomt."""
+        state_path = _pool_state_path(self.workspace_root)
+        state_path.parent.mkdir(parents=True, exist_ok=True)
+        host, port = self._listener.address
+        state_path.write_text(
+            json.dumps({"host": host, "port": port, "authkey": self._authkey.hex(), "pid": os.getpid()}),
+            encoding="utf-8",
+        )
+
+        accept_thread = threading.Thread(target=self._accept_loop, daemon=True)
+        accept_thread.start()
+        try:
+            self._shutdown.wait()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._listener.close()
+            state_path.unlink(missing_ok=True)
+            for worker in self._workers:
+                worker.stop()
+
+    def _accept_loop(self) -> None:
+        while not self._shutdown.is_set():
+            try:
+                conn = self._listener.accept()
+            except Exception:
+                if self._shutdown.is_set():
+                    break
+                continue  # Bijv. verkeerde authkey
+            threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+
+class WorkerPoolClient:
+    """Client voor een draaiende worker pool; één verbinding per job (thread-safe)."""
+
+    def __init__(self, address: tuple[str, int], authkey: bytes) -> None:
+        self.address = address
+        self._authkey = authkey
+
+    def _request(self, job: object) -> tuple[str, object]:
+        with Client(self.address, authkey=self._authkey) as conn:
+            conn.send(job)
+            return conn.recv()
+
+    def status(self) -> dict:
+        return self._request("status")[1]  # type: ignore[return-value]
+
+    def shutdown(self) -> None:
+        self._request("shutdown")
+
+    def run(
+        self,
+        runner_path: Path,
+        args: list[str],
+        *,
+        cwd: Path,
+        log_path: Path,
+        timeout: float | None,
+    ) -> StreamResult | None:
+        """Voer runner uit in een warme worker; None als de runner geen main() heeft.
+
+        Raises subprocess.TimeoutExpired bij overschrijden van timeout (zelfde
+        semantiek als run_streaming).
+        """
+        status, payload = self._request({
+            "runner": str(runner_path),
+            "args": list(args),
+            "cwd": str(cwd),
+            "log": str(log_path),
+            "timeout": timeout,
+        })
+        if status == "ok":
+            return payload  # type: ignore[return-value]
+        if status == "unsupported":
+            return None
+        if status == "timeout":
+            raise subprocess.TimeoutExpired([str(runner_path), *args], timeout or 0)
+        raise RuntimeError(str(payload))
+
+
+def connect_pool(workspace_root: Path) -> WorkerPoolClient | None:
+    """Client voor de worker pool van deze workspace, of None als er geen draait."""
+    try:
+        state = json.loads(_pool_state_path(workspace_root).read_text(encoding="utf-8"))
+        client = WorkerPoolClient((state["host"], state["port"]), bytes.fromhex(state["authkey"]))
+        client.status()
+        return client
+    except (OSError, ValueError, KeyError, EOFError, multiprocessing.AuthenticationError):
+        return None
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Warm worker pool voor pipeline executor stappen.")
+    parser.add_argument("actie", choices=["start", "status", "stop"])
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_POOL_WORKERS,
+        help=f"Aantal warme worker processen (default: {DEFAULT_POOL_WORKERS})",
+    )
+    parser.add_argument(
+        "--workspace",
+        type=str,
+        default=str(_WORKSPACE_ROOT),
+        help="Workspace root (default: workspace van dit script)",
+    )
+    args = parser.parse_args(argv)
+    workspace_root = Path(args.workspace).resolve()
+    client = connect_pool(workspace_root)
+
+    if args.actie == "start":
+        if client is not None:
+            print(f"Worker pool draait al (pid {client.status()['pid']})")
+            return 0
+        server = WorkerPoolServer(workspace_root, workers=args.workers)
+        print(f"Worker pool gestart: {args.workers} workers (pid {os.getpid()})")
+        server.serve()
+        return 0
+
+    if client is None:
+        print("Geen worker pool actief", file=sys.stderr)
+        return 1
+
+    if args.actie == "status":
+        status = client.status()
+        print(f"Worker pool actief (pid {status['pid']}): {status['workers']} workers, {status['idle']} vrij")
+    else:
+        client.shutdown()
+        print("Worker pool gestopt")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -326,6 +326,46 @@ def op_valideer_governance(
     )
 
 
+FETCH_AGENTS_TIMEOUT = 600  # 10 minuten voor git clone + copy
+
+
+def _run_fetch_agents_in_process(
+    fetch_script: Path, args: list[str], workspace_root: Path
+) -> subprocess.CompletedProcess | None:
+    """Roep fetch_agents.main() aan in dit proces (geen nieuwe interpreter).
+    
+    Gebruikt dezelfde helper als de pipeline executor (pipeline_executor.inprocess):
+    het script wordt één keer geladen en argv/cwd/stdout worden onder een lock
+    vervangen. Het resultaat gedraagt zich als een subprocess.run(capture_output=True)
+    aanroep; de output staat ook in temp/moeder/fetch-agents.log.
+    
+    Let op: in-process geldt geen timeout (FETCH_AGENTS_TIMEOUT), want een lopende
+    fetch kan niet worden afgebroken zonder argv/cwd/stdout van moeder mee te nemen.
+    
+    Returns:
+        CompletedProcess, of None als fetch_agents.py niet in-process kan draaien
+        (helper niet beschikbaar, geen main(), of laden mislukt): voer dan een
+        subprocess uit.
+    """
+    try:
+        from pipeline_executor.inprocess import run_if_supported
+    except ImportError:
+        return None
+    
+    result = run_if_supported(
+        fetch_script,
+        args,
+        cwd=workspace_root,
+        log_path=workspace_root / "temp" / "moeder" / "fetch-agents.log",
+        tail_bytes=1024 * 1024,
+    )
+    if result is None:
+        return None
+    return subprocess.CompletedProcess(
+        args=[str(fetch_script), *args], returncode=result.returncode, stdout=result.stdout, stderr=result.stderr
+    )
+
+
 def op_fetch_agents(
     *,
     workspace_root: Path,
@@ -334,6 +374,7 @@ def op_fetch_agents(
     branch: str,
     agent_services_url: str,
     include_runners: bool,
+    in_process: bool = False,
 ) -> OperationResult:
     """Operatie: fetch-agents
     
@@ -375,19 +416,22 @@ def op_fetch_agents(
     ]
     
     # Voer fetch_agents.py uit vanuit workspace root
-    try:
-        result = subprocess.run(
-            cmd,
-            cwd=workspace_root,
-            capture_output=True,
-            text=True,
-            timeout=600  # 10 minuten timeout voor git clone + copy
-        )
-    except subprocess.TimeoutExpired:
-        raise PolicyError(
-            f"fetch_agents.py timed out na 10 minuten. "
-            f"Check netwerk verbinding of repository grootte."
-        )
+    # Opt-in in-process: zelfde interpreter, geen opstartkosten, maar ook geen timeout
+    result = _run_fetch_agents_in_process(fetch_script, cmd[2:], workspace_root) if in_process else None
+    if result is None:
+        try:
+            result = subprocess.run(
+                cmd,
+                cwd=workspace_root,
+                capture_output=True,
+                text=True,
+                timeout=FETCH_AGENTS_TIMEOUT,
+            )
+        except subprocess.TimeoutExpired:
+            raise PolicyError(
+                f"fetch_agents.py timed out na 10 minuten. "
+                f"Check netwerk verbinding of repository grootte."
+            )
     
     if result.returncode != 0:
         # Parse error uit fetch_agents.py output
@@ -439,6 +483,7 @@ def execute_operation(
     branch: str,
     agent_services_url: str,
     include_runners: bool,
+    in_process: bool = False,
 ) -> OperationResult:
     """Route operatie naar juiste handler."""
     
@@ -496,6 +541,7 @@ def execute_operation(
             branch=branch,
             agent_services_url=agent_services_url,
             include_runners=include_runners,
+            in_process=in_process,
         )
     
     else:
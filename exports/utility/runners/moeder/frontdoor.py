@@ -159,6 +159,13 @@ Kerntaak 7 (beheer-workspace-state) is conversationeel - geen runner.
         help="Ook runners ophalen (voor fetch-agents, default: true)",
     )
 
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        default=False,
+        help="Voer fetch_agents.py uit in dit proces i.p.v. een nieuwe interpreter (voor fetch-agents; zonder timeout)",
+    )
+
     return parser
 
 
@@ -176,6 +183,7 @@ def run_frontdoor(*, workspace_root: Path) -> FrontdoorResult:
     branch: str = args.branch
     agent_services_url: str = args.agent_services_url
     include_runners: bool = args.include_runners
+    in_process: bool = args.in_process
 
     try:
         result = execute_operation(
@@ -190,6 +198,7 @@ def run_frontdoor(*, workspace_root: Path) -> FrontdoorResult:
             branch=branch,
             agent_services_url=agent_services_url,
             include_runners=include_runners,
+            in_process=in_process,
         )
 
         trace_path = _write_trace(
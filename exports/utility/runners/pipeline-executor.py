@@ -12,6 +12,7 @@ Voor de Pipeline Executor agent voert de runner pipeline execution uit:
 
 Traceability:
     Schrijft execution log naar temp/pipeline-executor-<pipeline-naam>-{timestamp}.md
+    Schrijft span telemetry (JSONL) naar log/pipeline-executor-telemetry.jsonl
 """
 
 import sys
@@ -0,0 +1,50 @@
+"""Pipeline Executor Artifact Cache - Per-run cache van geparste artifact metadata."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class ArtifactMetadataCache:
+    """Parse elk artifact hooguit één keer per pipeline run.
+
+    Entries zijn gekoppeld aan (pad, extractor) en blijven geldig zolang mtime en
+    grootte van het bestand gelijk zijn; wordt het artifact herschreven (bijv. door
+    een latere stap), dan wordt het opnieuw geparst. Thread-safe, zodat parallelle
+    stappen en gates dezelfde cache delen.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[Path, str], tuple[tuple[int, int], object]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: Path | None, extract: Callable[[Path | None], T]) -> T:
+        """Geef extract(path), uit cache als het bestand sinds de vorige parse niet wijzigde."""
+        if path is None:
+            return extract(path)
+
+        try:
+            stat = path.stat()
+        except OSError:
+            return extract(path)
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        key = (path, extract.__name__)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self.hits += 1
+                return entry[1]  # type: ignore[return-value]
+
+        value = extract(path)
+        with self._lock:
+            self._entries[key] = (signature, value)
+            self.misses += 1
+        return value
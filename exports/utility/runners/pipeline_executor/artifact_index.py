@@ -0,0 +1,121 @@
+"""Pipeline Executor Artifact Index - Snapshot/diff detectie van artifacts per stap."""
+
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from pathlib import Path
+
+Signature = tuple[int, int]  # (mtime_ns, size)
+
+
+@dataclass(frozen=True)
+class ArtifactWatch:
+    """Folder + bestandspatroon waarin een stap zijn output artifact schrijft."""
+
+    directory: Path
+    pattern: str
+    exclude_stems: frozenset[str] = field(default_factory=frozenset)
+
+
+@dataclass(eq=False)
+class ArtifactWindow:
+    """Snapshot/diff venster van één stap op een bewaakte folder."""
+
+    watch: ArtifactWatch
+    before: dict[Path, Signature]
+    overlapped: bool = False  # Een andere stap bewaakte dezelfde folder tijdens dit venster
+    attributed: bool = True  # False: gewijzigde bestanden konden niet eenduidig aan deze stap worden toegewezen
+
+
+class ArtifactIndex:
+    """Snapshot/diff detectie van artifacts per stap.
+
+    Elke stap opent een eigen venster: een verse scan van de folder voor de stap en
+    één erna; het verschil is de set bestanden die in de tussentijd is aangemaakt of
+    gewijzigd. Parallelle stappen en matrix instanties kunnen dezelfde folder bewaken
+    en zien dan elkaars bestanden. Daarom:
+
+    - een versie (pad + signature) die een andere stap al heeft toegewezen gekregen,
+      telt niet meer mee;
+    - overlapt een venster met een ander, dan worden alleen bestanden met de naam-hint
+      van de stap (bijv. de agent naam) toegewezen. Zonder passende hint is de
+      toewijzing niet eenduidig (attributed=False) en claimt de stap niets.
+
+    os.scandir levert de stat-gegevens op Windows zonder extra systeemaanroepen.
+    """
+
+    def __init__(self) -> None:
+        self._open: dict[ArtifactWatch, list[ArtifactWindow]] = {}
+        self._claims: dict[ArtifactWatch, dict[Path, Signature]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _scan(watch: ArtifactWatch) -> dict[Path, Signature]:
+        entries: dict[Path, Signature] = {}
+        try:
+            with os.scandir(watch.directory) as it:
+                for entry in it:
+                    if not fnmatch(entry.name, watch.pattern):
+                        continue
+                    path = Path(entry.path)
+                    if path.stem in watch.exclude_stems or not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                    entries[path] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            pass
+        return entries
+
+    def begin(self, watch: ArtifactWatch) -> ArtifactWindow:
+        """Open een venster voor een stap: verse scan van de folder."""
+        window = ArtifactWindow(watch, self._scan(watch))
+        with self._lock:
+            open_windows = self._open.setdefault(watch, [])
+            for other in open_windows:
+                other.overlapped = True
+            window.overlapped = bool(open_windows)
+            open_windows.append(window)
+        return window
+
+    def end(self, window: ArtifactWindow, hint: str | None = None) -> list[Path]:
+        """Sluit het venster: bestanden die deze stap aanmaakte of wijzigde, oudste eerst."""
+        after = self._scan(window.watch)
+        with self._lock:
+            claims = self._claims.setdefault(window.watch, {})
+            changed = [
+                path for path, signature in after.items()
+                if window.before.get(path) != signature and claims.get(path) != signature
+            ]
+            if window.overlapped and changed:
+                matching = [path for path in changed if hint and hint in path.name]
+                window.attributed = bool(matching)
+                changed = matching if matching else changed
+            if window.attributed:
+                for path in changed:
+                    claims[path] = after[path]
+            self._close(window)
+        return sorted(changed, key=lambda p: after[p][0])
+
+    def discard(self, window: ArtifactWindow) -> None:
+        """Sluit een venster zonder diff (stap afgebroken); idempotent."""
+        with self._lock:
+            self._close(window)
+
+    def _close(self, window: ArtifactWindow) -> None:
+        open_windows = self._open.get(window.watch, [])
+        if window in open_windows:
+            open_windows.remove(window)
+        if not open_windows:
+            # Geen open vensters meer: nieuwe vensters beginnen met een verse scan
+            self._open.pop(window.watch, None)
+            self._claims.pop(window.watch, None)
+
+    def newest(self, watch: ArtifactWatch) -> Path | None:
+        """Meest recent gewijzigde bestand in de folder (fallback als een stap niets schreef)."""
+        entries = self._scan(watch)
+        if not entries:
+            return None
+        return max(entries, key=lambda p: entries[p][0])
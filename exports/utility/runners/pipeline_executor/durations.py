@@ -0,0 +1,98 @@
+"""Pipeline Executor Durations - Persistente duur-historie per agent/operatie."""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import threading
+from pathlib import Path
+
+DEFAULT_TIMEOUT = 300  # Zonder "Geschatte duur" en zonder historie (5 min)
+HISTORY_SIZE = 50  # Rolling window: alleen de laatste N metingen per agent/operatie tellen
+MIN_SAMPLES = 5  # Minder metingen: timeout en schatting volgen de pipeline-spec
+TIMEOUT_PERCENTILE = 0.99
+TIMEOUT_FACTOR = 2.0  # Marge boven de p99 voordat een stap als hangend geldt
+MIN_TIMEOUT = 30.0
+_SAVE_LOCK = threading.Lock()  # Gelijktijdige instanties in één proces (matrix mode)
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """Percentiel q (0..1) met lineaire interpolatie tussen de gesorteerde metingen."""
+    ordered = sorted(samples)
+    position = (len(ordered) - 1) * q
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def _history_key(stap: dict) -> str:
+    return f"{stap.get('agent', 'unknown')}:{stap.get('operation') or ''}"
+
+
+class DurationHistory:
+    """Gemeten duur van stappen, per agent/operatie, over pipelines en runs heen.
+
+    Met genoeg metingen volgt de timeout van een stap de historie (p99 x marge), met de
+    "Geschatte duur" uit de pipeline-spec als ondergrens: trage agents worden niet te
+    vroeg gestopt, ook niet na een reeks snelle runs. Een stap die op zijn timeout
+    stopt telt mee als meting (ondergrens van de echte duur), zodat de p99 meestijgt.
+    De mediaan dient als schatting voor de dry-run doorlooptijd.
+    """
+
+    def __init__(self, workspace_root: Path) -> None:
+        self._path = workspace_root / "temp" / "pipeline-executor" / "durations.json"
+        self._samples = self._read()
+        self._new: dict[str, list[float]] = {}
+
+    def _read(self) -> dict[str, list[float]]:
+        try:
+            data = json.loads(self._path.read_text(encoding="utf-8"))
+            return {key: [float(v) for v in values] for key, values in data.items()}
+        except (OSError, ValueError, AttributeError, TypeError):
+            return {}
+
+    def samples(self, stap: dict) -> list[float]:
+        return self._samples.get(_history_key(stap), [])
+
+    def timeout_for(self, stap: dict) -> float:
+        """Adaptieve timeout uit de historie, nooit onder de geschatte duur uit de pipeline-spec."""
+        estimate = stap.get("duration_estimate", DEFAULT_TIMEOUT)
+        samples = self.samples(stap)
+        if len(samples) < MIN_SAMPLES:
+            return estimate
+        return max(MIN_TIMEOUT, estimate, percentile(samples, TIMEOUT_PERCENTILE) * TIMEOUT_FACTOR)
+
+    def estimate(self, stap: dict) -> float:
+        """Verwachte duur: mediaan van de historie, anders de geschatte duur uit de pipeline-spec."""
+        samples = self.samples(stap)
+        if not samples:
+            return stap.get("duration_estimate", DEFAULT_TIMEOUT)
+        return percentile(samples, 0.5)
+
+    def record(self, stap: dict, duration: float) -> None:
+        key = _history_key(stap)
+        self._new.setdefault(key, []).append(duration)
+        self._samples[key] = (self._samples.get(key, []) + [duration])[-HISTORY_SIZE:]
+
+    def save(self) -> None:
+        """Voeg nieuwe metingen toe aan de historie op disk en schrijf atomisch weg.
+
+        De historie wordt vlak voor het schrijven opnieuw gelezen, zodat metingen van
+        een gelijktijdige run niet verloren gaan. Fouten zijn nooit fataal.
+        """
+        if not self._new:
+            return
+        with _SAVE_LOCK:
+            merged = self._read()
+            for key, values in self._new.items():
+                merged[key] = (merged.get(key, []) + values)[-HISTORY_SIZE:]
+            try:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self._path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+                tmp_path.write_text(json.dumps(merged, separators=(",", ":")), encoding="utf-8")
+                os.replace(tmp_path, self._path)
+                self._samples = merged
+                self._new = {}
+            except OSError:
+                pass
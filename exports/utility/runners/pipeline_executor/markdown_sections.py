@@ -0,0 +1,155 @@
+"""Markdown Sections - Single-pass tokenizer voor markdown documenten.
+
+Onderdeel van het pipeline_executor package, zodat het meegaat waar de executor
+geïnstalleerd wordt. Een document wordt
+één keer regel voor regel gelezen en omgezet naar een boom van secties (één per
+heading) met een index van velden, zodat opvragen geen nieuwe scan van de tekst kost:
+
+- bold velden: ``**Naam**: waarde`` (per sectie en document-breed, eerste voorkomen)
+- key/value regels: ``naam: waarde`` aan het begin van een regel (document-breed)
+
+Headings binnen fenced code blocks (```) worden genegeerd.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator
+
+_HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*$")
+_BOLD_FIELD = re.compile(r"\*\*([^*\n]+?)\*\*:\s*(.*)")
+_KEY_VALUE = re.compile(r"^([A-Za-z0-9_-]+):\s*(.+?)\s*$")
+
+
+def index_fields(lines: Iterable[str]) -> dict[str, str]:
+    """Indexeer bold velden (``**Naam**: waarde``) in regels; sleutels lowercase, eerste voorkomen wint."""
+    fields: dict[str, str] = {}
+    for line in lines:
+        if "**" not in line:
+            continue
+        for match in _BOLD_FIELD.finditer(line):
+            value = match.group(2).strip()
+            if value:
+                fields.setdefault(match.group(1).strip().lower(), value)
+    return fields
+
+
+@dataclass
+class Section:
+    """Eén heading met de regels eronder (tot de volgende heading) en zijn subsecties."""
+
+    title: str
+    level: int
+    lines: list[str] = field(default_factory=list)
+    children: list[Section] = field(default_factory=list)
+    fields: dict[str, str] = field(default_factory=dict)
+
+    def walk(self) -> Iterator[Section]:
+        """Alle subsecties, depth-first in documentvolgorde."""
+        for child in self.children:
+            yield child
+            yield from child.walk()
+
+    def find(self, title: str) -> Section | None:
+        """Eerste subsectie met deze titel (hoofdletterongevoelig)."""
+        wanted = title.strip().lower()
+        for section in self.walk():
+            if section.title.lower() == wanted:
+                return section
+        return None
+
+    def field(self, name: str, default: str = "") -> str:
+        """Bold veld uit de eigen regels van deze sectie."""
+        return self.fields.get(name.lower(), default)
+
+    def key_values(self) -> dict[str, str]:
+        """Alle ``key: value`` regels uit de eigen regels van deze sectie."""
+        values: dict[str, str] = {}
+        for line in self.lines:
+            line = line.strip()
+            if ":" in line:
+                key, value = line.split(":", 1)
+                values[key.strip()] = value.strip()
+        return values
+
+    def first_line(self) -> str:
+        """Eerste niet-lege regel onder de heading."""
+        for line in self.lines:
+            if line.strip():
+                return line.strip()
+        return ""
+
+
+@dataclass
+class MarkdownDocument:
+    """Geïndexeerde sectieboom van één markdown document."""
+
+    root: Section
+    fields: dict[str, str] = field(default_factory=dict)
+    values: dict[str, str] = field(default_factory=dict)
+
+    def section(self, title: str) -> Section | None:
+        return self.root.find(title)
+
+    def field(self, name: str, default: str = "") -> str:
+        """Bold veld, document-breed (eerste voorkomen)."""
+        return self.fields.get(name.lower(), default)
+
+    def value(self, key: str, default: str = "") -> str:
+        """``key: value`` regel, document-breed (eerste voorkomen, hoofdletterongevoelig)."""
+        return self.values.get(key.lower(), default)
+
+
+def parse_lines(lines: Iterable[str], *, keep_lines: bool = True) -> MarkdownDocument:
+    """Tokenize markdown regels in één pass.
+
+    Met keep_lines=False worden alleen headings en de veldindex bewaard; geschikt
+    voor grote documenten waarvan alleen header-velden nodig zijn.
+    """
+    root = Section(title="", level=0)
+    document = MarkdownDocument(root=root)
+    stack = [root]
+    in_fence = False
+
+    for raw in lines:
+        line = raw.rstrip("\r\n")
+
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+        elif not in_fence:
+            heading = _HEADING.match(line)
+            if heading:
+                section = Section(title=heading.group(2), level=len(heading.group(1)))
+                while stack[-1].level >= section.level:
+                    stack.pop()
+                stack[-1].children.append(section)
+                stack.append(section)
+                continue
+
+        current = stack[-1]
+        if keep_lines:
+            current.lines.append(line)
+
+        if "**" in line:
+            for key, value in index_fields([line]).items():
+                current.fields.setdefault(key, value)
+                document.fields.setdefault(key, value)
+
+        key_value = _KEY_VALUE.match(line)
+        if key_value:
+            document.values.setdefault(key_value.group(1).lower(), key_value.group(2))
+
+    return document
+
+
+def parse_markdown(content: str, *, keep_lines: bool = True) -> MarkdownDocument:
+    """Tokenize markdown tekst die al in geheugen staat."""
+    return parse_lines(content.splitlines(), keep_lines=keep_lines)
+
+
+def read_markdown(path: Path, *, keep_lines: bool = True) -> MarkdownDocument:
+    """Lees en tokenize een markdown bestand regel voor regel (streaming)."""
+    with path.open(encoding="utf-8") as handle:
+        return parse_lines(handle, keep_lines=keep_lines)
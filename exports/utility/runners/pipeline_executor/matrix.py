@@ -0,0 +1,158 @@
+"""Pipeline Executor Matrix - Eén pipeline gelijktijdig uitvoeren voor een reeks inputs."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+from pipeline_executor.artifact_index import ArtifactIndex
+from pipeline_executor.core import ExecutionResult, PolicyError, execute_pipeline_async
+from pipeline_executor.resources import ResourceLimiter
+from pipeline_executor.scheduler import DEFAULT_MAX_WORKERS
+from pipeline_executor.telemetry import Telemetry
+
+
+@dataclass(frozen=True)
+class MatrixInstance:
+    """Eén regel uit het matrix bestand: label + extra_params voor de agents."""
+
+    label: str
+    extra_params: list[str]
+
+
+def _label_from_params(extra_params: list[str]) -> str | None:
+    for i, param in enumerate(extra_params):
+        if param == "--agent-naam" and i + 1 < len(extra_params):
+            return extra_params[i + 1]
+    return None
+
+
+def load_matrix(matrix_path: Path) -> list[MatrixInstance]:
+    """Lees JSONL matrix: per regel een lijst extra_params, of {"extra_params": [...], "label": ...}.
+
+    Zonder label wordt de --agent-naam uit de parameters gebruikt, anders het regelnummer.
+    Labels worden uniek en bestandsnaam-veilig gemaakt (ze komen in journal en log paden).
+    """
+    if not matrix_path.exists():
+        raise PolicyError(f"Matrix bestand niet gevonden: {matrix_path}")
+
+    instances: list[MatrixInstance] = []
+    seen: set[str] = set()
+    for line_num, line in enumerate(matrix_path.read_text(encoding="utf-8").splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            entry = json.loads(line)
+        except ValueError as e:
+            raise PolicyError(f"Matrix regel {line_num} is geen geldige JSON: {e}")
+
+        label = None
+        if isinstance(entry, dict):
+            label = entry.get("label")
+            entry = entry.get("extra_params", [])
+        if not isinstance(entry, list) or not all(isinstance(p, str) for p in entry):
+            raise PolicyError(f"Matrix regel {line_num}: extra_params moet een lijst van strings zijn")
+
+        label = re.sub(r"[^A-Za-z0-9_-]+", "-", str(label or _label_from_params(entry) or line_num)).strip("-")
+        if label in seen:
+            label = f"{label}-{line_num}"
+        seen.add(label)
+        instances.append(MatrixInstance(label=label, extra_params=entry))
+
+    if not instances:
+        raise PolicyError(f"Matrix bestand bevat geen instanties: {matrix_path}")
+    return instances
+
+
+def run_matrix(
+    *,
+    instances: list[MatrixInstance],
+    workspace_root: Path,
+    pipeline_bestand: str,
+    workflow_bestand: str | None,
+    dry_run: bool,
+    stop_on_failure: bool | None,
+    continue_from_step: int | None,
+    max_instances: int = DEFAULT_MAX_WORKERS,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    use_plan_cache: bool = True,
+    in_process: bool = False,
+    use_worker_pool: bool = False,
+    resume: bool = False,
+    use_step_cache: bool = False,
+    adaptive_timeouts: bool = True,
+    telemetry: Telemetry | None = None,
+    resource_limiter: ResourceLimiter | None = None,
+) -> list[tuple[MatrixInstance, ExecutionResult]]:
+    """Synchrone ingang: voer run_matrix_async uit in een eigen event loop.
+
+    De pipeline parameters gelden voor elke instantie (zie execute_pipeline_async);
+    extra_params komen per instantie uit het matrix bestand.
+    """
+    return asyncio.run(run_matrix_async(
+        instances=instances,
+        max_instances=max_instances,
+        max_workers=max_workers,
+        workspace_root=workspace_root,
+        pipeline_bestand=pipeline_bestand,
+        workflow_bestand=workflow_bestand,
+        dry_run=dry_run,
+        stop_on_failure=stop_on_failure,
+        continue_from_step=continue_from_step,
+        use_plan_cache=use_plan_cache,
+        in_process=in_process,
+        use_worker_pool=use_worker_pool,
+        resume=resume,
+        use_step_cache=use_step_cache,
+        adaptive_timeouts=adaptive_timeouts,
+        telemetry=telemetry,
+        resource_limiter=resource_limiter,
+    ))
+
+
+async def run_matrix_async(
+    *,
+    instances: list[MatrixInstance],
+    max_instances: int = DEFAULT_MAX_WORKERS,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    **pipeline_kwargs,
+) -> list[tuple[MatrixInstance, ExecutionResult]]:
+    """Voer de pipeline uit voor alle instanties; resultaten in de volgorde van het matrix bestand.
+
+    Maximaal max_instances instanties lopen tegelijk; max_workers begrenst het aantal
+    stappen dat over alle instanties samen tegelijk draait. Elke instantie heeft een
+    eigen artifact map, journal en step log folder (run_label). Alle instanties delen
+    één event loop en één ArtifactIndex, zodat artifacts die instanties tegelijk in
+    dezelfde folder schrijven aan de juiste instantie worden toegewezen. Een fout in
+    één instantie wordt een gefaald ExecutionResult voor die instantie.
+    """
+    instance_slots = asyncio.Semaphore(max(1, max_instances))
+    step_limiter = asyncio.Semaphore(max(1, max_workers))
+    artifact_index = ArtifactIndex()
+
+    async def _run(instance: MatrixInstance) -> ExecutionResult:
+        async with instance_slots:
+            try:
+                return await execute_pipeline_async(
+                    **pipeline_kwargs,
+                    extra_params=instance.extra_params,
+                    max_workers=max_workers,
+                    run_label=instance.label,
+                    step_limiter=step_limiter,
+                    artifact_index=artifact_index,
+                )
+            except PolicyError as err:
+                return ExecutionResult(success=False, message=f"Policy violation: {err}")
+            except Exception as err:
+                # Eén crashende instantie mag de andere niet afbreken (en het matrix log niet verhinderen)
+                return ExecutionResult(
+                    success=False,
+                    message=f"Unexpected error: {err}",
+                    failures=[{"location": "Execution", "error": str(err), "action": "Stop"}],
+                )
+
+    results = await asyncio.gather(*(_run(instance) for instance in instances))
+    return list(zip(instances, results))
@@ -0,0 +1,149 @@
+"""Pipeline Executor Resources - Concurrency- en rate-limits per resource klasse van stappen."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from dataclasses import asdict, dataclass
+from typing import AsyncIterator
+
+
+@dataclass(frozen=True)
+class ResourceLimit:
+    """Limiet voor één resource klasse: gelijktijdige stappen en (optioneel) starts per minuut."""
+
+    concurrency: int
+    rate_per_minute: float | None = None
+    burst: int | None = None  # Default: concurrency
+
+
+# Stappen met **Resource**: llm raken een LLM backend; zonder limiet volgen 429 stormen
+DEFAULT_RESOURCE_LIMITS = {"llm": ResourceLimit(concurrency=2, rate_per_minute=30.0)}
+
+
+def parse_resource_limit(spec: str) -> tuple[str, ResourceLimit]:
+    """Parse "klasse=concurrency[:per_minuut]" (bijv. "llm=3:60"); ValueError bij ongeldige spec."""
+    resource_class, sep, value = spec.partition("=")
+    concurrency, _, rate = value.partition(":")
+    if not sep or not resource_class.strip() or not concurrency.isdigit() or int(concurrency) < 1:
+        raise ValueError(f"Ongeldige resource limiet '{spec}' (verwacht: klasse=concurrency[:per_minuut])")
+    rate_per_minute = float(rate) if rate else None
+    if rate_per_minute is not None and rate_per_minute <= 0:
+        raise ValueError(f"Ongeldige rate in resource limiet '{spec}'")
+    return resource_class.strip().lower(), ResourceLimit(int(concurrency), rate_per_minute)
+
+
+class TokenBucket:
+    """Token bucket: gemiddeld rate_per_second starts, met bursts tot capacity."""
+
+    def __init__(self, rate_per_second: float, capacity: int) -> None:
+        self.rate = rate_per_second
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock: asyncio.Lock | None = None
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def take(self) -> bool:
+        """Neem één token (wachtenden in volgorde van aankomst); True als er gewacht moest worden."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            throttled = False
+            self._refill()
+            while self._tokens < 1:
+                throttled = True
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+            return throttled
+
+
+@dataclass
+class ResourceMetrics:
+    """Queueing metrics per resource klasse."""
+
+    acquired: int = 0  # Gestarte stappen
+    queued: int = 0  # Stappen die moesten wachten (concurrency of rate)
+    throttled: int = 0  # Stappen die op de token bucket wachtten
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    max_queue_depth: int = 0  # Grootste aantal gelijktijdig wachtende stappen
+    waiting: int = 0
+
+    def as_dict(self) -> dict:
+        data = asdict(self)
+        del data["waiting"]
+        data["total_wait"] = round(self.total_wait, 6)
+        data["max_wait"] = round(self.max_wait, 6)
+        return data
+
+
+class ResourceLimiter:
+    """Admission control voor stappen met een resource klasse.
+
+    Per klasse met een limiet draaien maximaal concurrency stappen tegelijk en starten
+    er gemiddeld niet meer dan rate_per_minute per minuut; stappen zonder (bekende)
+    klasse gaan direct door. Semaphores en buckets worden pas in de event loop
+    aangemaakt, zodat één limiter gedeeld kan worden door alle runs in die loop
+    (matrix mode): de limiet geldt dan voor de backend, niet per run.
+    """
+
+    def __init__(self, limits: dict[str, ResourceLimit] | None = None) -> None:
+        self.limits = dict(DEFAULT_RESOURCE_LIMITS if limits is None else limits)
+        self.metrics: dict[str, ResourceMetrics] = {}
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def _state(self, resource_class: str, limit: ResourceLimit) -> tuple[asyncio.Semaphore, TokenBucket | None]:
+        semaphore = self._semaphores.get(resource_class)
+        if semaphore is None:
+            semaphore = self._semaphores[resource_class] = asyncio.Semaphore(max(1, limit.concurrency))
+            if limit.rate_per_minute:
+                self._buckets[resource_class] = TokenBucket(
+                    limit.rate_per_minute / 60.0, limit.burst or limit.concurrency
+                )
+        return semaphore, self._buckets.get(resource_class)
+
+    @contextlib.asynccontextmanager
+    async def acquire(self, resource_class: str | None) -> AsyncIterator[float]:
+        """Wacht op een plek voor resource_class; levert de wachttijd in seconden."""
+        limit = self.limits.get(resource_class) if resource_class else None
+        if limit is None:
+            yield 0.0
+            return
+
+        metrics = self.metrics.setdefault(resource_class, ResourceMetrics())
+        semaphore, bucket = self._state(resource_class, limit)
+        start = time.monotonic()
+        queued = semaphore.locked()
+        if queued:
+            metrics.waiting += 1
+            metrics.max_queue_depth = max(metrics.max_queue_depth, metrics.waiting)
+        try:
+            await semaphore.acquire()
+        finally:
+            if queued:
+                metrics.waiting -= 1
+
+        try:
+            throttled = await bucket.take() if bucket is not None else False
+        except BaseException:
+            semaphore.release()
+            raise
+
+        wait = time.monotonic() - start
+        metrics.acquired += 1
+        metrics.queued += int(queued or throttled)
+        metrics.throttled += int(throttled)
+        metrics.total_wait += wait
+        metrics.max_wait = max(metrics.max_wait, wait)
+        try:
+            yield wait
+        finally:
+            semaphore.release()
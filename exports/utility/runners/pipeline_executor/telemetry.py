@@ -0,0 +1,198 @@
+"""Pipeline Executor Telemetry - Span events per run in een append-only JSONL bestand.
+
+Aggregatie over alle runs (welke fase domineert de doorlooptijd):
+    python -m pipeline_executor.telemetry [--per-naam]
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator
+
+from pipeline_executor.durations import percentile
+
+# Verhoog bij een wijziging in het record formaat, zodat aggregaties oude records kunnen herkennen
+TELEMETRY_VERSION = 1
+_WORKSPACE_ROOT = Path(__file__).parent.parent.parent
+
+
+def telemetry_path(workspace_root: Path) -> Path:
+    return workspace_root / "log" / "pipeline-executor-telemetry.jsonl"
+
+
+@dataclass
+class Span:
+    """Een open span: kind (pipeline, step, spawn, artifact_detection, step_cache, gate, failure)."""
+
+    id: int
+    kind: str
+    name: str
+    parent: int | None
+    start: float
+    attrs: dict = field(default_factory=dict)
+
+
+class Telemetry:
+    """Span events van één run.
+
+    Elke afgesloten span wordt direct als één JSONL regel toegevoegd aan het
+    telemetry bestand (één write per regel, zodat gelijktijdige runs niet door
+    elkaar schrijven). start/end zijn monotone seconden sinds de start van de run;
+    alleen de pipeline span heeft daarnaast een wall clock starttijd. De events
+    blijven ook in geheugen, zodat het markdown execution log eruit gerenderd kan
+    worden. Met path=None wordt niets geschreven. Schrijffouten zijn nooit fataal.
+    """
+
+    def __init__(self, path: Path | None, *, run_label: str | None = None) -> None:
+        self.path = path
+        self.run_id = uuid.uuid4().hex[:16]
+        self.events: list[dict] = []
+        self._origin = time.monotonic()
+        self._wall_start = time.time()
+        self._next_id = 0
+        self.root = self.start("pipeline", "", parent=None, run_label=run_label)
+
+    def now(self) -> float:
+        return time.monotonic() - self._origin
+
+    def start(self, kind: str, name: str, *, parent: Span | None | bool = True, **attrs) -> Span:
+        """Open een span; parent=True (default) hangt hem onder de pipeline span."""
+        if parent is True:
+            parent = self.root
+        self._next_id += 1
+        return Span(
+            id=self._next_id,
+            kind=kind,
+            name=name,
+            parent=parent.id if parent else None,
+            start=self.now(),
+            attrs=dict(attrs),
+        )
+
+    def end(self, span: Span, **attrs) -> dict:
+        span.attrs.update(attrs)
+        end = self.now()
+        record = {
+            "v": TELEMETRY_VERSION,
+            "run": self.run_id,
+            "id": span.id,
+            "parent": span.parent,
+            "kind": span.kind,
+            "name": span.name,
+            "start": round(span.start, 6),
+            "end": round(end, 6),
+            "duration": round(end - span.start, 6),
+            "attrs": span.attrs,
+        }
+        if span is self.root:
+            record["wall_start"] = self._wall_start
+        self.events.append(record)
+        self._write(record)
+        return record
+
+    @contextlib.contextmanager
+    def span(self, kind: str, name: str, *, parent: Span | None | bool = True, **attrs) -> Iterator[Span]:
+        """Span rond een blok; een exceptie (ook annulering) wordt als error vastgelegd."""
+        span = self.start(kind, name, parent=parent, **attrs)
+        try:
+            yield span
+        except BaseException as err:
+            self.end(span, error=type(err).__name__)
+            raise
+        self.end(span)
+
+    def event(self, kind: str, name: str, *, parent: Span | None | bool = True, **attrs) -> dict:
+        """Momentopname zonder duur (bijv. een failure)."""
+        return self.end(self.start(kind, name, parent=parent, **attrs))
+
+    def finish(self, pipeline_naam: str, **attrs) -> None:
+        """Sluit de pipeline span af (hooguit één keer)."""
+        if any(event["id"] == self.root.id for event in self.events):
+            return
+        self.root.name = pipeline_naam
+        self.end(self.root, **attrs)
+
+    def _write(self, record: dict) -> None:
+        if self.path is None:
+            return
+        line = (json.dumps(record, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
+
+
+def load_events(path: Path, run_id: str | None = None) -> list[dict]:
+    """Lees telemetry records (optioneel van één run); afgebroken regels worden overgeslagen."""
+    events: list[dict] = []
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if run_id is None or record.get("run") == run_id:
+                    events.append(record)
+    except OSError:
+        pass
+    return events
+
+
+def summarize(events: list[dict], *, by_name: bool = False) -> list[tuple[str, int, float, float, float]]:
+    """(fase, aantal, totaal, p50, p95) per kind (of kind/name), aflopend op totale duur."""
+    groups: dict[str, list[float]] = {}
+    for event in events:
+        key = f"{event['kind']}/{event['name']}" if by_name else event["kind"]
+        groups.setdefault(key, []).append(float(event.get("duration", 0.0)))
+    rows = [
+        (key, len(values), sum(values), percentile(values, 0.5), percentile(values, 0.95))
+        for key, values in groups.items()
+    ]
+    return sorted(rows, key=lambda row: row[2], reverse=True)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Pipeline Executor telemetry: duur per fase over alle runs.")
+    parser.add_argument(
+        "--per-naam",
+        action="store_true",
+        default=False,
+        help="Groepeer ook op naam (bijv. step/<agent>, gate/<gate>)",
+    )
+    parser.add_argument(
+        "--workspace",
+        type=str,
+        default=str(_WORKSPACE_ROOT),
+        help="Workspace root (default: workspace van dit script)",
+    )
+    args = parser.parse_args(argv)
+    path = telemetry_path(Path(args.workspace))
+    events = load_events(path)
+    if not events:
+        print(f"Geen telemetry in {path}", file=sys.stderr)
+        return 1
+
+    runs = {event["run"] for event in events if event["kind"] == "pipeline"}
+    print(f"{len(runs)} runs, {len(events)} spans")
+    print(f"{'fase':<40} {'aantal':>7} {'totaal':>10} {'p50':>9} {'p95':>9}")
+    for key, count, total, p50, p95 in summarize(events, by_name=args.per_naam):
+        print(f"{key:<40} {count:>7} {total:>9.2f}s {p50:>8.3f}s {p95:>8.3f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -14,6 +14,13 @@ Output:
     - agents-publicatie.json (root, voor fetching)
     - docs/resultaten/agent-publicaties/agents-publicatie-<datum>.md (archief)
 
+Per agent publiceert de JSON een lijst bestanden (pad, SHA-256, grootte) van charter,
+prompts en runners, zodat fetch_agents alleen gewijzigde bestanden installeert.
+
+Cache:
+    - temp/agent-curator/scan-index.json (charter headers, bestandshashes en folder
+      listings, op pad + mtime; alleen gewijzigde bestanden worden opnieuw gescand)
+
 Traceability:
     Charter: agent-charters/charter.agent-curator.md
     Prompt: .github/prompts/agent-curator-publiceer-agents-overzicht.prompt.md
@@ -22,13 +29,19 @@ Traceability:
 import argparse
 import hashlib
 import json
+import os
 import re
 import sys
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from fnmatch import fnmatch
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
+
+SCAN_INDEX_VERSION = 2
+HEADER_FIELDS = ("Agent", "Value Stream", "Domein", "Agent-soort")
+_HEADER_FIELD = re.compile(r"\*\*([^*\n]+?)\*\*:\s*(.*)")
 
 
 @dataclass
@@ -41,54 +54,243 @@ class AgentMetadata:
     charter_path: Optional[Path] = None
     aantal_prompts: int = 0
     aantal_runners: int = 0
+    bestanden: List[Dict] = field(default_factory=list)  # {"pad", "sha256", "grootte"} per published file
 
 
-def extract_header_field(content: str, field_name: str) -> str:
+def index_header_fields(lines: Iterable[str], wanted: Iterable[str]) -> Dict[str, str]:
+    """Index **FieldName**: value lines in a single pass.
+    
+    Keys are lowercase and the first non-empty occurrence wins. Reading stops as
+    soon as all wanted fields are found.
+    
+    Args:
+        lines: Charter lines (e.g. an open file)
+        wanted: Field names to look for
+        
+    Returns:
+        Lowercase field name -> value for the fields that were found
+    """
+    remaining = {name.lower() for name in wanted}
+    fields: Dict[str, str] = {}
+    for line in lines:
+        if "**" not in line:
+            continue
+        for match in _HEADER_FIELD.finditer(line):
+            value = match.group(2).strip()
+            if value:
+                fields.setdefault(match.group(1).strip().lower(), value)
+        remaining -= fields.keys()
+        if not remaining:
+            break
+    return fields
+
+
+def extract_header_field(fields: Dict[str, str], field_name: str) -> str:
     """Extract a field value from charter header.
     
-    Looks for pattern: **FieldName**: value
+    Looks for pattern: **FieldName**: value (first occurrence, case-insensitive)
+    in the field index of the charter.
     
     Args:
-        content: Charter file content
+        fields: Field index (see index_header_fields)
         field_name: Name of the header field to extract
         
     Returns:
         Extracted field value, empty string if not found
     """
-    pattern = rf"\*\*{re.escape(field_name)}\*\*:\s*(.+?)(?:\n|$)"
-    match = re.search(pattern, content, re.IGNORECASE)
-    return match.group(1).strip() if match else ""
+    return fields.get(field_name.lower(), "")
 
 
-def scan_charter(charter_path: Path) -> Optional[AgentMetadata]:
+class ScanIndex:
+    """Persistent index of charter headers, file hashes and directory listings.
+    
+    Charter and hash entries are keyed by path and validated by (mtime, size); directory
+    listings are keyed by path and validated by the directory mtime, which changes
+    whenever an entry is added, removed or renamed. Republishing therefore only
+    re-reads changed charters and re-lists changed directories. Entries that are
+    not used during a scan are dropped on save.
+    """
+    
+    def __init__(self, workspace_root: Path, data: Optional[Dict] = None):
+        self.workspace_root = workspace_root
+        data = data or {}
+        self._charters: Dict[str, Dict] = data.get("charters", {})
+        self._dirs: Dict[str, Dict] = data.get("dirs", {})
+        self._hashes: Dict[str, Dict] = data.get("hashes", {})
+        self._used_charters: set = set()
+        self._used_dirs: set = set()
+        self._used_hashes: set = set()
+        self.charter_hits = 0
+        self.charter_misses = 0
+    
+    @staticmethod
+    def index_path(workspace_root: Path) -> Path:
+        return workspace_root / "temp" / "agent-curator" / "scan-index.json"
+    
+    @classmethod
+    def load(cls, workspace_root: Path) -> "ScanIndex":
+        """Load the persisted index; an unreadable or outdated index starts empty."""
+        try:
+            data = json.loads(cls.index_path(workspace_root).read_text(encoding="utf-8"))
+            if data.get("version") != SCAN_INDEX_VERSION:
+                data = None
+        except (OSError, ValueError):
+            data = None
+        return cls(workspace_root, data)
+    
+    def save(self) -> None:
+        """Write the entries used in this scan atomically; failures are non-fatal."""
+        data = {
+            "version": SCAN_INDEX_VERSION,
+            "charters": {k: v for k, v in self._charters.items() if k in self._used_charters},
+            "dirs": {k: v for k, v in self._dirs.items() if k in self._used_dirs},
+            "hashes": {k: v for k, v in self._hashes.items() if k in self._used_hashes},
+        }
+        index_path = self.index_path(self.workspace_root)
+        try:
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = index_path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, index_path)
+        except OSError as e:
+            print(f"[WARN] Could not write scan index: {e}")
+    
+    def _key(self, path: Path) -> str:
+        try:
+            return path.relative_to(self.workspace_root).as_posix()
+        except ValueError:
+            return path.as_posix()
+    
+    def list_dir(self, directory: Path) -> Dict[str, bool]:
+        """List a directory, re-reading it only when its mtime changed.
+        
+        Args:
+            directory: Directory to list
+        
+        Returns:
+            Mapping of entry name to is-directory, empty if the directory does not exist
+        """
+        key = self._key(directory)
+        self._used_dirs.add(key)
+        try:
+            mtime = directory.stat().st_mtime_ns
+        except OSError:
+            self._dirs.pop(key, None)
+            return {}
+        
+        entry = self._dirs.get(key)
+        if entry is not None and entry["mtime_ns"] == mtime:
+            return entry["entries"]
+        
+        entries: Dict[str, bool] = {}
+        try:
+            with os.scandir(directory) as it:
+                for dir_entry in it:
+                    entries[dir_entry.name] = dir_entry.is_dir()
+        except OSError as e:
+            print(f"[WARN] Error listing {directory}: {e}")
+            return {}
+        self._dirs[key] = {"mtime_ns": mtime, "entries": entries}
+        return entries
+    
+    def charter_header(self, charter_path: Path) -> Dict[str, str]:
+        """Return the header fields of a charter, re-reading it only when it changed.
+        
+        Args:
+            charter_path: Path to charter file
+        
+        Returns:
+            Header fields as returned by read_charter_header
+        
+        Raises:
+            OSError, UnicodeDecodeError: If the charter cannot be read
+        """
+        key = self._key(charter_path)
+        stat = charter_path.stat()
+        signature = [stat.st_mtime_ns, stat.st_size]
+        self._used_charters.add(key)
+        
+        entry = self._charters.get(key)
+        if entry is not None and entry["signature"] == signature:
+            self.charter_hits += 1
+            return entry["header"]
+        
+        header = read_charter_header(charter_path)
+        self._charters[key] = {"signature": signature, "header": header}
+        self.charter_misses += 1
+        return header
+    
+    def file_hash(self, path: Path) -> Dict:
+        """Return SHA-256 and size of a file, re-hashing it only when it changed.
+        
+        Args:
+            path: Path to file
+        
+        Returns:
+            {"sha256": hex digest, "grootte": size in bytes}
+        
+        Raises:
+            OSError: If the file cannot be read
+        """
+        key = self._key(path)
+        stat = path.stat()
+        signature = [stat.st_mtime_ns, stat.st_size]
+        self._used_hashes.add(key)
+        
+        entry = self._hashes.get(key)
+        if entry is None or entry["signature"] != signature:
+            digest = hashlib.sha256()
+            with path.open("rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(chunk)
+            entry = self._hashes[key] = {"signature": signature, "sha256": digest.hexdigest()}
+        return {"sha256": entry["sha256"], "grootte": stat.st_size}
+
+
+def read_charter_header(charter_path: Path) -> Dict[str, str]:
+    """Read the header fields the curator publishes from a charter.
+    
+    Args:
+        charter_path: Path to charter file
+    
+    Returns:
+        Agent, Value Stream, Domein and Agent-soort (empty string if missing)
+    """
+    # Single streaming pass; only the field index is kept in memory
+    with charter_path.open(encoding="utf-8") as handle:
+        fields = index_header_fields(handle, HEADER_FIELDS)
+    return {field_name: extract_header_field(fields, field_name) for field_name in HEADER_FIELDS}
+
+
+def scan_charter(charter_path: Path, scan_index: Optional[ScanIndex] = None) -> Optional[AgentMetadata]:
     """Scan a charter file and extract metadata from header.
     
     Args:
         charter_path: Path to charter file
-        
+        scan_index: Optional index; unchanged charters are not re-read
+    
     Returns:
         AgentMetadata if successful, None if charter is invalid or missing required fields
     """
     try:
-        content = charter_path.read_text(encoding="utf-8")
+        if scan_index is not None:
+            header = scan_index.charter_header(charter_path)
+        else:
+            header = read_charter_header(charter_path)
         
         # Extract required fields from header
-        naam = extract_header_field(content, "Agent")
-        value_stream = extract_header_field(content, "Value Stream")
+        naam = header["Agent"]
+        value_stream = header["Value Stream"]
         
         if not naam or not value_stream:
             print(f"[WARN] Charter missing required fields: {charter_path.name}")
             return None
         
-        # Extract optional fields
-        domein = extract_header_field(content, "Domein")
-        agent_soort = extract_header_field(content, "Agent-soort")
-        
         return AgentMetadata(
             naam=naam,
             value_stream=value_stream,
-            domein=domein,
-            agent_soort=agent_soort,
+            domein=header["Domein"],
+            agent_soort=header["Agent-soort"],
             charter_path=charter_path
         )
     except UnicodeDecodeError as e:
@@ -102,124 +304,240 @@ def scan_charter(charter_path: Path) -> Optional[AgentMetadata]:
         return None
 
 
-def count_prompts(agent_naam: str, workspace_root: Path) -> int:
+def _prompt_dirs(workspace_root: Path, scan_index: ScanIndex) -> List[Path]:
+    """All prompt locations: .github/prompts/ and exports/*/prompts/."""
+    prompt_dirs = [workspace_root / ".github" / "prompts"]
+    exports_dir = workspace_root / "exports"
+    for name, is_dir in scan_index.list_dir(exports_dir).items():
+        if is_dir:
+            prompt_dirs.append(exports_dir / name / "prompts")
+    return prompt_dirs
+
+
+def find_all_prompts(
+    agent_namen: List[str],
+    workspace_root: Path,
+    scan_index: Optional[ScanIndex] = None
+) -> Dict[str, List[Path]]:
+    """Find prompts for all agents in one pass over all prompt locations.
+    
+    Each file <agent-naam>-<werkwoord>.prompt.md is bucketed by looking up every
+    prefix that ends before a '-' in an index of agent names, so the cost grows
+    with the number of files, not with agents x directories. A file belongs to
+    every agent whose name is such a prefix, exactly like the per-agent glob
+    <agent-naam>-*.prompt.md did.
+    
+    Args:
+        agent_namen: Names of the agents to find prompts for
+        workspace_root: Root directory of workspace
+        scan_index: Optional index with cached directory listings
+        
+    Returns:
+        Mapping of agent name to prompt file paths
+    """
+    scan_index = scan_index or ScanIndex(workspace_root)
+    prompts: Dict[str, List[Path]] = {naam: [] for naam in agent_namen}
+    prefix_index = {os.path.normcase(naam): naam for naam in agent_namen}
+    suffix = os.path.normcase(".prompt.md")
+    
+    for prompts_dir in _prompt_dirs(workspace_root, scan_index):
+        for entry_name, is_dir in scan_index.list_dir(prompts_dir).items():
+            name = os.path.normcase(entry_name)
+            if is_dir or not name.endswith(suffix):
+                continue
+            stem_end = len(name) - len(suffix)
+            dash = name.find("-")
+            while 0 <= dash < stem_end:
+                naam = prefix_index.get(name[:dash])
+                if naam is not None:
+                    prompts[naam].append(prompts_dir / entry_name)
+                dash = name.find("-", dash + 1)
+    
+    return prompts
+
+
+def count_all_prompts(
+    agent_namen: List[str],
+    workspace_root: Path,
+    scan_index: Optional[ScanIndex] = None
+) -> Dict[str, int]:
+    """Count prompts for all agents in one pass over all prompt locations.
+    
+    Args:
+        agent_namen: Names of the agents to count prompts for
+        workspace_root: Root directory of workspace
+        scan_index: Optional index with cached directory listings
+        
+    Returns:
+        Mapping of agent name to number of prompts
+    """
+    prompts = find_all_prompts(agent_namen, workspace_root, scan_index)
+    return {naam: len(paths) for naam, paths in prompts.items()}
+
+
+def find_all_runners(
+    agent_namen: List[str],
+    workspace_root: Path,
+    scan_index: Optional[ScanIndex] = None
+) -> Dict[str, List[Path]]:
+    """Find runners for all agents from one listing of scripts/runners/.
+    
+    Args:
+        agent_namen: Names of the agents to find runners for
+        workspace_root: Root directory of workspace
+        scan_index: Optional index with cached directory listings
+        
+    Returns:
+        Mapping of agent name to runner script and/or runner module folder
+    """
+    scan_index = scan_index or ScanIndex(workspace_root)
+    runners_dir = workspace_root / "scripts" / "runners"
+    entries = scan_index.list_dir(runners_dir)
+    
+    runners = {}
+    for naam in agent_namen:
+        paths = []
+        
+        # Individual runner script
+        if entries.get(f"{naam}.py") is False:
+            paths.append(runners_dir / f"{naam}.py")
+        
+        # Runner module folder; verify it's a valid Python module (has __init__.py)
+        if entries.get(naam) is True:
+            if scan_index.list_dir(runners_dir / naam).get("__init__.py") is False:
+                paths.append(runners_dir / naam)
+        
+        runners[naam] = paths
+    
+    return runners
+
+
+def count_all_runners(
+    agent_namen: List[str],
+    workspace_root: Path,
+    scan_index: Optional[ScanIndex] = None
+) -> Dict[str, int]:
+    """Count runners for all agents from one listing of scripts/runners/.
+    
+    Args:
+        agent_namen: Names of the agents to count runners for
+        workspace_root: Root directory of workspace
+        scan_index: Optional index with cached directory listings
+        
+    Returns:
+        Mapping of agent name to number of runners (script + module = max 2)
+    """
+    runners = find_all_runners(agent_namen, workspace_root, scan_index)
+    return {naam: len(paths) for naam, paths in runners.items()}
+
+
+def _module_files(module_dir: Path, scan_index: ScanIndex) -> List[Path]:
+    """All files of a runner module folder, recursively, without __pycache__."""
+    files = []
+    for name, is_dir in sorted(scan_index.list_dir(module_dir).items()):
+        if name == "__pycache__":
+            continue
+        if is_dir:
+            files.extend(_module_files(module_dir / name, scan_index))
+        else:
+            files.append(module_dir / name)
+    return files
+
+
+def hash_agent_files(paths: List[Path], workspace_root: Path, scan_index: ScanIndex) -> List[Dict]:
+    """Hash the published files of an agent (runner module folders are expanded).
+    
+    Args:
+        paths: Charter, prompt and runner paths of the agent
+        workspace_root: Root directory of workspace
+        scan_index: Index with cached hashes and directory listings
+    
+    Returns:
+        Sorted list of {"pad", "sha256", "grootte"}, pad relative to workspace_root
+    """
+    bestanden = {}
+    for path in paths:
+        for file_path in (_module_files(path, scan_index) if path.is_dir() else [path]):
+            pad = file_path.relative_to(workspace_root).as_posix()
+            try:
+                bestanden[pad] = {"pad": pad, **scan_index.file_hash(file_path)}
+            except OSError as e:
+                print(f"[WARN] Could not hash {pad}: {e}")
+    return [bestanden[pad] for pad in sorted(bestanden)]
+
+
+def count_prompts(agent_naam: str, workspace_root: Path, scan_index: Optional[ScanIndex] = None) -> int:
     """Count prompts for an agent by scanning .github/prompts/ and exports/.
     
     Args:
         agent_naam: Name of the agent
         workspace_root: Root directory of workspace
+        scan_index: Optional index with cached directory listings
         
     Returns:
         Total number of prompts found for this agent
     """
-    count = 0
-    
-    try:
-        # Scan .github/prompts/
-        prompts_dir = workspace_root / ".github" / "prompts"
-        if prompts_dir.exists() and prompts_dir.is_dir():
-            pattern = f"{agent_naam}-*.prompt.md"
-            count += len(list(prompts_dir.glob(pattern)))
-        
-        # Scan exports/*/prompts/
-        exports_dir = workspace_root / "exports"
-        if exports_dir.exists() and exports_dir.is_dir():
-            for value_stream_dir in exports_dir.iterdir():
-                if value_stream_dir.is_dir():
-                    vs_prompts = value_stream_dir / "prompts"
-                    if vs_prompts.exists() and vs_prompts.is_dir():
-                        pattern = f"{agent_naam}-*.prompt.md"
-                        count += len(list(vs_prompts.glob(pattern)))
-    except OSError as e:
-        print(f"[WARN] Error scanning prompts for {agent_naam}: {e}")
-    
-    return count
+    return count_all_prompts([agent_naam], workspace_root, scan_index)[agent_naam]
 
 
-def count_runners(agent_naam: str, workspace_root: Path) -> int:
+def count_runners(agent_naam: str, workspace_root: Path, scan_index: Optional[ScanIndex] = None) -> int:
     """Count runners for an agent by scanning scripts/runners/.
     
     Args:
         agent_naam: Name of the agent
         workspace_root: Root directory of workspace
+        scan_index: Optional index with cached directory listings
         
     Returns:
         Total number of runners found for this agent (script + module = max 2)
     """
-    try:
-        runners_dir = workspace_root / "scripts" / "runners"
-        if not runners_dir.exists() or not runners_dir.is_dir():
-            return 0
-        
-        count = 0
-        
-        # Individual runner script
-        runner_file = runners_dir / f"{agent_naam}.py"
-        if runner_file.exists() and runner_file.is_file():
-            count += 1
-        
-        # Runner module folder
-        runner_module = runners_dir / agent_naam
-        if runner_module.exists() and runner_module.is_dir():
-            # Verify it's a valid Python module (has __init__.py)
-            init_file = runner_module / "__init__.py"
-            if init_file.exists():
-                count += 1
-        
-        return count
-    except OSError as e:
-        print(f"[WARN] Error scanning runners for {agent_naam}: {e}")
-        return 0
+    return count_all_runners([agent_naam], workspace_root, scan_index)[agent_naam]
 
 
-def scan_all_agents(workspace_root: Path) -> List[AgentMetadata]:
+def scan_all_agents(workspace_root: Path, scan_index: Optional[ScanIndex] = None) -> List[AgentMetadata]:
     """Scan all charters in agent-charters/ and exports/.
     
     Args:
         workspace_root: Root directory of workspace
-        
+        scan_index: Optional (persistent) index; unchanged files are not re-scanned
+    
     Returns:
         List of AgentMetadata for all discovered agents
     """
+    scan_index = scan_index or ScanIndex(workspace_root)
     agents = []
     scanned_names = set()  # Track duplicates
     
-    try:
-        # Scan agent-charters/ (agent-enablement agents)
-        charters_dir = workspace_root / "agent-charters"
-        if charters_dir.exists() and charters_dir.is_dir():
-            for charter_file in charters_dir.glob("charter.*.md"):
-                metadata = scan_charter(charter_file)
-                if metadata and metadata.naam not in scanned_names:
-                    metadata.aantal_prompts = count_prompts(metadata.naam, workspace_root)
-                    metadata.aantal_runners = count_runners(metadata.naam, workspace_root)
-                    agents.append(metadata)
-                    scanned_names.add(metadata.naam)
-                elif metadata and metadata.naam in scanned_names:
-                    print(f"[WARN] Duplicate agent found: {metadata.naam} in {charter_file}")
-        
-        # Scan exports/*/charters/ and exports/*/charters-agents/
-        exports_dir = workspace_root / "exports"
-        if exports_dir.exists() and exports_dir.is_dir():
-            for value_stream_dir in exports_dir.iterdir():
-                if not value_stream_dir.is_dir():
-                    continue
-                
-                # Try both charters/ and charters-agents/
-                for charter_subdir in ["charters", "charters-agents"]:
-                    charters_vs = value_stream_dir / charter_subdir
-                    if charters_vs.exists() and charters_vs.is_dir():
-                        for charter_file in charters_vs.glob("charter.*.md"):
-                            metadata = scan_charter(charter_file)
-                            if metadata and metadata.naam not in scanned_names:
-                                metadata.aantal_prompts = count_prompts(metadata.naam, workspace_root)
-                                metadata.aantal_runners = count_runners(metadata.naam, workspace_root)
-                                agents.append(metadata)
-                                scanned_names.add(metadata.naam)
-                            elif metadata and metadata.naam in scanned_names:
-                                print(f"[WARN] Duplicate agent found: {metadata.naam} in {charter_file}")
-    except OSError as e:
-        print(f"[ERROR] Error scanning agents: {e}")
+    # agent-charters/ (agent-enablement agents), then exports/*/charters/ and
+    # exports/*/charters-agents/
+    charter_dirs = [workspace_root / "agent-charters"]
+    exports_dir = workspace_root / "exports"
+    for name, is_dir in scan_index.list_dir(exports_dir).items():
+        if is_dir:
+            charter_dirs.append(exports_dir / name / "charters")
+            charter_dirs.append(exports_dir / name / "charters-agents")
+    
+    for charters_dir in charter_dirs:
+        for name, is_dir in scan_index.list_dir(charters_dir).items():
+            if is_dir or not fnmatch(name, "charter.*.md"):
+                continue
+            charter_file = charters_dir / name
+            metadata = scan_charter(charter_file, scan_index)
+            if metadata and metadata.naam not in scanned_names:
+                agents.append(metadata)
+                scanned_names.add(metadata.naam)
+            elif metadata and metadata.naam in scanned_names:
+                print(f"[WARN] Duplicate agent found: {metadata.naam} in {charter_file}")
+    
+    # Find prompts and runners for all agents together (one pass per location)
+    agent_namen = [agent.naam for agent in agents]
+    prompt_files = find_all_prompts(agent_namen, workspace_root, scan_index)
+    runner_paths = find_all_runners(agent_namen, workspace_root, scan_index)
+    for agent in agents:
+        agent.aantal_prompts = len(prompt_files[agent.naam])
+        agent.aantal_runners = len(runner_paths[agent.naam])
+        paths = [agent.charter_path] + prompt_files[agent.naam] + runner_paths[agent.naam]
+        agent.bestanden = hash_agent_files(paths, workspace_root, scan_index)
     
     return agents
 
@@ -227,8 +545,9 @@ def scan_all_agents(workspace_root: Path) -> List[AgentMetadata]:
 def calculate_digest(agents: List[AgentMetadata]) -> str:
     """Calculate 5-character SHA-256 digest of agents list for change tracking.
     
-    Creates a deterministic hash based on agent names, value streams, and artifact counts.
-    Sorted by agent name to ensure consistent results.
+    Creates a deterministic hash based on agent names, value streams, artifact counts
+    and file hashes, so content changes change the digest too. Sorted by agent name
+    to ensure consistent results.
     
     Args:
         agents: List of agent metadata
@@ -247,7 +566,8 @@ def calculate_digest(agents: List[AgentMetadata]) -> str:
                 "naam": agent.naam,
                 "valueStream": agent.value_stream,
                 "aantalPrompts": agent.aantal_prompts,
-                "aantalRunners": agent.aantal_runners
+                "aantalRunners": agent.aantal_runners,
+                "bestanden": agent.bestanden
             }
             for agent in sorted_agents
         ],
@@ -280,7 +600,8 @@ def generate_json(agents: List[AgentMetadata], workspace_root: Path) -> Dict:
             "naam": agent.naam,
             "valueStream": agent.value_stream,
             "aantalPrompts": agent.aantal_prompts,
-            "aantalRunners": agent.aantal_runners
+            "aantalRunners": agent.aantal_runners,
+            "bestanden": agent.bestanden
         })
     
     # Build locaties structure
@@ -360,7 +681,7 @@ def generate_markdown(agents: List[AgentMetadata], scope: str, filter_waarde: Op
     lines.append(f"  - `exports/*/prompts/` (value stream prompts)\n")
     lines.append(f"  - `scripts/runners/` (runners)\n")
     lines.append(f"- **Value stream bron**: Charter header (`**Value Stream**:` veld)\n")
-    lines.append(f"- **Digest**: 5-karakter SHA-256 hash van agents-lijst (gesorteerd) voor change-tracking\n")
+    lines.append(f"- **Digest**: 5-karakter SHA-256 hash van agents-lijst en bestandshashes (gesorteerd) voor change-tracking\n")
     lines.append(f"- **Traceability**: Agent Curator charter, publiceer-agents-overzicht prompt\n")
     
     return "".join(lines)
@@ -447,6 +768,11 @@ Examples:
         action="store_true",
         help="Include agents in draft status (not yet implemented)"
     )
+    parser.add_argument(
+        "--rebuild-index",
+        action="store_true",
+        help="Ignore the scan index in temp/agent-curator/ and re-scan all files"
+    )
     
     args = parser.parse_args()
     
@@ -467,7 +793,10 @@ Examples:
     try:
         # Scan all agents
         print("[INFO] Scanning agent charters...")
-        all_agents = scan_all_agents(workspace_root)
+        scan_index = ScanIndex(workspace_root) if args.rebuild_index else ScanIndex.load(workspace_root)
+        all_agents = scan_all_agents(workspace_root, scan_index)
+        scan_index.save()
+        print(f"[INFO] Charters: {scan_index.charter_misses} gescand, {scan_index.charter_hits} uit index")
         
         if not all_agents:
             print("[ERROR] No agents found", file=sys.stderr)
@@ -26,6 +26,8 @@ from pathlib import Path
 from typing import List, Tuple
 import shutil
 
+from tree_sync import SyncResult, sync_tree
+
 
 def ensure_dir(path: Path) -> None:
     """Zorg dat de doelmap bestaat.
@@ -47,16 +49,20 @@ def copy_file(src: Path, dest: Path) -> None:
     shutil.copy2(src, dest)
 
 
-def copy_directory(src: Path, dest: Path) -> None:
-    """Kopieer een hele directory recursief.
+def copy_directory(src: Path, dest: Path) -> SyncResult:
+    """Synchroniseer een hele directory recursief naar dest.
+    
+    Alleen gewijzigde bestanden worden gekopieerd en verouderde verwijderd; het
+    resultaat wordt via een staging map op zijn plek gezet (zie tree_sync).
     
     Args:
         src: De bronmap die gekopieerd moet worden.
         dest: Het doelpad waar de map naartoe gekopieerd moet worden.
+    
+    Returns:
+        Aantallen gekopieerde, ongewijzigde en verwijderde bestanden.
     """
-    if dest.exists():
-        shutil.rmtree(dest)
-    shutil.copytree(src, dest)
+    return sync_tree(src, dest)
 
 
 def find_agent_artifacts(
@@ -154,8 +160,11 @@ def copy_agent(
         
         try:
             if src.is_dir():
-                copy_directory(src, dest)
-                print(f"[OK] Directory gekopieerd: {rel_dest}")
+                result = copy_directory(src, dest)
+                print(
+                    f"[OK] Directory gesynchroniseerd: {rel_dest} ({result.copied} gekopieerd, "
+                    f"{result.unchanged} ongewijzigd, {result.deleted} verwijderd)"
+                )
             else:
                 copy_file(src, dest)
                 print(f"[OK] Bestand gekopieerd: {rel_dest}")
@@ -2,12 +2,35 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import re
 import subprocess
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from pipeline_executor.markdown_sections import Section, index_fields, parse_markdown, read_markdown
+from pipeline_executor.artifact_cache import ArtifactMetadataCache
+from pipeline_executor.artifact_index import ArtifactIndex, ArtifactWatch
+from pipeline_executor.durations import DEFAULT_TIMEOUT, DurationHistory
+from pipeline_executor.gates import DirectoryListing, is_glob_pattern
+from pipeline_executor.inprocess import run_if_supported
+from pipeline_executor.journal import JournalState, RunJournal, journal_path, load_journal
+from pipeline_executor.plan_cache import load_plan, plan_cache_path, store_plan
+from pipeline_executor.resources import ResourceLimiter
+from pipeline_executor.scheduler import (
+    DEFAULT_MAX_WORKERS,
+    build_step_graph,
+    estimate_makespan,
+    run_step_graph,
+    transitive_dependencies,
+)
+from pipeline_executor.step_cache import StepResultCache
+from pipeline_executor.step_output import run_streaming
+from pipeline_executor.telemetry import Span, Telemetry, telemetry_path
+from pipeline_executor.worker_pool import WorkerPoolClient, connect_pool
+
 
 @dataclass(frozen=True)
 class ExecutionResult:
@@ -56,9 +79,96 @@ def _policy_gate_pipeline_exists(workspace_root: Path, pipeline_bestand: str) ->
     return pipeline_path
 
 
-def _parse_pipeline(pipeline_path: Path) -> dict:
+# Map Dutch operation names to agent-specific operations
+OPERATION_MAP = {
+    # Agent Smeder operations (Engels)
+    "definieer prompts": "design-prompt",
+    "schrijf rol": "write-role",
+    "schrijf runner": "write-runner",
+    "definieer agent boundary": "zet-agent-boundary",  # Moeder
+}
+
+
+def _resolve_operation(step_title: str) -> str | None:
+    """Bepaal runner-operatie uit staptitel (format: "Agent Name - Operation")."""
+    if " - " not in step_title:
+        return None
+    
+    operation_raw = step_title.split(" - ", 1)[1].strip()
+    operation_key = operation_raw.lower()
+    return OPERATION_MAP.get(operation_key, operation_raw.lower().replace(" ", "-"))
+
+
+_STEP_TITLE = re.compile(r'Stap\s+(\d+):\s+(.+)')
+_GATE_MARKER = re.compile(r'\[GATE\s+(\d+):\s+([^\]]+)\]')
+
+
+def _step_lines(section: Section) -> list[str]:
+    """Regels van een stap tot de '---' scheiding (stappen worden gescheiden door '---').
+
+    Subsecties (#### ...) horen bij de stap: hun heading en regels tellen mee, zodat
+    een gate of veld na een subsectie niet wegvalt.
+    """
+    lines: list[str] = []
+    for part in (section, *section.walk()):
+        if part is not section:
+            lines.append(f"{'#' * part.level} {part.title}")
+        for line in part.lines:
+            if line.strip() == "---":
+                return lines
+            lines.append(line)
+    return lines
+
+
+def _parse_gate(step_lines: list[str], step_num: int) -> dict | None:
+    """Parse [GATE N: naam] blok binnen een stap."""
+    for index, line in enumerate(step_lines):
+        marker = _GATE_MARKER.search(line)
+        if marker:
+            break
+    else:
+        return None
+    
+    # Het gate blok loopt tot de volgende heading
+    gate_lines = [line[marker.end():]]
+    for gate_line in step_lines[index + 1:]:
+        if gate_line.startswith("##"):
+            break
+        gate_lines.append(gate_line)
+    gate_fields = index_fields(gate_lines)
+    
+    # Extract gate type
+    type_match = re.match(r'\w+', gate_fields.get("type", ""))
+    gate_type = type_match.group(0).lower() if type_match else "validatie"
+    
+    # Extract criteria (simplified - just store the section, up to the next **Veld**)
+    criteria_lines: list[str] | None = None
+    for gate_line in gate_lines:
+        if criteria_lines is None:
+            if "**Criteria**:" in gate_line:
+                criteria_lines = [gate_line.split("**Criteria**:", 1)[1]]
+        elif gate_line.startswith("**"):
+            break
+        else:
+            criteria_lines.append(gate_line)
+    criteria_text = "\n".join(criteria_lines).strip() if criteria_lines else ""
+    
+    return {
+        "number": int(marker.group(1)),
+        "name": marker.group(2).strip(),
+        "after_step": step_num,
+        "type": gate_type,
+        "criteria": criteria_text,
+        "failure_action": gate_fields.get("failure actie", "Stop pipeline"),
+    }
+
+
+def _parse_pipeline(pipeline_path: Path, content: str | None = None) -> dict:
     """Parse pipeline.md bestand - extraheert Uitvoeringsketen en Kwaliteitsgates."""
-    content = pipeline_path.read_text(encoding="utf-8")
+    if content is None:
+        document = read_markdown(pipeline_path)
+    else:
+        document = parse_markdown(content)
     
     # Extract pipeline naam
     naam = pipeline_path.stem.replace("-pipeline", "")
@@ -67,30 +177,34 @@ def _parse_pipeline(pipeline_path: Path) -> dict:
     stappen = []
     gates = []
     
-    # Find Uitvoeringsketen section
-    uitvoering_match = re.search(r'##\s+Uitvoeringsketen\s*\n(.*?)(?=\n##[^#]|\Z)', content, re.DOTALL)
-    if uitvoering_match:
-        uitvoering_text = uitvoering_match.group(1)
-        
-        # Parse individual steps (### Stap X: ...)
-        # Steps are separated by "---" lines
-        step_pattern = r'###\s+Stap\s+(\d+):\s+([^\n]+)\n(.*?)(?=\n---\n|$)'
-        for match in re.finditer(step_pattern, uitvoering_text, re.DOTALL):
-            step_num = int(match.group(1))
-            step_title = match.group(2).strip()
-            step_content = match.group(3)
+    uitvoering = document.section("Uitvoeringsketen")
+    if uitvoering:
+        # Individual steps (### Stap X: ...)
+        for section in uitvoering.walk():
+            title_match = _STEP_TITLE.match(section.title)
+            if not title_match:
+                continue
+            
+            step_num = int(title_match.group(1))
+            step_title = title_match.group(2).strip()
+            step_lines = _step_lines(section)
+            step_fields = index_fields(step_lines)
             
             # Extract agent name from title (format: "Agent Name - Operation")
             agent_match = re.search(r'^([A-Za-z\s]+)', step_title)
             agent_naam = agent_match.group(1).strip().lower().replace(' ', '-') if agent_match else "unknown"
             
             # Extract run mode
-            run_mode_match = re.search(r'\*\*Run mode\*\*:\s*(\w+)', step_content)
-            run_mode = run_mode_match.group(1).lower() if run_mode_match else "sequential"
+            run_mode_match = re.match(r'\w+', step_fields.get("run mode", ""))
+            run_mode = run_mode_match.group(0).lower() if run_mode_match else "sequential"
             
             # Extract duration
-            duration_match = re.search(r'\*\*Geschatte duur\*\*:\s*~?(\d+)', step_content)
-            duration = int(duration_match.group(1)) * 60 if duration_match else 300  # default 5 min
+            duration_match = re.match(r'~?(\d+)', step_fields.get("geschatte duur", ""))
+            duration = int(duration_match.group(1)) * 60 if duration_match else None  # Default: zie _resolve_plan
+            
+            # Extract resource class (bijv. "llm"): begrenst gelijktijdigheid en rate (zie resources)
+            resource_match = re.match(r'[\w-]+', step_fields.get("resource", ""))
+            resource = resource_match.group(0).lower() if resource_match else None
             
             stappen.append({
                 "number": step_num,
@@ -98,36 +212,13 @@ def _parse_pipeline(pipeline_path: Path) -> dict:
                 "agent": agent_naam,
                 "run_mode": run_mode,
                 "duration_estimate": duration,
+                "resource": resource,
             })
             
             # Check for gate after this step
-            gate_pattern = r'\[GATE\s+(\d+):\s+([^\]]+)\](.*?)(?=\n###|\n##|\Z)'
-            gate_match = re.search(gate_pattern, step_content, re.DOTALL)
-            if gate_match:
-                gate_num = int(gate_match.group(1))
-                gate_name = gate_match.group(2).strip()
-                gate_content = gate_match.group(3)
-                
-                # Extract gate type
-                type_match = re.search(r'\*\*Type\*\*:\s*(\w+)', gate_content)
-                gate_type = type_match.group(1).lower() if type_match else "validatie"
-                
-                # Extract criteria (simplified - just store the section)
-                criteria_match = re.search(r'\*\*Criteria\*\*:(.*?)(?=\n\*\*|\Z)', gate_content, re.DOTALL)
-                criteria_text = criteria_match.group(1).strip() if criteria_match else ""
-                
-                # Extract failure action
-                failure_match = re.search(r'\*\*Failure actie\*\*:\s*([^\n]+)', gate_content)
-                failure_action = failure_match.group(1).strip() if failure_match else "Stop pipeline"
-                
-                gates.append({
-                    "number": gate_num,
-                    "name": gate_name,
-                    "after_step": step_num,
-                    "type": gate_type,
-                    "criteria": criteria_text,
-                    "failure_action": failure_action,
-                })
+            gate = _parse_gate(step_lines, step_num)
+            if gate:
+                gates.append(gate)
     
     return {
         "naam": naam,
@@ -138,6 +229,40 @@ def _parse_pipeline(pipeline_path: Path) -> dict:
     }
 
 
+def _resolve_plan(plan: dict) -> dict:
+    """Vul het geparste plan aan met wat niet uit de pipeline tekst komt.
+
+    Operaties (OPERATION_MAP) en de default timeout worden na het laden bepaald en
+    niet gecachet, zodat een wijziging daarin direct geldt, ook voor gecachete plannen.
+    """
+    for stap in plan["stappen"]:
+        stap["operation"] = _resolve_operation(stap["name"])
+        if stap.get("duration_estimate") is None:
+            stap["duration_estimate"] = DEFAULT_TIMEOUT
+    return plan
+
+
+def _load_pipeline(workspace_root: Path, pipeline_path: Path, use_plan_cache: bool) -> dict:
+    """Laad pipeline plan uit de plan cache, of parse en cache het bij een cache miss."""
+    if not use_plan_cache:
+        return _resolve_plan(_parse_pipeline(pipeline_path))
+    
+    raw = pipeline_path.read_bytes()
+    cache_path = plan_cache_path(workspace_root, pipeline_path, raw)
+    plan = load_plan(cache_path)
+    if plan is None:
+        plan = _parse_pipeline(pipeline_path, raw.decode("utf-8"))
+        store_plan(cache_path, plan)
+    return _resolve_plan(plan)
+
+
+def load_pipeline_plan(workspace_root: Path, pipeline_bestand: str, use_plan_cache: bool = True) -> dict:
+    """Policy gates en het (gecachete) plan van een pipeline, zonder iets uit te voeren (zie simulator)."""
+    _policy_gate_workspace_paths(workspace_root)
+    pipeline_path = _policy_gate_pipeline_exists(workspace_root, pipeline_bestand)
+    return _load_pipeline(workspace_root, pipeline_path, use_plan_cache)
+
+
 def _validate_agents_exist(workspace_root: Path, stappen: list[dict]) -> None:
     """Valideer dat alle agents in pipeline bestaan."""
     scripts_dir = workspace_root / "scripts"
@@ -160,15 +285,10 @@ def _extract_agent_naam_from_artifact(artifact_path: Path | None) -> str | None:
         return None
     
     try:
-        content = artifact_path.read_text(encoding="utf-8")
         # Look for "agent-naam: xyz" line
-        match = re.search(r'^agent-naam:\s*(.+)$', content, re.MULTILINE | re.IGNORECASE)
-        if match:
-            return match.group(1).strip()
+        return read_markdown(artifact_path, keep_lines=False).value("agent-naam") or None
     except Exception:
-        pass
-    
-    return None
+        return None
 
 
 def _extract_capability_boundary_from_artifact(artifact_path: Path | None) -> str | None:
@@ -177,11 +297,10 @@ def _extract_capability_boundary_from_artifact(artifact_path: Path | None) -> st
         return None
     
     try:
-        content = artifact_path.read_text(encoding="utf-8")
         # Look for "## Gewenste Capability" section (Moeder format)
-        capability_match = re.search(r'##\s+Gewenste Capability\s*\n\s*(.+)', content, re.MULTILINE)
-        if capability_match:
-            return capability_match.group(1).strip()
+        capability = read_markdown(artifact_path).section("Gewenste Capability")
+        if capability:
+            return capability.first_line() or None
     except Exception:
         pass
     
@@ -194,78 +313,102 @@ def _extract_boundary_fields(artifact_path: Path | None) -> dict[str, str]:
         return {}
     
     try:
-        content = artifact_path.read_text(encoding="utf-8")
-        fields = {}
-        
         # Extract from "## Agent Definitie" section with key: value format
-        definitie_match = re.search(r'##\s+Agent Definitie\s*\n(.*?)(?=\n##|\Z)', content, re.DOTALL)
-        if definitie_match:
-            definitie_text = definitie_match.group(1)
-            
-            # Parse key: value lines
-            for line in definitie_text.split('\n'):
-                line = line.strip()
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    fields[key.strip()] = value.strip()
-        
-        return fields
+        definitie = read_markdown(artifact_path).section("Agent Definitie")
+        return definitie.key_values() if definitie else {}
     except Exception:
         return {}
-    
-    return {}
 
 
-def _detect_output_artifact(workspace_root: Path, agent_naam: str, step_num: int) -> Path | None:
-    """Detect output artifact from agent execution."""
+_KNOWN_RUNNERS = frozenset({"moeder", "agent-smeder", "workflow-architect", "pipeline-executor"})
+
+
+def _artifact_watch(workspace_root: Path, agent_naam: str, step_num: int) -> ArtifactWatch | None:
+    """Bepaal in welke folder (en met welk patroon) een stap zijn output artifact schrijft."""
     # For moeder: boundary files in docs/resultaten/moeder/
     if "moeder" in agent_naam:
-        boundary_dir = workspace_root / "docs" / "resultaten" / "moeder"
-        if boundary_dir.exists():
-            # Find most recently modified .md file
-            md_files = list(boundary_dir.glob("*-boundary.md"))
-            if md_files:
-                return max(md_files, key=lambda p: p.stat().st_mtime)
+        return ArtifactWatch(workspace_root / "docs" / "resultaten" / "moeder", "*-boundary.md")
     
     # For agent-smeder step 2: rol files in governance/rolbeschrijvingen/
     if "smeder" in agent_naam and step_num == 2:
-        rol_dir = workspace_root / "governance" / "rolbeschrijvingen"
-        if rol_dir.exists():
-            md_files = list(rol_dir.glob("*.md"))
-            if md_files:
-                return max(md_files, key=lambda p: p.stat().st_mtime)
+        return ArtifactWatch(workspace_root / "governance" / "rolbeschrijvingen", "*.md")
     
     # For agent-smeder step 3: prompts in .github/prompts/
     if "smeder" in agent_naam and step_num == 3:
-        prompts_dir = workspace_root / ".github" / "prompts"
-        if prompts_dir.exists():
-            md_files = list(prompts_dir.glob("*.prompt.md"))
-            if md_files:
-                return max(md_files, key=lambda p: p.stat().st_mtime)
+        return ArtifactWatch(workspace_root / ".github" / "prompts", "*.prompt.md")
     
-    # For agent-smeder step 4: runner in scripts/
+    # For agent-smeder step 4: runner in scripts/ (exclude known runners)
     if "smeder" in agent_naam and step_num == 4:
-        scripts_dir = workspace_root / "scripts"
-        if scripts_dir.exists():
-            py_files = list(scripts_dir.glob("*.py"))
-            if py_files:
-                # Exclude known runners
-                known_runners = {"moeder", "agent-smeder", "workflow-architect", "pipeline-executor"}
-                py_files = [f for f in py_files if f.stem not in known_runners]
-                if py_files:
-                    return max(py_files, key=lambda p: p.stat().st_mtime)
+        return ArtifactWatch(workspace_root / "scripts", "*.py", _KNOWN_RUNNERS)
     
     return None
 
 
-def _execute_step_sequential(
+def _detect_output_artifact(
+    workspace_root: Path,
+    agent_naam: str,
+    step_num: int,
+    artifact_index: ArtifactIndex | None = None,
+) -> Path | None:
+    """Detect output artifact from agent execution (most recently modified file)."""
+    watch = _artifact_watch(workspace_root, agent_naam, step_num)
+    if watch is None:
+        return None
+    return (artifact_index or ArtifactIndex()).newest(watch)
+
+
+def _pick_output_artifact(changed_artifacts: list[Path], artifact_hint: str | None) -> Path:
+    """Kies output artifact uit gewijzigde bestanden (nieuwste eerst op naam-hint, bijv. agent-naam).
+    
+    Draaien meerdere instanties van een pipeline tegelijk (matrix mode), dan kan een
+    folder ook artifacts van een andere instantie bevatten; de hint houdt ze uit elkaar.
+    """
+    if artifact_hint:
+        matching = [path for path in changed_artifacts if artifact_hint in path.name]
+        if matching:
+            return matching[-1]
+    return changed_artifacts[-1]
+
+
+async def _execute_step(
     workspace_root: Path,
     stap: dict,
     dry_run: bool,
     extra_params: list[str],
     artifacts: dict[int, Path],
+    artifact_cache: ArtifactMetadataCache | None = None,
+    artifact_index: ArtifactIndex | None = None,
+    step_log_dir: Path | None = None,
+    in_process: bool = False,
+    worker_pool: WorkerPoolClient | None = None,
+    step_cache: StepResultCache | None = None,
+    inputs: list[Path] | None = None,
+    timeout: float | None = None,
+    artifact_hint: str | None = None,
+    telemetry: Telemetry | None = None,
+    step_span: Span | None = None,
 ) -> dict:
-    """Voer één stap uit (sequential mode) met parameter doorgifte en artifact chaining."""
+    """Voer één stap uit met parameter doorgifte en artifact chaining.
+    
+    Output artifacts worden gedetecteerd via een eigen venster op de relevante folder:
+    een scan voor de stap en een diff erna (zie ArtifactIndex; bij parallelle stappen
+    op dezelfde folder beslist artifact_hint welke bestanden van deze stap zijn). stdout/stderr worden live
+    naar log/.../stap-<n>-<agent>.log gestreamd; alleen de staart blijft in geheugen.
+    Met in_process wordt main() van de runner direct aangeroepen (zie inprocess);
+    met worker_pool gebeurt dat in een warme worker van de pool (zie worker_pool).
+    Met step_cache wordt een stap met bekende output folder overgeslagen als runner,
+    argumenten en input artifacts (inputs) gelijk zijn aan een eerder geslaagde run;
+    de outputs worden dan uit de cache teruggezet.
+    timeout overschrijft de geschatte duur uit de pipeline-spec (zie durations).
+    artifact_hint (bijv. de agent-naam) kiest het output artifact als er meerdere wijzigden.
+    Blokkerend werk (hashing, in-process/worker pool runs) draait in een thread, zodat de
+    event loop vrij blijft; alleen subprocess stappen zijn halverwege te annuleren.
+    Snapshot, step cache, spawn en artifact detectie worden als spans onder step_span
+    vastgelegd (zie telemetry).
+    """
+    artifact_cache = artifact_cache or ArtifactMetadataCache()
+    artifact_index = artifact_index or ArtifactIndex()
+    telemetry = telemetry or Telemetry(None)
     agent_naam = stap.get("agent", "unknown")
     step_num = stap.get("number", 0)
     step_name = stap.get("name", agent_naam)
@@ -287,22 +430,9 @@ def _execute_step_sequential(
     runner_path = workspace_root / "scripts" / f"{agent_naam}.py"
     command = ["python", str(runner_path)]
     
-    # Add agent-specific operation (extracted from step name if present)
-    # Format: "Agent Name - Operation" → extract operation
-    if " - " in step_name:
-        operation_raw = step_name.split(" - ", 1)[1].strip()
-        
-        # Map Dutch operation names to agent-specific operations
-        operation_map = {
-            # Agent Smeder operations (Engels)
-            "definieer prompts": "design-prompt",
-            "schrijf rol": "write-role",
-            "schrijf runner": "write-runner",
-            "definieer agent boundary": "zet-agent-boundary",  # Moeder
-        }
-        
-        operation_key = operation_raw.lower()
-        operation = operation_map.get(operation_key, operation_raw.lower().replace(" ", "-"))
+    # Add agent-specific operation (resolved from step name at parse time)
+    operation = stap.get("operation")
+    if operation:
         command.append(operation)
     
     # For step 1: pass extra_params through
@@ -311,14 +441,12 @@ def _execute_step_sequential(
     
     # For steps 2+: pass artifact from previous step
     if step_num > 1 and (step_num - 1) in artifacts:
-        prev_artifact = artifacts[step_num - 1]
-        
         # Different parameter names based on agent
         if "smeder" in agent_naam:
             # Agent Smeder needs parameters from boundary
             if step_num >= 2 and 1 in artifacts:
                 boundary_artifact = artifacts[1]
-                boundary_fields = _extract_boundary_fields(boundary_artifact)
+                boundary_fields = artifact_cache.get(boundary_artifact, _extract_boundary_fields)
                 
                 # Add all required fields
                 if "agent-naam" in boundary_fields:
@@ -330,57 +458,195 @@ def _execute_step_sequential(
                 if "domein" in boundary_fields:
                     command.extend(["--domein", boundary_fields["domein"]])
     
-    start_time = time.time()
+    watch = _artifact_watch(workspace_root, agent_naam, step_num)
+    with telemetry.span("artifact_detection", agent_naam, parent=step_span, phase="snapshot"):
+        window = artifact_index.begin(watch) if watch else None
     try:
-        result = subprocess.run(
-            command,
-            cwd=workspace_root,
-            capture_output=True,
-            text=True,
-            timeout=stap.get("duration_estimate", 300),
-        )
-        duration = time.time() - start_time
+        # Step cache: alleen stappen waarvan de outputs bekend zijn (artifact watch)
+        fingerprint = None
+        if step_cache is not None and watch is not None and runner_path.is_file():
+            start_time = time.time()
+            with telemetry.span("step_cache", agent_naam, parent=step_span) as cache_span:
+                fingerprint = await asyncio.to_thread(
+                    step_cache.fingerprint, runner_path=runner_path, args=command[2:], inputs=inputs or []
+                )
+                record = step_cache.lookup(fingerprint)
+                restored = await asyncio.to_thread(step_cache.restore, record) if record is not None else None
+                cache_span.attrs["hit"] = restored is not None
+            if restored is not None:
+                artifact_index.end(window, artifact_hint)  # teruggezette outputs toewijzen aan deze stap
+                return {
+                    "number": step_num,
+                    "name": step_name,
+                    "agent": agent_naam,
+                    "command": " ".join(str(c) for c in command),
+                    "duration": time.time() - start_time,
+                    "status": "success",
+                    "exit_code": 0,
+                    "output": "",
+                    "cached": True,
+                    "artifact": workspace_root / record["artifact"] if record.get("artifact") else None,
+                    "changed_artifacts": restored,
+                }
         
-        # Try to detect output artifact
-        output_artifact = _detect_output_artifact(workspace_root, agent_naam, step_num)
+        step_log_dir = step_log_dir or workspace_root / "log" / "pipeline-executor-steps"
+        step_log = step_log_dir / f"stap-{step_num}-{agent_naam}.log"
         
-        return {
-            "number": step_num,
-            "name": step_name,
-            "agent": agent_naam,
-            "command": " ".join(str(c) for c in command),
-            "duration": duration,
-            "status": "success" if result.returncode == 0 else "failed",
-            "exit_code": result.returncode,
-            "output": result.stdout[:500],  # Truncate for log
-            "artifact": output_artifact,
-        }
-    except subprocess.TimeoutExpired:
-        duration = time.time() - start_time
-        return {
-            "number": step_num,
-            "name": step_name,
-            "agent": agent_naam,
-            "command": " ".join(str(c) for c in command),
-            "duration": duration,
-            "status": "timeout",
-            "exit_code": -1,
-            "output": "Command timed out",
-            "artifact": None,
-        }
-    except Exception as e:
-        duration = time.time() - start_time
-        return {
-            "number": step_num,
-            "name": step_name,
-            "agent": agent_naam,
-            "command": " ".join(str(c) for c in command),
-            "duration": duration,
-            "status": "error",
-            "exit_code": -1,
-            "output": str(e),
-            "artifact": None,
-        }
+        timeout = timeout or stap.get("duration_estimate", DEFAULT_TIMEOUT)
+        start_time = time.time()
+        try:
+            with telemetry.span("spawn", agent_naam, parent=step_span, timeout=timeout) as spawn_span:
+                result = None
+                if worker_pool is not None:
+                    spawn_span.attrs["mode"] = "worker_pool"
+                    result = await asyncio.to_thread(
+                        worker_pool.run,
+                        runner_path, command[2:], cwd=workspace_root, log_path=step_log, timeout=timeout
+                    )
+                elif in_process:
+                    # Laden van de runner (import) gebeurt ook in de thread, niet in de event loop
+                    spawn_span.attrs["mode"] = "in_process"
+                    result = await asyncio.to_thread(
+                        run_if_supported, runner_path, command[2:], cwd=workspace_root, log_path=step_log
+                    )
+                if result is None:
+                    spawn_span.attrs["mode"] = "subprocess"
+                    result = await run_streaming(
+                        command,
+                        cwd=workspace_root,
+                        timeout=timeout,
+                        log_path=step_log,
+                    )
+                spawn_span.attrs["exit_code"] = result.returncode
+                spawn_span.attrs["output_bytes"] = result.stdout_bytes + result.stderr_bytes
+            duration = time.time() - start_time
+        
+            # Detect output artifact: newest file created/modified by this step,
+            # else fall back to the newest existing one (runner left it untouched)
+            with telemetry.span("artifact_detection", agent_naam, parent=step_span, phase="diff") as detect_span:
+                changed_artifacts = artifact_index.end(window, artifact_hint) if window else []
+                if changed_artifacts:
+                    output_artifact = _pick_output_artifact(changed_artifacts, artifact_hint)
+                else:
+                    output_artifact = artifact_index.newest(watch) if watch else None
+                detect_span.attrs["changed"] = len(changed_artifacts)
+                detect_span.attrs["attributed"] = window.attributed if window else True
+        
+            # Alleen cachen als de outputs eenduidig van deze stap zijn
+            if fingerprint is not None and result.returncode == 0 and changed_artifacts and window.attributed:
+                await asyncio.to_thread(
+                    step_cache.store, fingerprint, artifact=output_artifact, outputs=changed_artifacts
+                )
+        
+            return {
+                "number": step_num,
+                "name": step_name,
+                "agent": agent_naam,
+                "command": " ".join(str(c) for c in command),
+                "duration": duration,
+                "status": "success" if result.returncode == 0 else "failed",
+                "exit_code": result.returncode,
+                "output": result.stdout,  # Tail only; full output in step log
+                "stderr": result.stderr,
+                "log": step_log,
+                "artifact": output_artifact,
+                "changed_artifacts": changed_artifacts,
+            }
+        except subprocess.TimeoutExpired:
+            duration = time.time() - start_time
+            return {
+                "number": step_num,
+                "name": step_name,
+                "agent": agent_naam,
+                "command": " ".join(str(c) for c in command),
+                "duration": duration,
+                "status": "timeout",
+                "exit_code": -1,
+                "output": "Command timed out",
+                "log": step_log,
+                "artifact": None,
+            }
+        except Exception as e:
+            duration = time.time() - start_time
+            return {
+                "number": step_num,
+                "name": step_name,
+                "agent": agent_naam,
+                "command": " ".join(str(c) for c in command),
+                "duration": duration,
+                "status": "error",
+                "exit_code": -1,
+                "output": str(e),
+                "artifact": None,
+            }
+    finally:
+        if window is not None:
+            artifact_index.discard(window)
+
+
+def _cancelled_step_result(stap: dict) -> dict:
+    """Resultaat voor een stap die geannuleerd werd omdat de run stopte."""
+    agent_naam = stap.get("agent", "unknown")
+    return {
+        "number": stap.get("number", 0),
+        "name": stap.get("name", agent_naam),
+        "agent": agent_naam,
+        "command": f"python scripts/{agent_naam}.py",
+        "duration": 0.0,
+        "status": "cancelled",
+        "exit_code": None,
+        "output": "Geannuleerd na stop van de pipeline",
+        "artifact": None,
+    }
+
+
+def _relative_path(workspace_root: Path, path: Path) -> str:
+    try:
+        return path.relative_to(workspace_root).as_posix()
+    except ValueError:
+        return str(path)
+
+
+def _step_span_attrs(workspace_root: Path, step_result: dict) -> dict:
+    """Velden van een stapresultaat voor de step span (zonder output; die staat in het step log)."""
+    attrs = {
+        key: step_result.get(key)
+        for key in (
+            "number", "name", "agent", "command", "status", "exit_code",
+            "duration", "timeout", "estimated_duration", "resource", "queue_wait",
+        )
+    }
+    attrs["cached"] = bool(step_result.get("cached"))
+    for key in ("log", "artifact"):
+        if step_result.get(key):
+            attrs[key] = _relative_path(workspace_root, step_result[key])
+    return attrs
+
+
+def _restored_note(steps_executed: list[dict]) -> str:
+    """Samenvatting van stappen die uit de step cache zijn teruggezet i.p.v. uitgevoerd."""
+    restored = [str(step.get("number")) for step in steps_executed if step.get("cached")]
+    if not restored:
+        return ""
+    return f" - {len(restored)} stap(pen) uit step cache teruggezet: {', '.join(restored)}"
+
+
+def _finish_run(
+    telemetry: Telemetry, workspace_root: Path, pipeline_naam: str, dry_run: bool, result: ExecutionResult
+) -> ExecutionResult:
+    """Sluit de pipeline span af met de samenvatting van result."""
+    telemetry.finish(
+        pipeline_naam,
+        success=result.success,
+        message=result.message,
+        dry_run=dry_run,
+        total_duration=result.total_duration,
+        steps=len(result.steps_executed),
+        gates=len(result.gates_validated),
+        failures=len(result.failures),
+        artifacts=[_relative_path(workspace_root, artifact) for artifact in result.artifacts],
+    )
+    return result
 
 
 def _validate_gate(
@@ -388,8 +654,16 @@ def _validate_gate(
     gate: dict,
     dry_run: bool,
     artifacts: dict[int, Path] | None = None,
+    artifact_cache: ArtifactMetadataCache | None = None,
+    listing: DirectoryListing | None = None,
 ) -> dict:
-    """Valideer één quality gate - simplified implementation."""
+    """Valideer één quality gate - simplified implementation.
+    
+    Bestanden en patronen uit de criteria worden gecontroleerd tegen listing (één
+    directory listing per folder, gedeeld door alle gates van dezelfde ronde).
+    """
+    artifact_cache = artifact_cache or ArtifactMetadataCache()
+    listing = listing or DirectoryListing()
     gate_naam = gate.get("name", "unknown")
     gate_type = gate.get("type", "validatie")
     criteria = gate.get("criteria", "")
@@ -405,7 +679,7 @@ def _validate_gate(
     # Extract agent-naam from artifacts if available
     agent_naam = None
     if artifacts and 1 in artifacts:
-        boundary_fields = _extract_boundary_fields(artifacts[1])
+        boundary_fields = artifact_cache.get(artifacts[1], _extract_boundary_fields)
         agent_naam = boundary_fields.get("agent-naam")
     
     # Determine base directory from criteria context
@@ -443,14 +717,29 @@ def _validate_gate(
             glob_pattern = re.sub(r'<[^>]+>', '*', glob_pattern)
             
             # Check if any files match the pattern in base_dir
-            matches = list(base_dir.glob(glob_pattern))
+            matches = listing.match(base_dir, glob_pattern)
             if not matches:
                 # Not an error if alternative pattern exists (multi-step OR simple)
                 continue
+        elif is_glob_pattern(file_path_str):
+            # Explicit wildcard (bijv. `<naam>-*.prompt.md` na invullen): minstens één match vereist
+            matches = listing.match(base_dir, file_path_str)
+            if not matches:
+                all_pass = False
+                pattern_path = (base_dir / file_path_str).relative_to(workspace_root).as_posix()
+                failed_checks.append(f"Geen bestand voor patroon: {pattern_path}")
+            else:
+                return {
+                    "name": gate_naam,
+                    "type": gate_type,
+                    "result": "pass",
+                    "criteria": criteria[:100],
+                    "details": f"Gevonden: {matches[0].relative_to(workspace_root).as_posix()}",
+                }
         else:
             # Direct file check in base_dir
             full_path = base_dir / file_path_str
-            if not full_path.exists():
+            if not listing.exists(full_path):
                 all_pass = False
                 failed_checks.append(f"Bestand ontbreekt: {full_path.relative_to(workspace_root).as_posix()}")
             else:
@@ -482,26 +771,117 @@ def execute_pipeline(
     stop_on_failure: bool | None,
     continue_from_step: int | None,
     extra_params: list[str],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    use_plan_cache: bool = True,
+    step_log_dir: Path | None = None,
+    in_process: bool = False,
+    use_worker_pool: bool = False,
+    resume: bool = False,
+    use_step_cache: bool = False,
+    adaptive_timeouts: bool = True,
+    run_label: str | None = None,
+    telemetry: Telemetry | None = None,
+    resource_limiter: ResourceLimiter | None = None,
+    artifact_index: ArtifactIndex | None = None,
 ) -> ExecutionResult:
-    """Voer pipeline uit met parameter doorgifte en artifact chaining."""
+    """Synchrone ingang: voer execute_pipeline_async uit in een eigen event loop.
+
+    Zelfde parameters als execute_pipeline_async, behalve step_limiter (hoort bij een event loop).
+    """
+    return asyncio.run(execute_pipeline_async(
+        workspace_root=workspace_root,
+        pipeline_bestand=pipeline_bestand,
+        workflow_bestand=workflow_bestand,
+        dry_run=dry_run,
+        stop_on_failure=stop_on_failure,
+        continue_from_step=continue_from_step,
+        extra_params=extra_params,
+        max_workers=max_workers,
+        use_plan_cache=use_plan_cache,
+        step_log_dir=step_log_dir,
+        in_process=in_process,
+        use_worker_pool=use_worker_pool,
+        resume=resume,
+        use_step_cache=use_step_cache,
+        adaptive_timeouts=adaptive_timeouts,
+        run_label=run_label,
+        telemetry=telemetry,
+        resource_limiter=resource_limiter,
+        artifact_index=artifact_index,
+    ))
+
+
+async def execute_pipeline_async(
+    *,
+    workspace_root: Path,
+    pipeline_bestand: str,
+    workflow_bestand: str | None,
+    dry_run: bool,
+    stop_on_failure: bool | None,
+    continue_from_step: int | None,
+    extra_params: list[str],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    use_plan_cache: bool = True,
+    step_log_dir: Path | None = None,
+    in_process: bool = False,
+    use_worker_pool: bool = False,
+    resume: bool = False,
+    use_step_cache: bool = False,
+    adaptive_timeouts: bool = True,
+    run_label: str | None = None,
+    step_limiter: asyncio.Semaphore | None = None,
+    telemetry: Telemetry | None = None,
+    resource_limiter: ResourceLimiter | None = None,
+    artifact_index: ArtifactIndex | None = None,
+) -> ExecutionResult:
+    """Voer pipeline uit met parameter doorgifte en artifact chaining.
+
+    Stappen worden als dependency graph ingepland (zie scheduler.build_step_graph):
+    onafhankelijke stappen draaien als asyncio tasks, met maximaal max_workers tegelijk.
+    Faalt een stap met stop-on-failure (of wordt de run onderbroken), dan worden lopende
+    stappen geannuleerd en met status "cancelled" vastgelegd.
+    Het geparste plan wordt gecachet op content hash (zie plan_cache).
+    Volledige stap-output komt in step_log_dir (default: log/pipeline-executor-<naam>-<timestamp>/).
+    Met in_process draaien runners met een main() in dit proces i.p.v. een nieuwe interpreter.
+    Met use_worker_pool gaan stappen naar een draaiende warme worker pool (zie worker_pool);
+    draait er geen, dan valt de executor terug op een subprocess per stap.
+    Elke run schrijft een checkpoint journal (zie journal); met resume of continue_from_step
+    komen artifacts van overgeslagen stappen uit het journal van de vorige run, en met
+    resume worden precies de stappen overgeslagen die daarin als succesvol staan.
+    Met use_step_cache (opt-in) worden ongewijzigde stappen overgeslagen (zie step_cache);
+    het aantal teruggezette stappen staat in de samenvatting.
+    Gemeten duur wordt per agent/operatie bewaard (zie durations); met adaptive_timeouts
+    volgt de timeout van een stap die historie, en een dry-run geeft de geschatte doorlooptijd.
+    run_label en step_limiter zijn voor gelijktijdige instanties (matrix mode): run_label
+    geeft elke instantie een eigen journal en step log folder, step_limiter begrenst het
+    aantal stappen dat over alle instanties heen tegelijk draait.
+    Pipeline, plan, stappen, spawns, artifact detectie en gates worden als spans naar
+    telemetry geschreven (default: log/pipeline-executor-telemetry.jsonl, zie telemetry);
+    de pipeline span wordt alleen afgesloten als de run een ExecutionResult oplevert.
+    Stappen met een resource klasse (**Resource**: llm) wachten op resource_limiter
+    (default: DEFAULT_RESOURCE_LIMITS) voordat ze een worker krijgen; de wachttijd staat
+    per stap in het resultaat en de queueing metrics per klasse in telemetry.
+    """
     start_time = time.time()
+    telemetry = telemetry or Telemetry(telemetry_path(workspace_root), run_label=run_label)
     
     # Policy gates
     _policy_gate_workspace_paths(workspace_root)
     pipeline_path = _policy_gate_pipeline_exists(workspace_root, pipeline_bestand)
     
-    # Parse pipeline
-    pipeline_data = _parse_pipeline(pipeline_path)
+    # Parse pipeline (of laad het gecompileerde plan uit de cache)
+    with telemetry.span("plan", pipeline_path.name, cached=use_plan_cache):
+        pipeline_data = _load_pipeline(workspace_root, pipeline_path, use_plan_cache)
     pipeline_naam = pipeline_data["naam"]
     stappen = pipeline_data["stappen"]
     gates = pipeline_data["gates"]
     
     if not stappen:
-        return ExecutionResult(
+        return _finish_run(telemetry, workspace_root, pipeline_naam, dry_run, ExecutionResult(
             success=False,
             message=f"Pipeline '{pipeline_naam}' bevat geen stappen",
             total_duration=time.time() - start_time,
-        )
+        ))
     
     # Validate agents exist
     _validate_agents_exist(workspace_root, stappen)
@@ -512,42 +892,128 @@ def execute_pipeline(
     failures: list[dict] = []
     artifacts: dict[int, Path] = {}  # step_num -> artifact_path
     all_artifacts: list[Path] = []
+    # Snapshot/diff van artifact folders per stap; gedeeld als meerdere runs tegelijk lopen (matrix)
+    artifact_index = artifact_index or ArtifactIndex()
     
     # Determine start step
     start_step = continue_from_step if continue_from_step else 1
+    completed = {s.get("number", 0) for s in stappen if s.get("number", 0) < start_step}
     
-    # If starting from a later step, try to find artifacts from skipped steps
+    # Extract agent-naam from extra_params if provided
+    agent_naam_param = None
+    for i, param in enumerate(extra_params):
+        if param == "--agent-naam" and i + 1 < len(extra_params):
+            agent_naam_param = extra_params[i + 1]
+            break
+    
+    # Resume: checkpoint journal van de vorige run bepaalt artifacts (en met resume de herstartpunten)
+    run_naam = f"{pipeline_naam}-{run_label}" if run_label else pipeline_naam
+    journal_file = journal_path(workspace_root, run_naam)
+    previous = load_journal(journal_file) if (resume or start_step > 1) else JournalState()
+    if resume and not continue_from_step:
+        completed = previous.completed_steps()
+    journal_artifacts = previous.artifacts(workspace_root)
+    for step_num in sorted(completed & journal_artifacts.keys()):
+        artifacts[step_num] = journal_artifacts[step_num]
+        all_artifacts.append(journal_artifacts[step_num])
+    
+    # Stappen zonder journal record (run van voor het journal): artifact detecteren
     if start_step > 1:
-        # Extract agent-naam from extra_params if provided
-        agent_naam_param = None
-        for i, param in enumerate(extra_params):
-            if param == "--agent-naam" and i + 1 < len(extra_params):
-                agent_naam_param = extra_params[i + 1]
-                break
-        
         # Try to detect artifacts from previous steps that were skipped
         for skipped_step_num in range(1, start_step):
+            if skipped_step_num in previous.steps:
+                continue
             if skipped_step_num < len(stappen):
                 skipped_stap = stappen[skipped_step_num - 1]  # 0-indexed
                 skipped_agent = skipped_stap.get("agent", "")
                 
                 # Try to find existing artifact
                 if agent_naam_param:
-                    artifact = _detect_output_artifact(workspace_root, skipped_agent, skipped_step_num)
+                    artifact = _detect_output_artifact(workspace_root, skipped_agent, skipped_step_num, artifact_index)
                     if artifact and artifact.exists():
                         artifacts[skipped_step_num] = artifact
                         all_artifacts.append(artifact)
     
-    for stap in stappen:
+    step_log_dir = step_log_dir or (
+        workspace_root / "log" / f"pipeline-executor-{run_naam}-{time.strftime('%y%m%d-%H-%M-%S')}"
+    )
+    failed_at: str | None = None
+    artifact_cache = ArtifactMetadataCache()  # boundary artifacts worden één keer per run geparst
+    worker_pool = connect_pool(workspace_root) if use_worker_pool and not dry_run else None
+    journal = None if dry_run else RunJournal(workspace_root, journal_file, resume=bool(completed))
+    step_cache = StepResultCache(workspace_root) if use_step_cache and not dry_run else None
+    graph = build_step_graph(stappen)
+    durations = DurationHistory(workspace_root)
+    resource_limiter = resource_limiter or ResourceLimiter()
+    queue_waits: dict[int, float] = {}  # step_num -> wachttijd op de resource klasse
+    
+    def _timeout(stap: dict) -> float:
+        if adaptive_timeouts:
+            return durations.timeout_for(stap)
+        return stap.get("duration_estimate", DEFAULT_TIMEOUT)
+
+    @contextlib.asynccontextmanager
+    async def _admit(stap: dict):
+        """Wacht op de resource klasse van de stap; de wachttijd wordt een queue span."""
+        step_num = stap.get("number", 0)
+        resource = stap.get("resource")
+        if resource is None:
+            yield
+            return
+        queue_span = telemetry.start("queue", resource, step=step_num)
+        try:
+            async with resource_limiter.acquire(resource) as wait:
+                queue_waits[step_num] = wait
+                telemetry.end(queue_span)
+                yield
+        except asyncio.CancelledError:
+            if step_num not in queue_waits:
+                telemetry.end(queue_span, error="CancelledError")
+            raise
+
+    async def _execute(stap: dict) -> dict:
+        dependencies = transitive_dependencies(graph, stap.get("number", 0))
+        timeout = _timeout(stap)
+        step_span = telemetry.start("step", stap.get("agent", "unknown"))
+        try:
+            step_result = await _execute_step(
+                workspace_root,
+                stap,
+                dry_run,
+                extra_params,
+                artifacts,
+                artifact_cache=artifact_cache,
+                artifact_index=artifact_index,
+                step_log_dir=step_log_dir,
+                in_process=in_process,
+                worker_pool=worker_pool,
+                step_cache=step_cache,
+                inputs=[artifacts[n] for n in sorted(dependencies) if n in artifacts],
+                timeout=timeout,
+                artifact_hint=agent_naam_param,
+                telemetry=telemetry,
+                step_span=step_span,
+            )
+        except asyncio.CancelledError:
+            telemetry.end(step_span, **_step_span_attrs(workspace_root, _cancelled_step_result(stap)))
+            raise
+        step_result["timeout"] = timeout
+        step_result["estimated_duration"] = durations.estimate(stap)
+        step_result["resource"] = stap.get("resource")
+        step_result["queue_wait"] = queue_waits.get(stap.get("number", 0), 0.0)
+        telemetry.end(step_span, **_step_span_attrs(workspace_root, step_result))
+        return step_result
+
+    async def _on_step_done(stap: dict, step_result: dict) -> bool:
+        """Verwerk resultaat en gates van een stap; True = geen nieuwe stappen meer starten."""
+        nonlocal failed_at
         step_num = stap.get("number", 0)
-        
-        # Skip steps before continue_from_step
-        if step_num < start_step:
-            continue
-        
-        # Execute step with artifacts from previous steps
-        step_result = _execute_step_sequential(workspace_root, stap, dry_run, extra_params, artifacts)
         steps_executed.append(step_result)
+        if journal is not None:
+            journal.step(step_result)
+        if step_result["status"] in ("success", "timeout") and not step_result.get("cached"):
+            # Een timeout is een ondergrens van de echte duur: de p99 (en dus de timeout) stijgt mee
+            durations.record(stap, step_result["duration"])
         
         # Track artifact if produced
         if step_result.get("artifact"):
@@ -562,24 +1028,24 @@ def execute_pipeline(
                 "action": "Stop pipeline" if stop_on_failure else "Continue",
             }
             failures.append(failure)
+            telemetry.event("failure", failure["location"], **failure)
             
             if stop_on_failure is not False:  # Stop unless explicitly told to continue
-                total_duration = time.time() - start_time
-                return ExecutionResult(
-                    success=False,
-                    message=f"Pipeline '{pipeline_naam}' gefaald bij stap {step_num}",
-                    steps_executed=steps_executed,
-                    gates_validated=gates_validated,
-                    failures=failures,
-                    artifacts=all_artifacts,
-                    total_duration=total_duration,
-                )
+                failed_at = failed_at or f"stap {step_num}"
+                return True
         
-        # Validate gate after this step
+        # Validate gate after this step (één listing per folder voor alle gates van deze stap)
         step_gates = [g for g in gates if g.get("after_step") == step_num]
+        listing = DirectoryListing()
         for gate in step_gates:
-            gate_result = _validate_gate(workspace_root, gate, dry_run, artifacts)
+            with telemetry.span("gate", gate.get("name", "unknown"), after_step=step_num) as gate_span:
+                gate_result = await asyncio.to_thread(
+                    _validate_gate, workspace_root, gate, dry_run, artifacts, artifact_cache, listing
+                )
+                gate_span.attrs.update(gate_result)
             gates_validated.append(gate_result)
+            if journal is not None:
+                journal.gate(gate, gate_result)
             
             # Check gate failure
             if gate_result["result"] == "fail":
@@ -589,27 +1055,75 @@ def execute_pipeline(
                     "action": gate.get("failure_action", "Stop pipeline"),
                 }
                 failures.append(failure)
+                telemetry.event("failure", failure["location"], **failure)
                 
                 if "stop" in gate.get("failure_action", "").lower():
-                    total_duration = time.time() - start_time
-                    return ExecutionResult(
-                        success=False,
-                        message=f"Pipeline '{pipeline_naam}' gefaald bij gate {gate['number']}",
-                        steps_executed=steps_executed,
-                        gates_validated=gates_validated,
-                        failures=failures,
-                        artifacts=all_artifacts,
-                        total_duration=total_duration,
-                    )
+                    failed_at = failed_at or f"gate {gate['number']}"
+                    return True
+        
+        return False
+    
+    # Run steps as a dependency graph: independent steps run concurrently
+    try:
+        if journal is not None:
+            journal.run_start(pipeline_naam, resumed_from=sorted(completed))
+        cancelled = await run_step_graph(
+            stappen=stappen,
+            graph=graph,
+            execute_step=_execute,
+            on_step_done=_on_step_done,
+            completed=completed,
+            max_workers=max_workers,
+            step_limiter=step_limiter,
+            admission=None if dry_run else _admit,
+        )
+        for stap in cancelled:
+            step_result = _cancelled_step_result(stap)
+            steps_executed.append(step_result)
+            if journal is not None:
+                journal.step(step_result)
+        if journal is not None:
+            journal.run_end(not failed_at and not failures)
+    finally:
+        if journal is not None:
+            journal.close()
+        durations.save()
+    for resource, metrics in sorted(resource_limiter.metrics.items()):
+        telemetry.event("resource", resource, **metrics.as_dict())
+    steps_executed.sort(key=lambda s: s.get("number", 0))
+    
+    if failed_at:
+        return _finish_run(telemetry, workspace_root, pipeline_naam, dry_run, ExecutionResult(
+            success=False,
+            message=f"Pipeline '{pipeline_naam}' gefaald bij {failed_at}" + _restored_note(steps_executed),
+            steps_executed=steps_executed,
+            gates_validated=gates_validated,
+            failures=failures,
+            artifacts=all_artifacts,
+            total_duration=time.time() - start_time,
+        ))
     
     total_duration = time.time() - start_time
     
     if dry_run:
-        message = f"Pipeline '{pipeline_naam}' gevalideerd (dry-run mode - {len(stappen)} stappen gecontroleerd)"
+        makespan = estimate_makespan(
+            stappen=stappen,
+            graph=graph,
+            durations={s.get("number", 0): durations.estimate(s) for s in stappen},
+            completed=completed,
+            max_workers=max_workers,
+        )
+        message = (
+            f"Pipeline '{pipeline_naam}' gevalideerd (dry-run mode - {len(stappen)} stappen gecontroleerd, "
+            f"geschatte doorlooptijd {makespan:.0f}s)"
+        )
     else:
-        message = f"Pipeline '{pipeline_naam}' succesvol uitgevoerd ({len(steps_executed)} stappen, {len(gates_validated)} gates, {len(all_artifacts)} artifacts)"
+        message = (
+            f"Pipeline '{pipeline_naam}' succesvol uitgevoerd ({len(steps_executed)} stappen, "
+            f"{len(gates_validated)} gates, {len(all_artifacts)} artifacts)" + _restored_note(steps_executed)
+        )
     
-    return ExecutionResult(
+    return _finish_run(telemetry, workspace_root, pipeline_naam, dry_run, ExecutionResult(
         success=len(failures) == 0,
         message=message,
         steps_executed=steps_executed,
@@ -617,4 +1131,4 @@ def execute_pipeline(
         failures=failures,
         artifacts=all_artifacts,
         total_duration=total_duration,
-    )
+    ))
@@ -0,0 +1,61 @@
+"""Pipeline Executor Gates - Gate validatie tegen één directory listing per folder."""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+
+_GLOB_CHARS = re.compile(r"[*?\[]")
+
+
+def is_glob_pattern(pattern: str) -> bool:
+    return _GLOB_CHARS.search(pattern) is not None
+
+
+@lru_cache(maxsize=512)
+def compile_pattern(pattern: str) -> re.Pattern[str]:
+    """Gecompileerde matcher voor een bestandsnaam-patroon (gedeeld over alle gates)."""
+    return re.compile(fnmatch.translate(os.path.normcase(pattern)))
+
+
+class DirectoryListing:
+    """Folder listings voor één gate ronde.
+
+    Elke folder die door een gate criterium wordt geraakt, wordt hooguit één keer
+    gelezen; alle bestaans-checks en patronen van alle gates in de ronde worden
+    tegen die listing in geheugen geëvalueerd. Een nieuwe ronde (na de volgende
+    stap) begint met een nieuwe DirectoryListing, zodat nieuwe bestanden zichtbaar zijn.
+    """
+
+    def __init__(self) -> None:
+        self._listings: dict[Path, dict[str, str]] = {}
+        self.scans = 0
+
+    def _entries(self, directory: Path) -> dict[str, str]:
+        """normcase(naam) -> naam voor alle entries in directory (leeg als die niet bestaat)."""
+        entries = self._listings.get(directory)
+        if entries is None:
+            self.scans += 1
+            try:
+                with os.scandir(directory) as it:
+                    entries = {os.path.normcase(entry.name): entry.name for entry in it}
+            except OSError:
+                entries = {}
+            self._listings[directory] = entries
+        return entries
+
+    def exists(self, path: Path) -> bool:
+        return os.path.normcase(path.name) in self._entries(path.parent)
+
+    def match(self, base_dir: Path, pattern: str) -> list[Path]:
+        """Bestanden onder base_dir die matchen met pattern (relatief, '/' als scheiding)."""
+        parent, _, name_pattern = pattern.rpartition("/")
+        if is_glob_pattern(parent):
+            return sorted(base_dir.glob(pattern))  # Wildcards in folders: geen enkele listing
+
+        directory = base_dir / parent if parent else base_dir
+        matcher = compile_pattern(name_pattern)
+        return sorted(directory / name for key, name in self._entries(directory).items() if matcher.match(key))
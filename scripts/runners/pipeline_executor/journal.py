@@ -0,0 +1,120 @@
+"""Pipeline Executor Journal - Append-only checkpoint journal per pipeline run."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+def journal_path(workspace_root: Path, pipeline_naam: str) -> Path:
+    return workspace_root / "temp" / "pipeline-executor" / "journals" / f"{pipeline_naam}.jsonl"
+
+
+def _relative(workspace_root: Path, path: Path) -> str:
+    try:
+        return path.relative_to(workspace_root).as_posix()
+    except ValueError:
+        return str(path)
+
+
+@dataclass
+class JournalState:
+    """Staat van een eerdere run, opgebouwd uit de journal records."""
+
+    steps: dict[int, dict] = field(default_factory=dict)  # step_num -> laatste step record
+
+    def completed_steps(self) -> set[int]:
+        """Stappen die succesvol zijn afgerond en hun gates haalden (hoeven bij resume niet opnieuw)."""
+        return {
+            num for num, record in self.steps.items()
+            if record.get("status") == "success" and not record.get("gate_failed")
+        }
+
+    def artifacts(self, workspace_root: Path) -> dict[int, Path]:
+        """step_num -> output artifact van succesvolle stappen."""
+        return {
+            num: workspace_root / record["artifact"]
+            for num, record in self.steps.items()
+            if record.get("status") == "success" and record.get("artifact")
+        }
+
+
+def load_journal(path: Path) -> JournalState:
+    """Lees journal; een afgebroken laatste regel (crash tijdens schrijven) wordt genegeerd."""
+    state = JournalState()
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                if record.get("type") == "step":
+                    state.steps[record["number"]] = record
+                elif record.get("type") == "gate" and record.get("result") == "fail":
+                    if record.get("after_step") in state.steps:
+                        state.steps[record["after_step"]]["gate_failed"] = True
+    except OSError:
+        pass
+    return state
+
+
+class RunJournal:
+    """Append-only journal: elk record wordt direct geschreven en met fsync vastgelegd.
+
+    Een nieuwe run begint een nieuw journal; een resume schrijft verder in het
+    bestaande, zodat na een crash altijd bekend is welke stappen klaar waren.
+    """
+
+    def __init__(self, workspace_root: Path, path: Path, *, resume: bool) -> None:
+        self.workspace_root = workspace_root
+        self.path = path
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = path.open("a" if resume else "w", encoding="utf-8")
+
+    def _append(self, record: dict) -> None:
+        record["time"] = time.time()
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def run_start(self, pipeline_naam: str, *, resumed_from: list[int] | None = None) -> None:
+        self._append({"type": "run_start", "pipeline": pipeline_naam, "resumed_from": resumed_from})
+
+    def step(self, step_result: dict) -> None:
+        """Leg command, status, duur en geproduceerde artifacts van een stap vast."""
+        artifact = step_result.get("artifact")
+        self._append({
+            "type": "step",
+            "number": step_result.get("number"),
+            "agent": step_result.get("agent"),
+            "command": step_result.get("command"),
+            "status": step_result.get("status"),
+            "exit_code": step_result.get("exit_code"),
+            "duration": step_result.get("duration"),
+            "artifact": _relative(self.workspace_root, artifact) if artifact else None,
+            "changed_artifacts": [
+                _relative(self.workspace_root, path) for path in step_result.get("changed_artifacts", [])
+            ],
+        })
+
+    def gate(self, gate: dict, gate_result: dict) -> None:
+        self._append({
+            "type": "gate",
+            "number": gate.get("number"),
+            "after_step": gate.get("after_step"),
+            "result": gate_result.get("result"),
+        })
+
+    def run_end(self, success: bool) -> None:
+        self._append({"type": "run_end", "success": success})
+
+    def close(self) -> None:
+        self._file.close()
@@ -0,0 +1,303 @@
+"""Pipeline Executor Simulator - Discrete-event simulatie van pipeline runs voor capaciteitsplanning.
+
+Speelt één of meer pipelines (elk eventueel meerdere instanties, zoals matrix mode)
+na op een virtuele klok: stappen volgen de dependency graph van de scheduler, krijgen
+een worker uit een gedeelde pool en respecteren de resource limieten (concurrency en
+token bucket). De duur van een stap wordt getrokken uit de gemeten historie (zie
+durations), anders de "Geschatte duur" uit de pipeline-spec. Er draait geen agent.
+
+Usage (vanuit scripts/):
+    python -m pipeline_executor.simulator <pipeline.md> [<pipeline.md> ...]
+        [--instances N] [--workers N] [--matrix-concurrency N]
+        [--resource-limit llm=2:30] [--runs N] [--seed N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import itertools
+import random
+import statistics
+import sys
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+from pipeline_executor.core import PolicyError, load_pipeline_plan
+from pipeline_executor.durations import DEFAULT_TIMEOUT, DurationHistory, percentile
+from pipeline_executor.resources import DEFAULT_RESOURCE_LIMITS, ResourceLimit, parse_resource_limit
+from pipeline_executor.scheduler import DEFAULT_MAX_WORKERS, build_step_graph
+
+DEFAULT_RUNS = 100
+NO_RESOURCE = "(geen)"  # Wachttijd van stappen zonder resource klasse: alleen op een worker
+_WORKSPACE_ROOT = Path(__file__).parent.parent.parent
+
+
+@dataclass(frozen=True)
+class SimulatedPipeline:
+    """Eén pipeline instantie in de simulatie."""
+
+    label: str
+    stappen: list[dict]
+    graph: dict[int, set[int]]
+
+
+@dataclass
+class SimulationRun:
+    """Uitkomst van één replicatie."""
+
+    makespan: float
+    waits: dict[str, list[float]] = field(default_factory=dict)  # resource klasse -> wachttijden
+    worker_busy: float = 0.0
+    resource_busy: dict[str, float] = field(default_factory=dict)
+
+
+class _Bucket:
+    """Token bucket op de virtuele klok (zelfde semantiek als resources.TokenBucket)."""
+
+    def __init__(self, rate_per_second: float, capacity: int) -> None:
+        self.rate = rate_per_second
+        self.capacity = max(1, capacity)
+        self.tokens = float(self.capacity)
+        self.updated = 0.0
+
+    def available_at(self, now: float) -> float:
+        """Refill tot now; tijdstip waarop er een token is (now als er al een is)."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        return now if self.tokens >= 1 else now + (1 - self.tokens) / self.rate
+
+
+def simulate_once(
+    pipelines: list[SimulatedPipeline],
+    *,
+    workers: int,
+    limits: dict[str, ResourceLimit],
+    sample_duration: Callable[[dict], float],
+    max_instances: int | None = None,
+) -> SimulationRun:
+    """Eén discrete-event replicatie; instanties starten in volgorde, max_instances tegelijk.
+
+    Klare stappen worden in volgorde van gereedkomen (FIFO) toegelaten zodra er een
+    worker vrij is en hun resource klasse ruimte en een token heeft. Een stap die op
+    zijn klasse wacht, houdt andere klare stappen niet tegen (zoals de admission in
+    de scheduler).
+    """
+    now = 0.0
+    seq = itertools.count()
+    pending_instances = deque(range(len(pipelines)))
+    active: set[int] = set()
+    done: dict[int, set[int]] = {i: set() for i in range(len(pipelines))}
+    released: dict[int, set[int]] = {i: set() for i in range(len(pipelines))}
+    ready: list[tuple[float, int, int, dict]] = []  # (klaar sinds, volgorde, instantie, stap)
+    running: list[tuple[float, int, int, dict, float]] = []  # heap: (einde, volgorde, instantie, stap, duur)
+    buckets = {
+        name: _Bucket(limit.rate_per_minute / 60.0, limit.burst or limit.concurrency)
+        for name, limit in limits.items() if limit.rate_per_minute
+    }
+    in_use = {name: 0 for name in limits}
+    busy_workers = 0
+    result = SimulationRun(makespan=0.0)
+
+    def _release_ready(instance: int) -> None:
+        pipeline = pipelines[instance]
+        for stap in pipeline.stappen:
+            step_num = stap.get("number", 0)
+            if step_num not in released[instance] and pipeline.graph.get(step_num, set()) <= done[instance]:
+                released[instance].add(step_num)
+                ready.append((now, next(seq), instance, stap))
+
+    while True:
+        while pending_instances and (max_instances is None or len(active) < max_instances):
+            instance = pending_instances.popleft()
+            active.add(instance)
+            _release_ready(instance)
+
+        # Toelaten: FIFO, met overslaan van stappen die op hun resource klasse wachten
+        wake: float | None = None
+        still_ready = []
+        for item in ready:
+            ready_since, _, instance, stap = item
+            resource = stap.get("resource")
+            limit = limits.get(resource) if resource else None
+            if busy_workers >= workers:
+                still_ready.append(item)
+                continue
+            if limit is not None:
+                if in_use[resource] >= limit.concurrency:
+                    still_ready.append(item)
+                    continue
+                bucket = buckets.get(resource)
+                if bucket is not None:
+                    available = bucket.available_at(now)
+                    if available > now:
+                        wake = available if wake is None else min(wake, available)
+                        still_ready.append(item)
+                        continue
+                    bucket.tokens -= 1
+                in_use[resource] += 1
+            duration = sample_duration(stap)
+            busy_workers += 1
+            result.waits.setdefault(resource or NO_RESOURCE, []).append(now - ready_since)
+            heapq.heappush(running, (now + duration, next(seq), instance, stap, duration))
+        ready = still_ready
+
+        if not running and wake is None:
+            break  # Alles klaar (of onvervulbare afhankelijkheden)
+
+        now = min(running[0][0] if running else float("inf"), wake if wake is not None else float("inf"))
+        while running and running[0][0] <= now:
+            _, _, instance, stap, duration = heapq.heappop(running)
+            busy_workers -= 1
+            result.worker_busy += duration
+            resource = stap.get("resource")
+            if resource in in_use:
+                in_use[resource] -= 1
+                result.resource_busy[resource] = result.resource_busy.get(resource, 0.0) + duration
+            done[instance].add(stap.get("number", 0))
+            if len(done[instance]) == len(pipelines[instance].stappen):
+                active.discard(instance)
+            else:
+                _release_ready(instance)
+
+    result.makespan = now
+    return result
+
+
+def duration_sampler(durations: DurationHistory, rng: random.Random) -> Callable[[dict], float]:
+    """Trek een duur uit de gemeten historie van de agent/operatie, anders de geschatte duur."""
+
+    def _sample(stap: dict) -> float:
+        samples = durations.samples(stap)
+        if samples:
+            return rng.choice(samples)
+        return stap.get("duration_estimate", DEFAULT_TIMEOUT)
+
+    return _sample
+
+
+def simulate(
+    pipelines: list[SimulatedPipeline],
+    *,
+    workers: int = DEFAULT_MAX_WORKERS,
+    limits: dict[str, ResourceLimit] | None = None,
+    durations: DurationHistory,
+    runs: int = DEFAULT_RUNS,
+    seed: int = 0,
+    max_instances: int | None = None,
+) -> list[SimulationRun]:
+    """Monte Carlo: runs replicaties met getrokken stapduren (reproduceerbaar via seed)."""
+    rng = random.Random(seed)
+    sample = duration_sampler(durations, rng)
+    limits = DEFAULT_RESOURCE_LIMITS if limits is None else limits
+    return [
+        simulate_once(pipelines, workers=workers, limits=limits, sample_duration=sample, max_instances=max_instances)
+        for _ in range(max(1, runs))
+    ]
+
+
+def format_report(
+    results: list[SimulationRun], *, workers: int, limits: dict[str, ResourceLimit]
+) -> list[str]:
+    """Makespan, wachttijden per resource klasse en bezettingsgraad, over alle replicaties."""
+    makespans = [run.makespan for run in results]
+    lines = [
+        f"Replicaties: {len(results)}, workers: {workers}",
+        f"Makespan: gemiddeld {statistics.fmean(makespans):.1f}s, "
+        f"p50 {percentile(makespans, 0.5):.1f}s, p95 {percentile(makespans, 0.95):.1f}s, "
+        f"max {max(makespans):.1f}s",
+        "",
+        f"{'wachttijd':<16} {'stappen':>8} {'gemiddeld':>10} {'p95':>9} {'max':>9}",
+    ]
+    waits: dict[str, list[float]] = {}
+    for run in results:
+        for resource, values in run.waits.items():
+            waits.setdefault(resource, []).extend(values)
+    for resource, values in sorted(waits.items()):
+        lines.append(
+            f"{resource:<16} {len(values) // len(results):>8} {statistics.fmean(values):>9.1f}s "
+            f"{percentile(values, 0.95):>8.1f}s {max(values):>8.1f}s"
+        )
+
+    lines.append("")
+    lines.append(f"{'bezetting':<16} {'capaciteit':>10} {'gemiddeld':>10}")
+    worker_utilization = [run.worker_busy / (workers * run.makespan) for run in results if run.makespan > 0]
+    if worker_utilization:
+        lines.append(f"{'workers':<16} {workers:>10} {statistics.fmean(worker_utilization):>10.0%}")
+    for resource, limit in sorted(limits.items()):
+        utilization = [
+            run.resource_busy.get(resource, 0.0) / (limit.concurrency * run.makespan)
+            for run in results if run.makespan > 0
+        ]
+        if resource in waits and utilization:
+            lines.append(f"{resource:<16} {limit.concurrency:>10} {statistics.fmean(utilization):>10.0%}")
+    return lines
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Simuleer pipeline runs voor capaciteitsplanning (voert geen agents uit).")
+    parser.add_argument("pipeline_bestanden", nargs="+", help="Pipeline documenten (relatief aan de workspace)")
+    parser.add_argument("--instances", type=int, default=1, help="Instanties per pipeline (zoals matrix regels)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Aantal workers, gedeeld door alle instanties (default: {DEFAULT_MAX_WORKERS})",
+    )
+    parser.add_argument(
+        "--matrix-concurrency",
+        type=int,
+        default=None,
+        help="Maximaal aantal instanties tegelijk (default: allemaal)",
+    )
+    parser.add_argument(
+        "--resource-limit",
+        type=parse_resource_limit,
+        action="append",
+        default=[],
+        metavar="KLASSE=N[:PER_MINUUT]",
+        help="Resource limiet zoals bij pipeline-executor (herhaalbaar)",
+    )
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help=f"Aantal replicaties (default: {DEFAULT_RUNS})")
+    parser.add_argument("--seed", type=int, default=0, help="Seed voor het trekken van stapduren")
+    parser.add_argument(
+        "--workspace",
+        type=str,
+        default=str(_WORKSPACE_ROOT),
+        help="Workspace root (default: workspace van dit script)",
+    )
+    args = parser.parse_args(argv)
+    workspace_root = Path(args.workspace)
+
+    pipelines: list[SimulatedPipeline] = []
+    try:
+        for pipeline_bestand in args.pipeline_bestanden:
+            plan = load_pipeline_plan(workspace_root, pipeline_bestand)
+            graph = build_step_graph(plan["stappen"])
+            for index in range(max(1, args.instances)):
+                label = plan["naam"] if args.instances <= 1 else f"{plan['naam']}-{index + 1}"
+                pipelines.append(SimulatedPipeline(label=label, stappen=plan["stappen"], graph=graph))
+    except PolicyError as err:
+        print(f"Policy violation: {err}", file=sys.stderr)
+        return 1
+
+    limits = {**DEFAULT_RESOURCE_LIMITS, **dict(args.resource_limit)}
+    results = simulate(
+        pipelines,
+        workers=max(1, args.workers),
+        limits=limits,
+        durations=DurationHistory(workspace_root),
+        runs=args.runs,
+        seed=args.seed,
+        max_instances=args.matrix_concurrency,
+    )
+    print(f"Pipelines: {', '.join(p.label for p in pipelines[:5])}{' ...' if len(pipelines) > 5 else ''}")
+    for line in format_report(results, workers=max(1, args.workers), limits=limits):
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
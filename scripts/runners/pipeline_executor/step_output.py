@@ -0,0 +1,115 @@
+"""Pipeline Executor Step Output - Streaming subprocess executie met begrensd geheugen (asyncio)."""
+
+from __future__ import annotations
+
+import asyncio
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO
+
+# Hoeveel bytes van het einde van stdout/stderr in geheugen blijven (rest staat alleen op disk)
+OUTPUT_TAIL_BYTES = 4096
+_CHUNK_SIZE = 64 * 1024
+
+
+class OutputTail:
+    """Ring buffer met vaste capaciteit: bewaart alleen de laatste capacity bytes."""
+
+    def __init__(self, capacity: int = OUTPUT_TAIL_BYTES) -> None:
+        self.capacity = capacity
+        self.total_bytes = 0
+        self._buffer = bytearray()
+
+    def append(self, chunk: bytes) -> None:
+        self.total_bytes += len(chunk)
+        self._buffer += chunk[-self.capacity:]
+        overflow = len(self._buffer) - self.capacity
+        if overflow > 0:
+            del self._buffer[:overflow]
+
+    def text(self) -> str:
+        return self._buffer.decode("utf-8", errors="replace")
+
+
+@dataclass(frozen=True)
+class StreamResult:
+    """Resultaat van een gestreamde subprocess run."""
+
+    returncode: int
+    stdout: str
+    stderr: str
+    stdout_bytes: int
+    stderr_bytes: int
+
+
+async def _pump(stream: asyncio.StreamReader, tail: OutputTail, log_file: IO[bytes]) -> None:
+    """Lees stream in chunks zodra data beschikbaar is en tee naar log file + ring buffer."""
+    while True:
+        chunk = await stream.read(_CHUNK_SIZE)
+        if not chunk:
+            break
+        tail.append(chunk)
+        log_file.write(chunk)
+        log_file.flush()
+
+
+def _kill(process: asyncio.subprocess.Process) -> None:
+    try:
+        process.kill()
+    except ProcessLookupError:
+        pass  # Al beëindigd
+
+
+async def run_streaming(
+    command: list[str],
+    *,
+    cwd: Path,
+    timeout: float | None,
+    log_path: Path,
+    tail_bytes: int = OUTPUT_TAIL_BYTES,
+) -> StreamResult:
+    """Voer command uit en stream stdout/stderr live naar log_path.
+
+    In geheugen blijft per stream alleen een ring buffer van tail_bytes; de volledige
+    output staat in het logbestand. Bij overschrijden van timeout wordt het proces
+    gestopt en subprocess.TimeoutExpired geraised. Wordt de aanroeper geannuleerd
+    (stop-on-failure, Ctrl-C), dan wordt het proces gestopt en gaat de annulering door.
+    """
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    stdout_tail = OutputTail(tail_bytes)
+    stderr_tail = OutputTail(tail_bytes)
+
+    with log_path.open("wb") as log_file:
+        log_file.write(f"$ {' '.join(str(c) for c in command)}\n".encode("utf-8"))
+        log_file.flush()
+
+        process = await asyncio.create_subprocess_exec(
+            *command, cwd=cwd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        pumps = asyncio.gather(
+            _pump(process.stdout, stdout_tail, log_file),
+            _pump(process.stderr, stderr_tail, log_file),
+        )
+
+        try:
+            returncode = await asyncio.wait_for(process.wait(), timeout)
+        except asyncio.TimeoutError:
+            _kill(process)
+            await process.wait()
+            await pumps
+            raise subprocess.TimeoutExpired(command, timeout)
+        except asyncio.CancelledError:
+            _kill(process)
+            await process.wait()
+            await pumps
+            raise
+        await pumps
+
+    return StreamResult(
+        returncode=returncode,
+        stdout=stdout_tail.text(),
+        stderr=stderr_tail.text(),
+        stdout_bytes=stdout_tail.total_bytes,
+        stderr_bytes=stderr_tail.total_bytes,
+    )
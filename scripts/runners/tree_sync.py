@@ -0,0 +1,140 @@
+"""Tree Sync - Synchroniseer een directory naar een doel zonder alles opnieuw te kopiëren.
+
+Gedeeld door de runners (copy_agent, ...). Bestanden worden vergeleken op grootte en
+mtime en bij twijfel (zelfde grootte, andere mtime) op SHA-256. Alleen gewijzigde
+bestanden worden gekopieerd, verouderde verdwijnen. Is er iets gewijzigd, dan wordt
+het resultaat in een staging map naast het doel opgebouwd (ongewijzigde bestanden
+als hardlink uit het doel) en daarna met twee renames verwisseld met het doel. Het
+doel bevat dus nooit een mix van oude en nieuwe bestanden, maar ontbreekt tussen
+die twee renames heel even. Is er niets gewijzigd, dan wordt het doel niet aangeraakt.
+
+fetch_agents.py bevat dezelfde logica, omdat dat script standalone gedistribueerd wordt.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+
+SYNC_IGNORE = {"__pycache__"}
+
+
+@dataclass
+class SyncResult:
+    """Aantallen bestanden van één sync."""
+
+    copied: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.copied or self.deleted)
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def list_tree(root: Path) -> dict[str, os.stat_result]:
+    """Alle bestanden onder root (relatief pad -> stat), zonder SYNC_IGNORE mappen."""
+    files: dict[str, os.stat_result] = {}
+    if not root.is_dir():
+        return files
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [name for name in dirnames if name not in SYNC_IGNORE]
+        for name in filenames:
+            path = Path(dirpath) / name
+            files[path.relative_to(root).as_posix()] = path.stat()
+    return files
+
+
+def same_file(src: Path, dest: Path, src_stat: os.stat_result, dest_stat: os.stat_result) -> bool:
+    """Zelfde inhoud: grootte en mtime gelijk, of bij gelijke grootte dezelfde hash."""
+    if src_stat.st_size != dest_stat.st_size:
+        return False
+    if src_stat.st_mtime_ns == dest_stat.st_mtime_ns:
+        return True
+    return file_sha256(src) == file_sha256(dest)
+
+
+def _swap_dir(staging: Path, dest: Path) -> None:
+    """Zet staging op de plek van dest met twee renames (dest -> .old, staging -> dest).
+
+    Niet atomisch: tussen de twee renames bestaat dest heel even niet. Mislukt de
+    tweede rename, dan wordt het oude dest teruggezet. Het oude dest wordt pas na
+    de swap verwijderd.
+    """
+    if not dest.exists():
+        os.rename(staging, dest)
+        return
+    old = dest.parent / f".{dest.name}.old-{os.getpid()}"
+    if old.exists():
+        shutil.rmtree(old)
+    os.rename(dest, old)
+    try:
+        os.rename(staging, dest)
+    except OSError:
+        os.rename(old, dest)
+        raise
+    if old.is_dir():
+        shutil.rmtree(old, ignore_errors=True)
+    else:
+        old.unlink()
+
+
+def sync_tree(src: Path, dest: Path) -> SyncResult:
+    """Maak dest gelijk aan src; alleen gewijzigde bestanden worden gekopieerd.
+
+    Args:
+        src: Bronmap.
+        dest: Doelmap (wordt aangemaakt als hij niet bestaat).
+
+    Returns:
+        SyncResult met gekopieerde, ongewijzigde en verwijderde bestanden.
+
+    Raises:
+        OSError: Als kopiëren of de swap mislukt; dest is dan het oude dest.
+    """
+    src_files = list_tree(src)
+    dest_files = list_tree(dest)
+    result = SyncResult()
+    changed = set()
+    for rel, src_stat in src_files.items():
+        dest_stat = dest_files.get(rel)
+        if dest_stat is not None and same_file(src / rel, dest / rel, src_stat, dest_stat):
+            result.unchanged += 1
+        else:
+            changed.add(rel)
+    result.copied = len(changed)
+    result.deleted = len(dest_files.keys() - src_files.keys())
+    if not result.changed and dest.is_dir():
+        return result
+
+    staging = dest.parent / f".{dest.name}.sync-{os.getpid()}"
+    if staging.exists():
+        shutil.rmtree(staging)
+    try:
+        for dirpath, dirnames, _ in os.walk(src):
+            dirnames[:] = [name for name in dirnames if name not in SYNC_IGNORE]
+            (staging / Path(dirpath).relative_to(src)).mkdir(parents=True, exist_ok=True)
+        for rel in src_files:
+            if rel in changed:
+                shutil.copy2(src / rel, staging / rel)
+                continue
+            try:
+                os.link(dest / rel, staging / rel)
+            except OSError:
+                shutil.copy2(dest / rel, staging / rel)
+        _swap_dir(staging, dest)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    return result
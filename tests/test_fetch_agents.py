@@ -0,0 +1,179 @@
+"""Tests voor exports/fetch_agents.py tegen een lokale bare repo als agent-services stand-in.
+
+Draaien vanuit de repo root:
+    python -m unittest discover tests
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+FETCH_AGENTS = REPO_ROOT / "exports" / "fetch_agents.py"
+GIT = ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", "-c", "init.defaultBranch=main"]
+
+
+def _load_fetch_agents():
+    spec = importlib.util.spec_from_file_location("fetch_agents", FETCH_AGENTS)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module  # dataclasses zoeken hun module op
+    spec.loader.exec_module(module)
+    return module
+
+
+def _git(*args: str, cwd: Path | None = None) -> str:
+    result = subprocess.run([*GIT, *args], cwd=cwd, capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+@unittest.skipUnless(shutil.which("git"), "git is niet beschikbaar")
+class FetchAgentsTest(unittest.TestCase):
+    """Publiceert agents in een werk-repo, pusht naar een bare remote en fetcht in workspaces."""
+
+    def setUp(self) -> None:
+        self.root = Path(tempfile.mkdtemp(prefix="fetch-agents-test-"))
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        self.src = self.root / "src"
+        self.remote = self.root / "remote.git"
+        self.mirror = self.root / "mirror.git"
+
+        (self.src / "charters").mkdir(parents=True)
+        (self.src / "prompts").mkdir()
+        (self.src / "scripts" / "runners" / "alpha").mkdir(parents=True)
+        (self.src / "exports").mkdir()
+        for agent in ("alpha", "beta"):
+            (self.src / "charters" / f"charter.{agent}.md").write_text(f"# charter {agent}\n", encoding="utf-8")
+            for werkwoord in ("schrijf", "lees"):
+                (self.src / "prompts" / f"{agent}-{werkwoord}.prompt.md").write_text(
+                    f"prompt {agent} {werkwoord}\n", encoding="utf-8"
+                )
+        (self.src / "scripts" / "runners" / "alpha.py").write_text("def main():\n    return 0\n", encoding="utf-8")
+        (self.src / "scripts" / "runners" / "alpha" / "__init__.py").write_text("", encoding="utf-8")
+        (self.src / "scripts" / "runners" / "alpha" / "core.py").write_text("X = 1\n", encoding="utf-8")
+        shutil.copy2(FETCH_AGENTS, self.src / "exports" / "fetch_agents.py")
+
+        _git("init", "-q", str(self.src))
+        self._publish("init")
+        _git("clone", "-q", "--bare", str(self.src), str(self.remote))
+
+    def _publish(self, message: str) -> None:
+        """Schrijf het manifest met hashes per bestand (zoals agent-curator) en commit."""
+        agents = []
+        for agent, runners in (("alpha", 1), ("beta", 0)):
+            files = [self.src / "charters" / f"charter.{agent}.md"]
+            files += sorted((self.src / "prompts").glob(f"{agent}-*.prompt.md"))
+            if runners:
+                files.append(self.src / "scripts" / "runners" / f"{agent}.py")
+                files += sorted(p for p in (self.src / "scripts" / "runners" / agent).rglob("*") if p.is_file())
+            agents.append({
+                "naam": agent,
+                "valueStream": "kennispublicatie",
+                "aantalPrompts": 2,
+                "aantalRunners": runners,
+                "bestanden": [
+                    {
+                        "pad": path.relative_to(self.src).as_posix(),
+                        "sha256": hashlib.sha256(path.read_bytes()).hexdigest(),
+                        "grootte": path.stat().st_size,
+                    }
+                    for path in files
+                ],
+            })
+        digest = hashlib.sha256(json.dumps(agents, sort_keys=True).encode("utf-8")).hexdigest()[:5]
+        manifest = {
+            "publicatiedatum": "2026-10-17",
+            "digest": digest,
+            "agents": agents,
+            "locaties": {
+                "charters": "charters/charter.<agent-naam>.md",
+                "prompts": "prompts/<agent-naam>-<werkwoord>.prompt.md",
+                "runners": "scripts/runners/<agent-naam>",
+            },
+        }
+        (self.src / "agents-publicatie.json").write_text(json.dumps(manifest, indent=1), encoding="utf-8")
+        _git("add", "-A", cwd=self.src)
+        _git("commit", "-q", "-m", message, cwd=self.src)
+
+    def _push(self) -> None:
+        _git("push", "-q", str(self.remote), "HEAD:main", cwd=self.src)
+
+    def _workspace(self, name: str) -> Path:
+        workspace = self.root / name
+        workspace.mkdir(exist_ok=True)
+        return workspace
+
+    def _fetch(self, workspace: Path) -> str:
+        result = subprocess.run(
+            [
+                sys.executable, str(FETCH_AGENTS), "kennispublicatie",
+                "--source-repo", str(self.remote),
+                "--mirror", str(self.mirror),
+            ],
+            cwd=workspace,
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+        return result.stdout
+
+    def test_mirror_is_reused_and_checkouts_survive_mirror_gc(self) -> None:
+        fetch_agents = _load_fetch_agents()
+        first = fetch_agents.fetch_repo(str(self.remote), self._workspace("ws1"), self.mirror)
+        objects = sorted(p.name for p in (self.mirror / "objects" / "pack").iterdir())
+
+        second = fetch_agents.fetch_repo(str(self.remote), self._workspace("ws2"), self.mirror)
+        self.assertEqual(sorted(p.name for p in (self.mirror / "objects" / "pack").iterdir()), objects)
+        for checkout in (first, second):
+            self.assertFalse((checkout / ".git" / "objects" / "info" / "alternates").exists())
+            self.assertEqual(_git("rev-parse", "--is-shallow-repository", cwd=checkout), "true")
+
+        # Geschiedenis herschrijven en de mirror opruimen mag bestaande checkouts niet raken
+        _git("commit", "-q", "--amend", "-m", "rewritten", cwd=self.src)
+        _git("push", "-q", "--force", str(self.remote), "HEAD:main", cwd=self.src)
+        fetch_agents.update_mirror(str(self.remote), self.mirror)
+        _git("--git-dir", str(self.mirror), "reflog", "expire", "--expire=now", "--all")
+        _git("--git-dir", str(self.mirror), "gc", "-q", "--prune=now")
+        _git("fsck", "--no-dangling", cwd=first)
+
+    def test_unchanged_publication_short_circuits(self) -> None:
+        workspace = self._workspace("ws")
+        self.assertIn("[SUCCESS] Agents fetched", self._fetch(workspace))
+
+        self.assertIn("Geen wijzigingen sinds vorige fetch", self._fetch(workspace))
+
+        # Een lokaal gewijzigd bestand maakt de short-circuit ongeldig
+        (workspace / ".github" / "prompts" / "alpha-lees.prompt.md").write_text("lokaal\n", encoding="utf-8")
+        output = self._fetch(workspace)
+        self.assertNotIn("Geen wijzigingen sinds vorige fetch", output)
+        self.assertEqual(
+            (workspace / ".github" / "prompts" / "alpha-lees.prompt.md").read_text(encoding="utf-8"),
+            "prompt alpha lees\n",
+        )
+
+    def test_delta_install_copies_only_changed_files(self) -> None:
+        workspace = self._workspace("ws")
+        self.assertIn("Files copied -> new: 6, updated: 0, unchanged: 0", self._fetch(workspace))
+
+        (self.src / "prompts" / "beta-schrijf.prompt.md").write_text("prompt beta schrijf v2\n", encoding="utf-8")
+        self._publish("beta v2")
+        self._push()
+
+        output = self._fetch(workspace)
+        self.assertIn("Files copied -> new: 0, updated: 1, unchanged: 5", output)
+        self.assertIn("Runner modules unchanged: 1", output)
+        self.assertEqual(
+            (workspace / ".github" / "prompts" / "beta-schrijf.prompt.md").read_text(encoding="utf-8"),
+            "prompt beta schrijf v2\n",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()